@@ -1,17 +1,26 @@
 import os
 import glob
-from typing import Dict, List, Tuple
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional
 
+import numpy as np
 import pandas as pd
 
 
+_YEAR_RE = re.compile(r"_(\d{4})\.csv$")
+
+# Rows per chunk when streaming yearly CSVs (C engine) / bytes per block (pyarrow)
+_CSV_CHUNKSIZE = 500_000
+_ARROW_BLOCK_SIZE = 16 << 20
+
+
 def _year_from_filename(path: str) -> int:
     """Extract year from filename like weather_data_stn0_1970.csv."""
-    base = os.path.basename(path)
-    for part in base.replace(".csv", "").split("_"):
-        if part.isdigit() and len(part) == 4:
-            return int(part)
-    raise ValueError(f"연도를 파일명에서 찾을 수 없습니다: {path}")
+    m = _YEAR_RE.search(path)
+    if not m:
+        raise ValueError(f"연도를 파일명에서 찾을 수 없습니다: {path}")
+    return int(m.group(1))
 
 
 def _load_station_info(repo_root: str) -> pd.DataFrame:
@@ -22,61 +31,128 @@ def _load_station_info(repo_root: str) -> pd.DataFrame:
     return df[["STN_ID", "LAW_ID", "LAW_NM"]]
 
 
+def _station_lookup(station_info: pd.DataFrame) -> pd.DataFrame:
+    """Index station_info by STN once so per-year/per-list joins reuse the same index.
+
+    Duplicate STN_ID rows (e.g. relocated stations) are kept, so a join yields one
+    row per match exactly like the former left merge.
+    """
+    if station_info.index.name == "STN":
+        return station_info
+    return station_info.rename(columns={"STN_ID": "STN"}).set_index("STN")[["LAW_ID", "LAW_NM"]]
+
+
+def _iter_tm_stn_chunks(csv_path: str, chunksize: int) -> Iterator[pd.DataFrame]:
+    """Stream only the TM/STN columns (the only ones the analysis uses) in chunks.
+
+    Uses pyarrow's streaming CSV reader when pyarrow is installed (columns read as
+    strings and coerced below), otherwise the default C engine with chunksize.
+    """
+    header = pd.read_csv(csv_path, nrows=0).columns
+    usecols = [c for c in ("TM", "STN") if c in header]
+    if not usecols:
+        return
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+    except ImportError:
+        yield from pd.read_csv(csv_path, usecols=usecols, chunksize=chunksize)
+        return
+    reader = pa_csv.open_csv(
+        csv_path,
+        read_options=pa_csv.ReadOptions(block_size=_ARROW_BLOCK_SIZE),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types={c: pa.string() for c in usecols},
+        ),
+    )
+    for batch in reader:
+        yield batch.to_pandas()
+
+
 def _expected_dates(year: int) -> pd.DatetimeIndex:
     return pd.date_range(f"{year}-01-01", f"{year}-12-31", freq="D")
 
 
-def analyze_year(csv_path: str, station_info: pd.DataFrame) -> Dict:
-    """Analyze a single year's CSV and return metrics and details."""
-    year = _year_from_filename(csv_path)
-    df = pd.read_csv(csv_path)
+def analyze_year(csv_path: str, station_info: pd.DataFrame, chunksize: int = _CSV_CHUNKSIZE) -> Dict:
+    """Analyze a single year's CSV and return metrics and details.
 
-    # Basic columns we expect: TM (YYYYMMDD), STN
-    # Parse TM safely
-    tm = pd.to_datetime(pd.to_numeric(df.get("TM", pd.Series()), errors="coerce").astype("Int64"), format="%Y%m%d", errors="coerce")
-    df["TM_dt"] = tm
+    The file is streamed in chunks; only per-(STN, date) counts and out-of-range rows
+    are kept, so memory is bounded by stations x days rather than by file size.
+    """
+    year = _year_from_filename(csv_path)
+    exp_start, exp_end = pd.Timestamp(f"{year}-01-01"), pd.Timestamp(f"{year}-12-31")
 
-    # Clean STN to Int64
-    df["STN_clean"] = pd.to_numeric(df.get("STN", pd.Series()), errors="coerce").astype("Int64")
+    pair_counts: List[pd.Series] = []
+    out_of_range_parts: List[pd.DataFrame] = []
+    for chunk in _iter_tm_stn_chunks(csv_path, chunksize):
+        # Basic columns we expect: TM (YYYYMMDD), STN
+        # Parse TM safely
+        missing_col = pd.Series(np.nan, index=chunk.index)
+        tm = pd.to_datetime(pd.to_numeric(chunk.get("TM", missing_col), errors="coerce").astype("Int64"), format="%Y%m%d", errors="coerce")
+        # Clean STN to Int64
+        stn = pd.to_numeric(chunk.get("STN", missing_col), errors="coerce").astype("Int64")
+
+        # Out-of-range dates
+        oor = tm.notna() & ((tm < exp_start) | (tm > exp_end))
+        if oor.any():
+            out_of_range_parts.append(pd.DataFrame({"STN_clean": stn[oor], "TM_dt": tm[oor]}))
+
+        # Row counts per (STN, TM) pair (duplicates = pairs seen more than once)
+        valid = stn.notna() & tm.notna()
+        if valid.any():
+            pairs = pd.DataFrame({"STN_clean": stn[valid], "TM_dt": tm[valid]})
+            pair_counts.append(pairs.groupby(["STN_clean", "TM_dt"], sort=False).size())
+
+    if pair_counts:
+        counts = pd.concat(pair_counts)
+        if len(pair_counts) > 1:
+            counts = counts.groupby(level=["STN_clean", "TM_dt"], sort=False).sum()
+    else:
+        counts = pd.Series(
+            [], dtype=np.int64,
+            index=pd.MultiIndex.from_arrays(
+                [pd.array([], dtype="Int64"), pd.DatetimeIndex([])], names=["STN_clean", "TM_dt"]
+            ),
+        )
 
     # Duplicates on (STN, TM)
-    dup_mask = df.duplicated(subset=["STN_clean", "TM_dt"], keep=False)
-    dup_df = df.loc[dup_mask, ["STN_clean", "TM_dt"]].dropna().drop_duplicates()
+    dup_df = counts[counts > 1].index.to_frame(index=False)
 
     # Out-of-range dates
-    exp_start, exp_end = pd.Timestamp(f"{year}-01-01"), pd.Timestamp(f"{year}-12-31")
-    out_of_range_df = df.loc[df["TM_dt"].notna() & ((df["TM_dt"] < exp_start) | (df["TM_dt"] > exp_end)), ["STN_clean", "TM_dt"]]
+    if out_of_range_parts:
+        out_of_range_df = pd.concat(out_of_range_parts, ignore_index=True)
+    else:
+        out_of_range_df = pd.DataFrame({"STN_clean": pd.array([], dtype="Int64"), "TM_dt": pd.DatetimeIndex([])})
 
     # Expected complete date set
     expected = _expected_dates(year)
 
     # Per-station completeness
-    per_stn = (
-        df.dropna(subset=["STN_clean", "TM_dt"])
-        .groupby("STN_clean")["TM_dt"].agg(["nunique"]).rename(columns={"nunique": "days_present"})
+    # days_present = number of distinct (STN, date) pairs per station, via bincount
+    observed = counts.index
+    stn_codes, stn_values = pd.factorize(observed.get_level_values("STN_clean"), sort=True)
+    days_present = np.bincount(stn_codes, minlength=len(stn_values)).astype(np.int64)
+    per_stn = pd.DataFrame(
+        {"days_present": days_present},
+        index=pd.Index(stn_values, name="STN_clean"),
     )
     per_stn["days_expected"] = len(expected)
     per_stn["days_missing"] = per_stn["days_expected"] - per_stn["days_present"]
 
     # Missing dates list per station (compact form: first 10 only for report)
-    missing_examples: List[Tuple[int, int]] = []
-    for stn_id, group in df.dropna(subset=["STN_clean", "TM_dt"]).groupby("STN_clean"):
-        present = pd.Series(True, index=group["TM_dt"].unique())
-        missing = expected.difference(present.index)
-        if len(missing) > 0:
-            # store count and first few examples
-            per_stn.loc[stn_id, "missing_sample"] = ", ".join(missing.astype(str)[:10]) + (" ..." if len(missing) > 10 else "")
-        else:
-            per_stn.loc[stn_id, "missing_sample"] = ""
+    # All (STN, date) pairs minus observed pairs in a single set-difference, then one groupby
+    full = pd.MultiIndex.from_product([per_stn.index, expected])
+    missing = full.difference(observed).set_names(["STN", "TM"]).to_frame(index=False)
+    samples = missing.groupby("STN")["TM"].agg(
+        lambda s: ", ".join(s.head(10).astype(str)) + (" ..." if len(s) > 10 else "")
+    )
+    per_stn["missing_sample"] = samples.reindex(per_stn.index).fillna("").to_numpy(dtype=object)
 
     # Merge station info
     per_stn = per_stn.reset_index().rename(columns={"STN_clean": "STN"})
     if not station_info.empty:
-        per_stn = per_stn.merge(
-            station_info.rename(columns={"STN_ID": "STN"}),
-            on="STN",
-            how="left",
-        )
+        per_stn = per_stn.join(_station_lookup(station_info), on="STN")
 
     # Station set
     stations = set(per_stn["STN"].dropna().astype(int).tolist())
@@ -116,23 +192,22 @@ def year_over_year_changes(analyses: List[Dict]) -> List[Dict]:
 
 def _md_table(df: pd.DataFrame, max_rows: int = 30) -> str:
     """Render a simple Markdown table without external deps (no tabulate)."""
-    df_out = df.copy()
-    if len(df_out) > max_rows:
-        df_out = df_out.head(max_rows)
+    df_out = df.head(max_rows)
     cols = list(map(str, df_out.columns))
     # Header
     lines = ["| " + " | ".join(cols) + " |",
              "| " + " | ".join(["---"] * len(cols)) + " |"]
-    # Rows
-    for _, row in df_out.iterrows():
-        vals = ["" if pd.isna(v) else str(v) for v in row.tolist()]
-        lines.append("| " + " | ".join(vals) + " |")
+    # Rows: convert once to an object array and stringify cells without per-row Series
+    arr = df_out.to_numpy(dtype=object)
+    arr = np.where(pd.isna(arr), "", arr.astype(str))
+    lines.extend("| " + " | ".join(row) + " |" for row in arr)
     return "\n".join(lines)
 
 
 def write_reports(output_dir: str, analyses: List[Dict], station_info: pd.DataFrame) -> List[str]:
     os.makedirs(output_dir, exist_ok=True)
     written: List[str] = []
+    stn_info = _station_lookup(station_info) if not station_info.empty else None
 
     # Summary report
     rows = []
@@ -159,40 +234,44 @@ def write_reports(output_dir: str, analyses: List[Dict], station_info: pd.DataFr
     yoy_df = pd.DataFrame(yoy_rows)
 
     summary_path = os.path.join(output_dir, "report_summary.md")
+    parts: List[str] = []
+    parts.append(f"# KMA 전처리 데이터 — 요약\n\n")
+    parts.append("## 연도별 지표\n\n")
+    if not summary_df.empty:
+        parts.append(_md_table(summary_df, max_rows=1000))
+    else:
+        parts.append("(데이터 없음)\n")
+    parts.append("\n\n## 연도 간 지점 변화\n\n")
+    if not yoy_df.empty:
+        parts.append(_md_table(yoy_df, max_rows=1000))
+    else:
+        parts.append("(데이터 없음)\n")
+
+    # Detailed added/removed listing
+    parts.append("\n\n### 상세: 연도별 추가/제거 지점\n\n")
+    for item in yoy:
+        year = item["year"]
+        added = item["added"]
+        removed = item["removed"]
+        parts.append(f"#### {year}\n\n")
+        if added:
+            added_df = pd.DataFrame({"STN": added})
+            if stn_info is not None:
+                added_df = added_df.join(stn_info, on="STN")
+            parts.append("추가된 지점\n\n")
+            parts.append(_md_table(added_df, max_rows=200))
+            parts.append("\n\n")
+        if removed:
+            removed_df = pd.DataFrame({"STN": removed})
+            if stn_info is not None:
+                removed_df = removed_df.join(stn_info, on="STN")
+            parts.append("제거된 지점\n\n")
+            parts.append(_md_table(removed_df, max_rows=200))
+            parts.append("\n\n")
+
+    # 보고서 전체를 한 번에 기록
     with open(summary_path, "w", encoding="utf-8") as f:
-        f.write(f"# KMA 전처리 데이터 — 요약\n\n")
-        f.write("## 연도별 지표\n\n")
-        if not summary_df.empty:
-            f.write(_md_table(summary_df, max_rows=1000))
-        else:
-            f.write("(데이터 없음)\n")
-        f.write("\n\n## 연도 간 지점 변화\n\n")
-        if not yoy_df.empty:
-            f.write(_md_table(yoy_df, max_rows=1000))
-        else:
-            f.write("(데이터 없음)\n")
-
-        # Detailed added/removed listing
-        f.write("\n\n### 상세: 연도별 추가/제거 지점\n\n")
-        for item in yoy:
-            year = item["year"]
-            added = item["added"]
-            removed = item["removed"]
-            f.write(f"#### {year}\n\n")
-            if added:
-                added_df = pd.DataFrame({"STN": added})
-                if not station_info.empty:
-                    added_df = added_df.merge(station_info.rename(columns={"STN_ID": "STN"}), on="STN", how="left")
-                f.write("추가된 지점\n\n")
-                f.write(_md_table(added_df, max_rows=200))
-                f.write("\n\n")
-            if removed:
-                removed_df = pd.DataFrame({"STN": removed})
-                if not station_info.empty:
-                    removed_df = removed_df.merge(station_info.rename(columns={"STN_ID": "STN"}), on="STN", how="left")
-                f.write("제거된 지점\n\n")
-                f.write(_md_table(removed_df, max_rows=200))
-                f.write("\n\n")
+        f.write("".join(parts))
     written.append(summary_path)
 
     # Per-year reports
@@ -220,52 +299,70 @@ def write_reports(output_dir: str, analyses: List[Dict], station_info: pd.DataFr
         out_of_range = a["details"]["out_of_range"].rename(columns={"STN_clean": "STN"})
 
         year_path = os.path.join(output_dir, f"report_{year}.md")
+        parts = []
+        parts.append(f"# {year}년 — 데이터 품질 및 커버리지\n\n")
+        m = a["metrics"]
+        parts.append("## 요약\n\n")
+        parts.append(
+            f"- 지점 수: {m['station_count']}\n\n"
+            f"- 전 기간 커버리지 완전 지점 수: {m['full_coverage_station_count']}\n\n"
+            f"- 결측 존재 지점 수: {m['any_missing_station_count']}\n\n"
+            f"- 중복 (STN, TM) 레코드: {m['duplicate_records']}\n\n"
+            f"- 범위 밖 날짜 레코드: {m['out_of_range_records']}\n\n"
+        )
+
+        parts.append("## 지점별 커버리지\n\n")
+        if not per_stn_display.empty:
+            parts.append(_md_table(per_stn_display, max_rows=2000))
+        else:
+            parts.append("(데이터 없음)\n")
+
+        parts.append("\n\n## 중복 레코드 (STN, TM)\n\n")
+        if not duplicates.empty:
+            parts.append(_md_table(duplicates.rename(columns={"TM_dt": "TM"}).rename(columns={"STN": "지점(STN)", "TM": "날짜(TM)"}), max_rows=100))
+        else:
+            parts.append("(없음)\n")
+
+        parts.append("\n\n## 범위 밖 날짜\n\n")
+        if not out_of_range.empty:
+            parts.append(_md_table(out_of_range.rename(columns={"TM_dt": "TM"}).rename(columns={"STN": "지점(STN)", "TM": "날짜(TM)"}), max_rows=100))
+        else:
+            parts.append("(없음)\n")
+
+        # 보고서 전체를 한 번에 기록
         with open(year_path, "w", encoding="utf-8") as f:
-            f.write(f"# {year}년 — 데이터 품질 및 커버리지\n\n")
-            m = a["metrics"]
-            f.write("## 요약\n\n")
-            f.write(
-                f"- 지점 수: {m['station_count']}\n\n"
-                f"- 전 기간 커버리지 완전 지점 수: {m['full_coverage_station_count']}\n\n"
-                f"- 결측 존재 지점 수: {m['any_missing_station_count']}\n\n"
-                f"- 중복 (STN, TM) 레코드: {m['duplicate_records']}\n\n"
-                f"- 범위 밖 날짜 레코드: {m['out_of_range_records']}\n\n"
-            )
-
-            f.write("## 지점별 커버리지\n\n")
-            if not per_stn_display.empty:
-                f.write(_md_table(per_stn_display, max_rows=2000))
-            else:
-                f.write("(데이터 없음)\n")
-
-            f.write("\n\n## 중복 레코드 (STN, TM)\n\n")
-            if not duplicates.empty:
-                f.write(_md_table(duplicates.rename(columns={"TM_dt": "TM"}).rename(columns={"STN": "지점(STN)", "TM": "날짜(TM)"}), max_rows=100))
-            else:
-                f.write("(없음)\n")
-
-            f.write("\n\n## 범위 밖 날짜\n\n")
-            if not out_of_range.empty:
-                f.write(_md_table(out_of_range.rename(columns={"TM_dt": "TM"}).rename(columns={"STN": "지점(STN)", "TM": "날짜(TM)"}), max_rows=100))
-            else:
-                f.write("(없음)\n")
+            f.write("".join(parts))
         written.append(year_path)
 
     return written
 
 
-def run_analysis(post_dir: str) -> List[str]:
-    """Scan post_process_data folder, analyze all yearly CSVs, write markdown reports, return paths."""
+def run_analysis(post_dir: str, max_workers: Optional[int] = None) -> List[str]:
+    """Scan post_process_data folder, analyze all yearly CSVs, write markdown reports, return paths.
+
+    Yearly CSVs are independent, so they are analyzed in parallel worker processes
+    (max_workers=None uses os.cpu_count(); max_workers=1 runs serially in-process).
+    """
     repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    station_info = _load_station_info(repo_root)
+    station_info = _station_lookup(_load_station_info(repo_root))
 
     csv_paths = sorted(glob.glob(os.path.join(post_dir, "weather_data_stn*_*.csv")))
     analyses: List[Dict] = []
-    for p in csv_paths:
-        try:
-            analyses.append(analyze_year(p, station_info))
-        except Exception as e:
-            print(f"경고: {p} 분석 중 오류 발생: {e}")
+    if max_workers == 1 or len(csv_paths) <= 1:
+        for p in csv_paths:
+            try:
+                analyses.append(analyze_year(p, station_info))
+            except Exception as e:
+                print(f"경고: {p} 분석 중 오류 발생: {e}")
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as ex:
+            futures = {ex.submit(analyze_year, p, station_info): p for p in csv_paths}
+            for fut in as_completed(futures):
+                try:
+                    analyses.append(fut.result())
+                except Exception as e:
+                    print(f"경고: {futures[fut]} 분석 중 오류 발생: {e}")
+        analyses.sort(key=lambda a: a["metrics"]["year"])
 
     if not analyses:
         print("분석할 CSV가 없습니다.")
@@ -4,7 +4,7 @@ import dotenv
 from datetime import datetime
 
 
-def download_station_info(inf_type="SFC", auth_key=None, save_dir=None):
+def download_station_info(inf_type="SFC", auth_key=None, save_dir=None, session=None):
     """
     기상청 지점 정보를 원본 그대로 다운로드
 
@@ -12,6 +12,7 @@ def download_station_info(inf_type="SFC", auth_key=None, save_dir=None):
     - inf_type: 지점 종류 (SFC, AWS, BUOY, RAWS)
     - auth_key: API 인증키
     - save_dir: 저장 디렉토리
+    - session: 재사용할 requests.Session (None이면 단발 요청)
 
     Returns:
     - str: 저장된 파일 경로
@@ -26,7 +27,7 @@ def download_station_info(inf_type="SFC", auth_key=None, save_dir=None):
     }
 
     print(f"지점 정보 다운로드 중... (종류: {inf_type})")
-    response = requests.get(BASE_URL, params=params, timeout=30)
+    response = (session or requests).get(BASE_URL, params=params, timeout=30)
 
     if response.status_code != 200:
         raise Exception(f"API 요청 실패: {response.status_code}")
@@ -72,22 +73,25 @@ def download_all_station_info(save_dir=None, auth_key=None):
 
     saved_files = []
 
-    for inf_type, description in station_types.items():
-        try:
-            print(f"\n{'=' * 80}")
-            print(f"{description} [{inf_type}]")
-            print('=' * 80)
-
-            file_path = download_station_info(
-                inf_type=inf_type,
-                auth_key=auth_key,
-                save_dir=save_dir
-            )
-
-            saved_files.append(file_path)
-
-        except Exception as e:
-            print(f"[ERROR] 오류 발생: {e}")
+    # 지점 종류별 요청이 같은 연결을 재사용하도록 세션 공유
+    with requests.Session() as session:
+        for inf_type, description in station_types.items():
+            try:
+                print(f"\n{'=' * 80}")
+                print(f"{description} [{inf_type}]")
+                print('=' * 80)
+
+                file_path = download_station_info(
+                    inf_type=inf_type,
+                    auth_key=auth_key,
+                    save_dir=save_dir,
+                    session=session,
+                )
+
+                saved_files.append(file_path)
+
+            except Exception as e:
+                print(f"[ERROR] 오류 발생: {e}")
 
     return saved_files
 
@@ -1,9 +1,10 @@
+import io
 import os
 import time
 import logging
 from datetime import datetime
-from itertools import dropwhile
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import List, Optional, TextIO, Union
 
 import pandas as pd
 
@@ -30,23 +31,59 @@ def ensure_dirs(base_data_dir: str) -> dict:
     return {"raw": raw_dir, "proc": proc_dir}
 
 
-def _iter_data_lines(fp: Iterable[str]) -> Iterable[str]:
-    """주석/빈 줄을 건너뛰고 실제 데이터 라인부터 반환합니다."""
-    return dropwhile(lambda s: s.lstrip().startswith("#") or not s.strip(), fp)
+@lru_cache(maxsize=1)
+def _load_stn_mapping(station_info_csv: str, mtime_ns: int) -> dict:
+    """지점정보 CSV에서 {STN_ID(int): LAW_ID(str)} 매핑을 만들어 캐시합니다.
 
+    연도별 처리마다 같은 파일을 다시 읽지 않도록 (경로, 수정시각) 기준으로 한 번만 읽습니다.
+    """
+    info_df = pd.read_csv(
+        station_info_csv,
+        dtype={"STN_ID": "Int64", "LAW_ID": str},
+    )
+    stn_ids = info_df["STN_ID"].dropna()
+    return dict(zip(stn_ids.astype(int), info_df.loc[stn_ids.index, "LAW_ID"]))
 
-def parse_weather_text_to_df(text: str, cols: Optional[List[str]] = None) -> pd.DataFrame:
+
+def parse_weather_text_to_df(text: Union[str, TextIO], cols: Optional[List[str]] = None) -> pd.DataFrame:
     """
-    도움말 섹션이 제거된 텍스트를 고정폭(FWF)으로 파싱하여 DataFrame으로 반환합니다.
+    일자료 텍스트(문자열 또는 열린 파일 객체)를 파싱하여 DataFrame으로 반환합니다.
+
+    일자료는 보통 컬럼 사이가 공백으로 구분되고 결측도 -9 등 값으로 표기되므로, 먼저 C 파서의
+    공백 구분(read_csv)으로 빠르게 읽습니다. 빈 필드 등으로 필드 수가 컬럼 수와 맞지 않는 줄이 있으면
+    공백 구분으로는 뒤쪽 컬럼이 밀리므로, 기존 고정폭(read_fwf) 파싱으로 다시 읽습니다.
+    `#`으로 시작하는 도움말/주석 라인("#7777END" 마커 포함)과 빈 줄은 건너뜁니다.
     """
     if cols is None:
         cols = WEATHER_DAILY_COLS
 
-    return pd.read_fwf(
-        pd.io.common.StringIO(text),
-        header=None,
-        names=cols,
-    )
+    start = None if isinstance(text, str) else text.tell()
+    try:
+        df = pd.read_csv(
+            io.StringIO(text) if isinstance(text, str) else text,
+            sep=r"\s+",
+            header=None,
+            names=cols,
+            comment="#",
+            engine="c",
+        )
+    except pd.errors.ParserError:
+        # 필드가 컬럼 수보다 많은 줄
+        df = None
+
+    # 필드가 모자란 줄은 마지막 컬럼이 비어 있음 → 고정폭으로 다시 파싱
+    if df is None or df[cols[-1]].isna().any():
+        if start is not None:
+            text.seek(start)
+            text = text.read()
+        return _parse_weather_text_fwf(text, cols)
+    return df
+
+
+def _parse_weather_text_fwf(text: str, cols: List[str]) -> pd.DataFrame:
+    """주석(#)/빈 줄을 제외한 데이터 라인을 고정폭(FWF)으로 파싱 (parse_weather_text_to_df의 대체 경로)"""
+    data_lines = [ln for ln in text.splitlines(keepends=True) if ln.strip() and not ln.lstrip().startswith("#")]
+    return pd.read_fwf(io.StringIO("".join(data_lines)), header=None, names=cols)
 
 
 def process_raw_txt_to_csv(input_txt_path: str, output_csv_path: str, cols: Optional[List[str]] = None) -> str:
@@ -57,16 +94,9 @@ def process_raw_txt_to_csv(input_txt_path: str, output_csv_path: str, cols: Opti
         cols = WEATHER_DAILY_COLS
 
     with open(input_txt_path, "r", encoding="utf-8") as f:
-        # 파일 시작 부분의 주석/빈줄은 건너뛰고, 이후 데이터 라인만 받는다
-        data_lines = list(_iter_data_lines(f))
-
-    # 일부 원본 파일의 맨 끝에 존재하는 "#7777END,...." 마커 라인을 제거한다
-    # (중간에 등장하더라도 제거)
-    data_lines = [ln for ln in data_lines if not ln.lstrip().startswith("#7777END")]
-
-    raw = "".join(data_lines)
-
-    df = parse_weather_text_to_df(raw, cols=cols)
+        # 파일 전체를 문자열로 읽어 두지 않고 파일 객체를 그대로 파서에 넘긴다
+        # (앞부분 도움말과 맨 끝의 "#7777END,...." 마커 라인은 주석으로 건너뜀)
+        df = parse_weather_text_to_df(f, cols=cols)
 
     # 후처리: STN(지점번호) 기준으로 행정구역 코드(LAW_ID) 매핑하여 컬럼 추가
     # 참고 파일: data/station_info_structured.csv (컬럼: STN_ID, LAW_ID, ...)
@@ -74,22 +104,13 @@ def process_raw_txt_to_csv(input_txt_path: str, output_csv_path: str, cols: Opti
         current_dir = os.path.dirname(os.path.abspath(__file__))
         station_info_csv = os.path.join(current_dir, "data", "station_info_structured.csv")
         if os.path.exists(station_info_csv):
-            info_df = pd.read_csv(
-                station_info_csv,
-                dtype={"STN_ID": "Int64", "LAW_ID": str},
-            )
+            # 매핑 딕셔너리 (키: int STN_ID, 값: str LAW_ID)
+            mapping = _load_stn_mapping(station_info_csv, os.stat(station_info_csv).st_mtime_ns)
 
             # STN을 안전하게 정수(Int64)로 변환 후 매핑
             stn_series = pd.to_numeric(df.get("STN"), errors="coerce").astype("Int64")
-            # 매핑 딕셔너리 (키: int STN_ID, 값: str LAW_ID)
-            mapping = {
-                int(k): v
-                for k, v in zip(
-                    info_df["STN_ID"].dropna().astype(int),
-                    info_df["LAW_ID"],
-                )
-            }
-            df["LAW_ID"] = stn_series.map(lambda x: mapping.get(int(x)) if pd.notna(x) else None)
+            # dict를 그대로 넘기면 행마다 파이썬 함수를 호출하지 않고 인덱스 조회로 매핑 (결측/미등록 지점은 NaN)
+            df["LAW_ID"] = stn_series.map(mapping)
     except Exception:
         # 매핑 실패 시에는 조용히 넘어가고, 원본 데이터만 저장
         pass
@@ -119,13 +140,17 @@ def download_year_txt(
     timeout: int = 150,
     max_retries: int = 3,
     retry_base_sleep: float = 10.0,
+    session=None,
 ) -> str:
     """
     특정 연도(YYYY)의 일자료를 도움말 포함 형태로 다운로드하여 raw_data 폴더에 저장합니다.
     실패 시 최대 max_retries회 재시도합니다 (exponential backoff).
+    session(requests.Session)을 넘기면 연결(keep-alive)을 재사용합니다.
     """
     import requests
 
+    http_get = session.get if session is not None else requests.get
+
     tm1 = f"{year}0101"
     tm2 = f"{year}1231"
     BASE_URL = "https://apihub.kma.go.kr/api/typ01/url/kma_sfcdd3.php"
@@ -145,7 +170,7 @@ def download_year_txt(
     last_err = None
     for attempt in range(1, max_retries + 1):
         try:
-            resp = requests.get(BASE_URL, params=params, timeout=timeout)
+            resp = http_get(BASE_URL, params=params, timeout=timeout)
             resp.raise_for_status()
             with open(raw_path, "w", encoding="utf-8") as f:
                 f.write(resp.text)
@@ -167,7 +192,7 @@ def process_year_file(base_data_dir: str, year: int, stn: str = "0") -> str:
 
 
 def download_and_process_year(
-    auth_key: str, base_data_dir: str, year: int, stn: str = "0", force: bool = False,
+    auth_key: str, base_data_dir: str, year: int, stn: str = "0", force: bool = False, session=None,
 ) -> dict | None:
     """다운로드 + 가공을 한 번에 수행하고 경로들을 반환합니다.
     이미 CSV가 존재하면 스킵하고 None을 반환합니다. force=True이면 강제 재처리합니다."""
@@ -175,7 +200,7 @@ def download_and_process_year(
     if not force and os.path.exists(paths["proc"]):
         print(f"  [SKIP] 이미 존재: {paths['proc']}")
         return None
-    raw = download_year_txt(auth_key=auth_key, base_data_dir=base_data_dir, year=year, stn=stn)
+    raw = download_year_txt(auth_key=auth_key, base_data_dir=base_data_dir, year=year, stn=stn, session=session)
     proc = process_year_file(base_data_dir=base_data_dir, year=year, stn=stn)
     return {"raw": raw, "proc": proc}
 
@@ -200,25 +225,29 @@ def run_year_range(
     start_year부터 end_year까지(포함) 연단위로 다운로드 후 post_process_data에 CSV로 저장합니다.
     실패한 연도는 오류 로그에 기록됩니다.
     """
+    import requests
+
     results = []
     failed = []
     error_log_path = _setup_error_log(base_data_dir)
 
-    for year in range(start_year, end_year + 1):
-        print(f"[연도 처리] {year} (stn={stn})")
-        try:
-            paths = download_and_process_year(auth_key, base_data_dir, year, stn)
-            if paths is None:
-                continue
-            print(f"  - RAW : {paths['raw']}")
-            print(f"  - CSV : {paths['proc']}")
-            results.append(paths)
-        except Exception as e:
-            print(f"  [FAIL] {year} 처리 실패: {e}")
-            failed.append({"year": year, "error": str(e)})
-
-        if year < end_year:
-            time.sleep(sleep_between)
+    # 연도마다 새 TCP/TLS 연결을 맺지 않도록 세션 하나를 전체 구간에서 재사용
+    with requests.Session() as session:
+        for year in range(start_year, end_year + 1):
+            print(f"[연도 처리] {year} (stn={stn})")
+            try:
+                paths = download_and_process_year(auth_key, base_data_dir, year, stn, session=session)
+                if paths is None:
+                    continue
+                print(f"  - RAW : {paths['raw']}")
+                print(f"  - CSV : {paths['proc']}")
+                results.append(paths)
+            except Exception as e:
+                print(f"  [FAIL] {year} 처리 실패: {e}")
+                failed.append({"year": year, "error": str(e)})
+
+            if year < end_year:
+                time.sleep(sleep_between)
 
     # 오류 로그 저장
     if failed:
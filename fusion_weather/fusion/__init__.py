@@ -6,7 +6,7 @@
 
 from .config import FusionConfig
 from .geocode import GridToHjdMapper, GridToBjdMapper, build_unified_mapping
-from .download import FusionDataDownloader
+from .download import FusionDataDownloader, enable_queue_logging
 from .aggregate import TimeAggregator, SpatialAggregator
 from .pipeline import FusionPipeline
 
@@ -16,6 +16,7 @@ __all__ = [
     'GridToBjdMapper',
     'build_unified_mapping',
     'FusionDataDownloader',
+    'enable_queue_logging',
     'TimeAggregator',
     'SpatialAggregator',
     'FusionPipeline',
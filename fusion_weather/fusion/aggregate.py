@@ -5,11 +5,17 @@
 - 공간 집계: 격자 → 행정동
 """
 
-from typing import Optional, List, Dict, Literal
+import io
+import os
+from typing import Optional, List, Dict, Literal, Tuple
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from scipy import sparse
 
-from .config import FusionConfig, DEFAULT_CONFIG
+from .config import FusionConfig, DEFAULT_CONFIG, hourly_columns
 
 
 class TimeAggregator:
@@ -39,45 +45,100 @@ class TimeAggregator:
         Returns:
             피벗된 DataFrame (grid_idx, date, t0001, t0102, ...)
         """
-        df = df.copy()
-        
-        # 컬럼명 생성
+        # 컬럼명 생성: 시간대별 컬럼명(8/24개)을 미리 만들어 두고 hour로 인덱싱
+        # (입력 df는 복사/수정하지 않고 로컬 배열만 사용)
+        hour_arr = df['hour'].to_numpy()
         if is_3hourly:
             # s0003, s0306, ..., s2124
-            df['col_name'] = df['hour'].apply(
-                lambda h: f"{col_prefix}{h:02d}{h+3:02d}"
-            )
+            lut = np.array(hourly_columns(col_prefix, 8))
+            idx = (hour_arr // 3).astype(np.intp)
         else:
             # t0001, t0102, ..., t2324
-            df['col_name'] = df['hour'].apply(
-                lambda h: f"{col_prefix}{h:02d}{(h+1) % 24:02d}"
-            )
-        
+            lut = np.array(hourly_columns(col_prefix, 24))
+            idx = hour_arr.astype(np.intp)
+        col_name = lut[idx]
+
         # 피벗
-        # 피벗 수행: 시간별 데이터를 컬럼으로 변환
-        # - index: 각 행을 고유하게 식별하는 키 컬럼 (grid_idx: 격자 인덱스, date: 날짜)
-        # - columns: 새로운 컬럼명이 될 값들 (col_name: 위에서 생성한 t0001, t0102 등)
+        # 피벗 수행: 시간별 데이터를 컬럼으로 변환 (집계 없이 reshape만 수행)
+        # - index: 각 행을 고유하게 식별하는 키 (grid_idx: 격자 인덱스, date: 날짜, col_name: t0001, t0102 등)
         # - values: 각 셀에 채워질 실제 값 (var_col: ta, rn_60m, sd_3hr 등의 관측값)
-        # - aggfunc='first': 동일한 (grid_idx, date, col_name) 조합이 중복 존재하면 첫 번째 값만 사용
+        # - 동일한 (grid_idx, date, col_name) 조합이 중복 존재하면 첫 번째 값만 사용
         #   (정상적인 데이터에서는 중복이 없어야 하지만, 만약의 경우 대비)
-        pivot_df = df.pivot_table(
-            index=[grid_col, 'date'],  # 행 인덱스: (격자번호, 날짜)
-            columns='col_name',  # 컬럼으로 펼칠 값: 시간대별 컬럼명
-            values=var_col,  # 채워질 값: 관측 변수
-            aggfunc='first',  # 중복 시 첫 번째 값 선택 (중복 방지용)
-        ).reset_index()
-        
-        # 컬럼 순서 정렬
+        # 값은 value_dtype(기본 float32), 격자 인덱스는 int32로 축소해 피벗/집계 메모리를 절반으로
+        value_arr = df[var_col].to_numpy()
+        value_dtype = getattr(self.config, 'value_dtype', None)
+        if value_dtype and value_arr.dtype.kind == 'f':
+            value_arr = value_arr.astype(value_dtype, copy=False)
+        grid_arr = df[grid_col].to_numpy()
+        if grid_arr.dtype.kind in 'iu' and (len(grid_arr) == 0 or grid_arr.max() <= np.iinfo(np.int32).max):
+            grid_arr = grid_arr.astype(np.int32, copy=False)
+
+        values = pd.Series(
+            value_arr,
+            index=pd.MultiIndex.from_arrays(
+                [grid_arr, df['date'].to_numpy(), col_name],
+                names=[grid_col, 'date', 'col_name'],
+            ),
+        )
+        if values.index.has_duplicates:
+            # 중복 키는 NaN이 아닌 첫 값 사용 (기존 pivot_table(aggfunc='first')와 동일)
+            values = values.groupby(level=[0, 1, 2], sort=False).first()
+        piv = values.unstack('col_name')
+        # 값이 전부 NaN인 행/시간대 컬럼은 제외 (기존 pivot_table(dropna=True) 동작 유지)
+        piv = piv.dropna(how='all').dropna(axis=1, how='all')
+
+        # 컬럼 순서 정렬 (존재하는 컬럼만 선택)
+        col_order = [c for c in lut if c in piv.columns]
+
+        return piv.reindex(columns=col_order).reset_index()
+
+    def hourly_matrix(
+        self,
+        grid_arr: np.ndarray,
+        hour_arr: np.ndarray,
+        value_arr: np.ndarray,
+        col_prefix: str,
+        is_3hourly: bool = False,
+    ) -> Optional[Tuple[np.ndarray, List[str]]]:
+        """raw 일별 캐시 배치(시간대 오름차순 × grid_idx 0..N-1)를 (격자 × 시간대) 2차원 배열로 변환
+
+        하루치(날짜 하나) grid_idx/hour/value 배열을 받아 피벗 없이 reshape만 하므로 복사가 없습니다.
+        배치가 다르면(정렬/누락/중복) None → 호출 측은 pivot_hourly_to_columns 사용.
+
+        Returns:
+            (values[grid, col], 시간대 컬럼명 리스트) 또는 None
+        """
+        n_rows = len(hour_arr)
+        if n_rows == 0 or len(grid_arr) != n_rows or len(value_arr) != n_rows:
+            return None
+
+        n_grid = int(np.count_nonzero(hour_arr == hour_arr[0]))
+        if n_grid == 0 or n_rows % n_grid:
+            return None
+        n_hours = n_rows // n_grid
+
+        hours = hour_arr.reshape(n_hours, n_grid)
+        first = hours[:, 0].astype(np.intp)
+        if not ((hours == hours[:, :1]).all() and (np.diff(first) > 0).all()):
+            return None
+        if not (grid_arr.reshape(n_hours, n_grid) == np.arange(n_grid)).all():
+            return None
+
         if is_3hourly:
-            col_order = [f"{col_prefix}{h*3:02d}{(h+1)*3:02d}" for h in range(8)]
+            lut = hourly_columns(col_prefix, 8)
+            idx = first // 3
         else:
-            col_order = [f"{col_prefix}{h:02d}{(h+1) % 24:02d}" for h in range(24)]
-        
-        # 존재하는 컬럼만 선택
-        existing_cols = [c for c in col_order if c in pivot_df.columns]
-        result_cols = [grid_col, 'date'] + existing_cols
-        
-        return pivot_df[result_cols]
+            lut = hourly_columns(col_prefix, 24)
+            idx = first
+        if (idx < 0).any() or (idx >= len(lut)).any() or (is_3hourly and len(np.unique(idx)) != len(idx)):
+            return None
+
+        value_dtype = getattr(self.config, 'value_dtype', None)
+        if value_dtype and value_arr.dtype.kind == 'f':
+            value_arr = value_arr.astype(value_dtype, copy=False)
+
+        cols = [lut[i] for i in idx]
+        return value_arr.reshape(n_hours, n_grid).T, cols
 
 
 class SpatialAggregator:
@@ -111,6 +172,115 @@ class SpatialAggregator:
         else:
             raise ValueError("매핑 테이블에서 지역 코드 컬럼(HJD_CD 또는 EMD_CD)을 찾을 수 없습니다.")
 
+        # grid_idx → 지역코드 LUT (merge 대신 numpy 인덱싱으로 조인)
+        self._code_lut: Optional[np.ndarray] = None
+        self._code_categories: Dict[str, pd.Index] = {}
+        self._build_code_lut(grid_col='grid_idx')
+        # merge 경로용 (grid_col + 지역코드) 키 테이블 캐시: {grid_col: DataFrame}
+        self._merge_keys: Dict[str, pd.DataFrame] = {}
+        # 격자 수별 (지역 × 격자) 희소 소속 행렬 캐시: {n_grid: (csr_matrix, 지역 코드 번호 배열)}
+        self._group_matrix: Dict[int, Tuple[sparse.csr_matrix, np.ndarray]] = {}
+
+    def _build_code_lut(self, grid_col: str) -> None:
+        """grid_idx가 0 이상의 정수이고 중복이 없으면 (grid_idx → 지역코드 번호) LUT를 생성
+
+        LUT[g, k] = id_cols[k]의 정렬된 코드 번호 (매핑 없음/NaN = -1).
+        조건을 만족하지 않으면 LUT 없이 기존 merge 경로를 사용합니다.
+        """
+        if grid_col not in self.grid_mapping.columns:
+            return
+        grid_ids = self.grid_mapping[grid_col]
+        if (
+            len(grid_ids) == 0
+            or not pd.api.types.is_integer_dtype(grid_ids)
+            or grid_ids.min() < 0
+            or grid_ids.duplicated().any()
+        ):
+            return
+
+        grid_arr = grid_ids.to_numpy(dtype=np.intp)
+        lut = np.full((int(grid_arr.max()) + 1, len(self.id_cols)), -1, dtype=np.int32)
+        for k, col in enumerate(self.id_cols):
+            values = self.grid_mapping[col]
+            if isinstance(values.dtype, pd.CategoricalDtype) and values.cat.categories.is_monotonic_increasing:
+                # 범주형(매핑 parquet 기본): 이미 정렬된 카테고리 코드를 그대로 사용
+                codes = values.cat.codes.to_numpy()
+                categories = pd.Index(np.asarray(values.cat.categories, dtype=object))
+            else:
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype(object)
+                # sort=True: 코드 번호 순서 = 코드 값 정렬 순서 (groupby 정렬 결과 유지)
+                codes, categories = pd.factorize(values, sort=True)
+            lut[grid_arr, k] = codes
+            self._code_categories[col] = categories
+        self._code_lut = lut
+
+    def _get_group_matrix(self, n_grid: int) -> Tuple[sparse.csr_matrix, np.ndarray]:
+        """격자 0..n_grid-1 → 지역 그룹 소속 행렬 (행 = 정렬된 지역 코드 조합, 값 = 1)"""
+        cached = self._group_matrix.get(n_grid)
+        if cached is None:
+            codes = np.full((n_grid, len(self.id_cols)), -1, dtype=np.int32)
+            n_lut = min(n_grid, len(self._code_lut))
+            codes[:n_lut] = self._code_lut[:n_lut]
+            grid_ids = np.flatnonzero((codes >= 0).all(axis=1))
+            # 코드 조합을 사전식 정렬 → groupby(sort=True)와 같은 지역 순서
+            group_codes, group_of = np.unique(codes[grid_ids], axis=0, return_inverse=True)
+            matrix = sparse.csr_matrix(
+                (np.ones(len(grid_ids)), (group_of.ravel(), grid_ids)),
+                shape=(len(group_codes), n_grid),
+            )
+            cached = (matrix, group_codes)
+            self._group_matrix[n_grid] = cached
+        return cached
+
+    def aggregate_hourly_matrix(
+        self,
+        values: np.ndarray,
+        value_cols: List[str],
+        date: str,
+    ) -> Optional[pd.DataFrame]:
+        """(격자 × 시간대) 배열을 지역 평균으로 바로 집계 (피벗 + aggregate_grid_to_region(mean) 융합)
+
+        희소 소속 행렬 M(지역 × 격자)으로 합계/유효값 개수를 한 번에 구해 평균을 계산합니다.
+        결과는 `pivot_hourly_to_columns` → `aggregate_grid_to_region(method='mean')`과 같습니다.
+        - 전부 결측인 시간대 컬럼 제외, 전부 결측인 격자는 지역 존재 여부 판단에서 제외
+        - 매핑이 LUT로 표현되지 않으면(격자 중복 등) None → 호출 측은 기존 경로 사용
+
+        Args:
+            values: (n_grid, len(value_cols)) 배열, 행 번호 = grid_idx
+            value_cols: 시간대 컬럼명
+            date: 날짜 값
+        """
+        if self._code_lut is None:
+            return None
+
+        n_grid = values.shape[0]
+        matrix, group_codes = self._get_group_matrix(n_grid)
+
+        observed = ~np.isnan(values)
+        keep_cols = observed.any(axis=0)
+        if not keep_cols.all():
+            values = values[:, keep_cols]
+            observed = observed[:, keep_cols]
+            value_cols = [c for c, keep in zip(value_cols, keep_cols) if keep]
+
+        sums = matrix @ np.where(observed, values, 0).astype(np.float64, copy=False)
+        counts = matrix @ observed.astype(np.float64)
+        # 값이 하나라도 있는 격자가 속한 지역만 출력 (피벗의 dropna(how='all') 이후 groupby와 동일)
+        present = (matrix @ observed.any(axis=1).astype(np.float64)) > 0
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums[present] / counts[present]
+        means = means.astype(values.dtype if values.dtype.kind == 'f' else np.float64, copy=False)
+
+        codes = group_codes[present]
+        result = pd.DataFrame({'date': np.full(len(codes), date, dtype=object)})
+        for k, col in enumerate(self.id_cols):
+            result[col] = self._code_categories[col].take(codes[:, k])
+        for j, col in enumerate(value_cols):
+            result[col] = means[:, j]
+        return result
+
     def aggregate_grid_to_region(
         self,
         df: pd.DataFrame,
@@ -131,16 +301,40 @@ class SpatialAggregator:
             지역별 집계된 DataFrame
         """
         # 매핑 조인
-        merge_cols = [grid_col] + self.id_cols
-        df_with_id = df.merge(
-            self.grid_mapping[merge_cols],
-            on=grid_col,
-            how='left',
+        use_lut = (
+            self._code_lut is not None
+            and grid_col == 'grid_idx'
+            and pd.api.types.is_integer_dtype(df[grid_col])
         )
+        if use_lut:
+            # LUT 인덱싱: 지역코드 대신 정수 코드 번호로 그룹핑 후 마지막에 코드 값으로 복원
+            grid_arr = df[grid_col].to_numpy(dtype=np.int64)
+            in_range = (grid_arr >= 0) & (grid_arr < len(self._code_lut))
+            codes = np.full((len(grid_arr), len(self.id_cols)), -1, dtype=np.int32)
+            codes[in_range] = self._code_lut[grid_arr[in_range]]
+
+            # 매핑 실패 행 제거 (해양 등) - 모든 id 컬럼이 있어야 유효
+            valid = (codes >= 0).all(axis=1)
+            df_with_id = df.loc[valid].assign(
+                **{col: codes[valid, k] for k, col in enumerate(self.id_cols)}
+            )
+        else:
+            if grid_col not in self._merge_keys:
+                keys = self.grid_mapping[[grid_col] + self.id_cols]
+                # 범주형 코드는 object로 풀어 groupby 정렬/출력 dtype을 기존(문자열)과 동일하게 유지
+                cat_cols = [c for c in self.id_cols if isinstance(keys[c].dtype, pd.CategoricalDtype)]
+                if cat_cols:
+                    keys = keys.astype({c: object for c in cat_cols})
+                self._merge_keys[grid_col] = keys
+            df_with_id = df.merge(
+                self._merge_keys[grid_col],
+                on=grid_col,
+                how='left',
+            )
 
-        # 매핑 실패 행 제거 (해양 등) - 모든 id 컬럼이 있어야 유효
-        for col in self.id_cols:
-            df_with_id = df_with_id[df_with_id[col].notna()]
+            # 매핑 실패 행 제거 (해양 등) - 모든 id 컬럼이 있어야 유효
+            for col in self.id_cols:
+                df_with_id = df_with_id[df_with_id[col].notna()]
 
         # 강수/적설 관련 컬럼의 NaN 처리 정책:
         # - sum 집계: NaN을 0으로 처리 (누적 합산 시 "관측 없음 = 0"으로 간주)
@@ -154,14 +348,16 @@ class SpatialAggregator:
         group_cols = (['date'] if 'date' in df.columns else []) + self.id_cols
 
         # 집계
-        if method == 'mean':
-            result = df_with_id.groupby(group_cols)[value_cols].mean().reset_index()
-        elif method == 'sum':
-            result = df_with_id.groupby(group_cols)[value_cols].sum().reset_index()
-        elif method == 'median':
-            result = df_with_id.groupby(group_cols)[value_cols].median().reset_index()
-        else:
+        # observed=True: 범주형 키여도 실제로 존재하는 그룹만 생성 (빈 그룹 카테시안 곱 방지)
+        # sort는 유지: 출력 CSV의 (date, 지역코드) 정렬 순서를 보장
+        if method not in ('mean', 'sum', 'median'):
             raise ValueError(f"Unknown method: {method}")
+        grouped = df_with_id.groupby(group_cols, observed=True)[value_cols]
+        result = getattr(grouped, method)().reset_index()
+
+        if use_lut:
+            for col in self.id_cols:
+                result[col] = self._code_categories[col].take(result[col].to_numpy())
 
         return result
 
@@ -171,6 +367,8 @@ class OutputFormatter:
     
     def __init__(self, config: Optional[FusionConfig] = None):
         self.config = config or DEFAULT_CONFIG
+        # 지역명 조회 테이블 캐시: {(id_col, nm_col): (grid_mapping, 코드→지역명 Series)}
+        self._name_lookup: Dict[Tuple[str, str], Tuple[pd.DataFrame, pd.Series]] = {}
     
     def merge_variables(
         self,
@@ -196,14 +394,13 @@ class OutputFormatter:
             id_cols = [col for col in ['HJD_CD', 'EMD_CD'] if col in first_df.columns]
             index_cols = ['date'] + id_cols if id_cols else ['date']
 
-        # 첫 번째 df를 기준으로 병합
-        result = None
-        for var_name, df in dfs.items():
-            if result is None:
-                result = df
-            else:
-                result = result.merge(df, on=index_cols, how='outer')
-        
+        # 공통 인덱스로 맞춘 뒤 한 번에 외부 조인 (변수 수만큼 merge를 반복하지 않음)
+        if len(dfs) == 1:
+            result = next(iter(dfs.values()))
+        else:
+            indexed = [df.set_index(index_cols) for df in dfs.values()]
+            result = pd.concat(indexed, axis=1, join='outer', copy=False).reset_index()
+
         # 컬럼 순서 정렬: date + t* + p* + s* + 지역코드(HJD_CD, EMD_CD 등)
         id_cols = [c for c in index_cols if c != 'date']
         sorted_cols = ['date'] if 'date' in index_cols else []
@@ -236,9 +433,21 @@ class OutputFormatter:
         id_col: str,
         nm_col: str,
     ) -> pd.DataFrame:
-        """지역명 컬럼 추가 (행정동/법정동 공용)"""
-        names = grid_mapping[[id_col, nm_col]].drop_duplicates()
-        return df.merge(names, on=id_col, how='left')
+        """지역명 컬럼 추가 (행정동/법정동 공용)
+
+        코드→지역명 조회 테이블은 같은 grid_mapping에 대해 한 번만 만들어 재사용합니다.
+        """
+        cached = self._name_lookup.get((id_col, nm_col))
+        if cached is None or cached[0] is not grid_mapping:
+            names = (
+                grid_mapping[[id_col, nm_col]]
+                .dropna(subset=[id_col])
+                .drop_duplicates(id_col)
+                .set_index(id_col)[nm_col]
+            )
+            cached = (grid_mapping, names)
+            self._name_lookup[(id_col, nm_col)] = cached
+        return df.assign(**{nm_col: cached[1].reindex(df[id_col]).to_numpy()})
     
     def format_date_column(
         self,
@@ -247,12 +456,225 @@ class OutputFormatter:
         format_str: str = '%Y-%m-%d',
     ) -> pd.DataFrame:
         """날짜 컬럼 포맷팅"""
-        df = df.copy()
         if date_col in df.columns:
+            # 얕은 복사 후 컬럼 교체: 입력 df는 그대로 두고 나머지 컬럼 데이터는 공유
+            df = df.copy(deep=False)
             df[date_col] = pd.to_datetime(df[date_col]).dt.strftime(format_str)
         return df
 
 
+def _csv_arrow_table(df: pd.DataFrame) -> Optional[pa.Table]:
+    """`to_csv`와 같은 값 표기로 기록할 수 있게 변환한 Arrow Table (지원하지 않는 컬럼이 있으면 None)
+
+    실수/불리언 컬럼은 pandas `to_csv`와 같이 NumPy 문자열 변환(`3.0`, `5.5277777` 등)을 거치고
+    결측은 빈 값으로 둡니다. 정수는 그대로, 문자열(object/category)은 문자열일 때만 사용합니다.
+    """
+    if len(df.columns) < 2:
+        # 컬럼 하나짜리 행의 빈 값은 pandas가 `""`로 기록하므로 pandas 경로 사용
+        return None
+    arrays = []
+    for _, col in df.items():
+        dtype = col.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            arr = pa.array(col)
+            if not pa.types.is_string(arr.type.value_type):
+                return None
+            arrays.append(arr.cast(arr.type.value_type))
+        elif not isinstance(dtype, np.dtype):
+            return None
+        elif dtype.kind in 'fb':
+            values = col.to_numpy()
+            arrays.append(pa.array(values.astype(str), mask=pd.isna(values) if dtype.kind == 'f' else None))
+        elif dtype.kind in 'iu':
+            arrays.append(pa.array(col.to_numpy()))
+        elif dtype.kind == 'O':
+            arr = pa.array(col.to_numpy(), from_pandas=True)
+            if not (pa.types.is_string(arr.type) or pa.types.is_null(arr.type)):
+                return None
+            arrays.append(arr)
+        else:
+            return None
+    return pa.Table.from_arrays(arrays, names=[str(c) for c in df.columns])
+
+
+def _write_csv_rows(df: pd.DataFrame, fh, header: bool = True) -> None:
+    """DataFrame을 바이너리 파일 핸들에 UTF-8 CSV로 이어 씀 (`to_csv(index=False)`와 같은 바이트)
+
+    값 문자열화는 `_csv_arrow_table`, 행 조립/기록은 pyarrow C++ CSV writer가 맡습니다.
+    구분자/따옴표/줄바꿈이 들어 있는 문자열 등 pyarrow로 같은 결과를 낼 수 없는 조각과,
+    줄바꿈이 `\n`이 아닌 플랫폼(Windows, `to_csv` 기본값 os.linesep)은 pandas `to_csv`로 기록합니다.
+    """
+    if header:
+        fh.write(df.head(0).to_csv(index=False, lineterminator=os.linesep).encode('utf-8'))
+    if len(df) == 0:
+        return
+    table = None
+    if os.linesep == '\n':
+        try:
+            table = _csv_arrow_table(df)
+            if table is not None:
+                sink = pa.BufferOutputStream()
+                pa_csv.write_csv(table, sink, pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            table = None
+    if table is None:
+        fh.write(df.to_csv(header=False, index=False, lineterminator=os.linesep).encode('utf-8'))
+        return
+    fh.write(sink.getvalue())
+
+
+def write_csv(df: pd.DataFrame, output_path: str, encoding: str = 'utf-8-sig') -> None:
+    """`df.to_csv(output_path, index=False, encoding=...)` 대신 쓰는 빠른 CSV 저장 (UTF-8/UTF-8-BOM만 지원)"""
+    with open(output_path, 'wb') as fh:
+        if encoding.lower().replace('_', '-') == 'utf-8-sig':
+            fh.write(b'\xef\xbb\xbf')
+        _write_csv_rows(df, fh)
+
+
+class StreamingCsvWriter:
+    """여러 DataFrame 조각을 메모리에 모아두지 않고 CSV 파일 하나에 바로 이어 씀
+
+    출력 컬럼은 생성 시 `columns`로 고정하고(None이면 첫 조각의 컬럼), 조각마다 이 순서로 맞춰
+    기록합니다. 조각에 없는 컬럼(여름철 적설, 전부 결측인 시간대 등)은 빈 값으로 채우고,
+    고정 컬럼에 없는 컬럼이 들어 있으면 ValueError. 최대 메모리는 조각 하나 수준입니다.
+    (UTF-8 계열 인코딩은 `_write_csv_rows`로 기록)
+
+    기록 중에는 `{output_path}.partial`에 쓰고, close()에서 출력 경로로 바꿉니다.
+    with 블록을 정상적으로 벗어나면 close(), 예외로 벗어나면 discard()를 호출합니다.
+
+    사용 예:
+        with StreamingCsvWriter(path, columns) as writer:
+            for df in parts:
+                writer.append(df)
+    """
+
+    def __init__(self, output_path: str, columns: Optional[List[str]] = None, encoding: str = 'utf-8-sig'):
+        self.output_path = output_path
+        self.columns: Optional[List[str]] = list(columns) if columns is not None else None
+        self.encoding = encoding
+        self.rows = 0
+        self._partial_path = output_path + '.partial'
+        self._fh = None
+
+    def append(self, df: Optional[pd.DataFrame]) -> None:
+        """조각 추가 (빈 DataFrame은 무시)"""
+        if df is None or len(df) == 0:
+            return
+        df = self._align(df)
+        if self._fh is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+            self._open(df)
+        self._write(df, header=self.rows == 0)
+        self.rows += len(df)
+
+    def _align(self, df: pd.DataFrame) -> pd.DataFrame:
+        """조각 컬럼을 고정 컬럼 순서에 맞춤"""
+        if self.columns is None:
+            self.columns = list(df.columns)
+            return df
+        if len(df.columns) == len(self.columns) and list(df.columns) == self.columns:
+            return df
+        extra = [c for c in df.columns if c not in set(self.columns)]
+        if extra:
+            raise ValueError(f"출력 컬럼에 없는 컬럼이 있습니다: {extra}")
+        return df.reindex(columns=self.columns)
+
+    def _open(self, first: pd.DataFrame) -> None:
+        encoding = self.encoding.lower().replace('_', '-')
+        if encoding in ('utf-8', 'utf-8-sig'):
+            self._fh = open(self._partial_path, 'wb')
+            if encoding == 'utf-8-sig':
+                self._fh.write(b'\xef\xbb\xbf')
+        else:
+            self._fh = open(self._partial_path, 'w', encoding=self.encoding, newline='')
+
+    def _write(self, df: pd.DataFrame, header: bool) -> None:
+        if isinstance(self._fh, io.TextIOBase):
+            df.to_csv(self._fh, header=header, index=False)
+        else:
+            _write_csv_rows(df, self._fh, header=header)
+
+    def _close_handle(self) -> None:
+        self._fh.close()
+
+    def close(self) -> Optional[str]:
+        """파일을 닫고 출력 경로로 확정. 기록한 조각이 없으면 None"""
+        if self._fh is None:
+            return None
+        try:
+            self._close_handle()
+        except BaseException:
+            self.discard()
+            raise
+        self._fh = None
+        os.replace(self._partial_path, self.output_path)
+        return self.output_path
+
+    def discard(self) -> None:
+        """기록 중인 파일을 확정하지 않고 삭제 (이미 close()한 결과 파일은 그대로)"""
+        if self._fh is None:
+            return
+        try:
+            self._close_handle()
+        except Exception:
+            pass
+        self._fh = None
+        try:
+            os.remove(self._partial_path)
+        except OSError:
+            pass
+
+    def __enter__(self) -> "StreamingCsvWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+
+class StreamingParquetWriter(StreamingCsvWriter):
+    """`StreamingCsvWriter`와 같되 Parquet 파일 하나로 기록 (조각마다 row group 하나)
+
+    스키마는 첫 조각을 고정 컬럼 순서로 맞춘 결과에서 정하고(문자열 컬럼은 string),
+    이후 조각은 이 스키마로 변환해 기록합니다.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        columns: Optional[List[str]] = None,
+        compression: Optional[str] = 'zstd',
+    ):
+        super().__init__(output_path, columns)
+        self.compression = compression
+        self._schema: Optional[pa.Schema] = None
+
+    def _open(self, first: pd.DataFrame) -> None:
+        # 첫 조각에서 전부 결측인 실수 컬럼(없어서 채운 컬럼 등)은 다른 실수 컬럼과 같은 타입으로
+        all_nan = {c for c in first.columns if first[c].dtype.kind == 'f' and first[c].isna().all()}
+        float_dtypes = [first[c].dtype for c in first.columns if first[c].dtype.kind == 'f' and c not in all_nan]
+        fill_dtype = np.result_type(*float_dtypes) if float_dtypes else np.dtype('float64')
+        fields = []
+        for col, dtype in first.dtypes.items():
+            if col in all_nan:
+                dtype = fill_dtype
+            if dtype == object:
+                # 코드/날짜 등 문자열 컬럼 (전부 결측인 조각이 있어도 타입이 흔들리지 않도록 고정)
+                fields.append(pa.field(col, pa.string()))
+            elif isinstance(dtype, np.dtype):
+                fields.append(pa.field(col, pa.from_numpy_dtype(dtype)))
+            else:
+                # category 등 pandas 확장 타입
+                fields.append(pa.Schema.from_pandas(first[[col]].head(0), preserve_index=False).field(col))
+        self._schema = pa.schema(fields)
+        self._fh = pq.ParquetWriter(self._partial_path, self._schema, compression=self.compression)
+
+    def _write(self, df: pd.DataFrame, header: bool) -> None:
+        self._fh.write_table(pa.Table.from_pandas(df, schema=self._schema, preserve_index=False))
+
+
 if __name__ == "__main__":
     # 테스트
     import numpy as np
@@ -4,7 +4,21 @@ Fusion Weather Information Configuration
 
 import os
 from dataclasses import dataclass, field
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
+
+
+@lru_cache(maxsize=None)
+def hourly_columns(prefix: str, hours: int) -> Tuple[str, ...]:
+    """Return hourly column names for a column prefix (cached per (prefix, hours))"""
+    if hours == 24:
+        # 1-hour intervals: t0001, t0102, ..., t2324
+        return tuple(f"{prefix}{h:02d}{(h+1) % 24:02d}" for h in range(24))
+    elif hours == 8:
+        # 3-hour intervals: s0003, s0306, ..., s2124
+        return tuple(f"{prefix}{h*3:02d}{(h+1)*3:02d}" for h in range(8))
+    else:
+        raise ValueError(f"Unsupported hours: {hours}")
 
 
 @dataclass
@@ -88,7 +102,10 @@ class FusionConfig:
         "public": "https://apihub.kma.go.kr/api/typ01",
     }
     api_type: str = "org"  # "org" (기관용) or "public" (일반)
-    api_sleep_seconds: float = 0.5  # API call interval
+    api_sleep_seconds: float = 0.5  # Pause after each API request (per in-flight slot)
+    # Max API requests in flight per downloader; each slot pauses api_sleep_seconds after its
+    # request before the next one starts. 1 = one request at a time (serial download).
+    api_max_in_flight: int = 1
 
     @property
     def api_base_url(self) -> str:
@@ -100,7 +117,58 @@ class FusionConfig:
     download_retry_attempts: int = 3  # Total number of attempts (= 1 initial request + retries)
     download_retry_initial_sleep_seconds: float = 10.0  # Wait time after first failure (seconds)
     download_retry_backoff: float = 2.0  # Retry wait time multiplier (exponential backoff)
+    # Each wait is stretched by a random factor in [1, 1 + jitter] so that hours/days that failed
+    # in the same outage window do not all retry at the same instant
+    download_retry_jitter: float = 0.5
+
+    # Download concurrency / HTTP configuration
+    # - Hours of one (date, variable) are fetched concurrently over a shared keep-alive session
+    # - Requests still go through the downloader's limiter (api_max_in_flight / api_sleep_seconds),
+    #   so these worker counts only add concurrency up to api_max_in_flight
+    # - http_retries: transport-level retries (connection errors, 429/5xx) done by urllib3 inside each attempt
+    download_workers: int = 4  # Concurrent hour downloads per (date, variable)
+    variable_workers: int = 3  # Variables of one date downloaded concurrently (ensure_day_cache)
+    # Days of process_month handled in parallel worker processes (1 = serial, in-process).
+    # Each worker process has its own limiter, so up to day_workers x api_max_in_flight
+    # requests can be in flight when days still need downloading.
+    day_workers: int = 1
+    http_retries: int = 2
+    http_retry_backoff: float = 1.0  # urllib3 backoff_factor (seconds)
+
+    # Files saved via download_hour_all_grid(save_dir=...) that already exist are reused
+    # without a network call; files smaller than skip_existing_min_bytes are treated as
+    # truncated and downloaded again.
+    skip_existing: bool = True
+    skip_existing_min_bytes: int = 1024
+    # Re-check those files against the server instead (takes priority over skip_existing):
+    # the ETag/Last-Modified stored in a .meta.json sidecar next to each file are sent as
+    # If-None-Match/If-Modified-Since, and a 304 reuses the file without downloading the body.
+    # Useful for catch-up reruns that should pick up late KMA revisions.
+    revalidate_existing: bool = False
     
+    # Processing configuration
+    # - Observed values are stored with 0.1 precision, so float32 is enough and halves
+    #   the memory/bandwidth of the pivoted (grid x hour) frames. None keeps the input dtype.
+    value_dtype: str = "float32"
+    # - Parquet codec for the raw day cache ({var}_{date}_parsed.parquet). The cache is
+    #   re-read by every B-stage run, so a compact codec pays off; None = uncompressed.
+    raw_cache_compression: Optional[str] = "zstd"
+    # - Codec level for raw_cache_compression (zstd 3 is a good size/speed trade-off for
+    #   float32 grids); None = codec default. Ignored for codecs without levels (snappy)
+    #   and when compression is None.
+    raw_cache_compression_level: Optional[int] = 3
+    # - File format of the month/year fusion tables (process_month / process_year):
+    #   "csv" (utf-8-sig, default) or "parquet" (zstd; smaller and much faster to re-read).
+    output_format: str = "csv"
+
+    # Grid-to-region mapping
+    # - Optional polygon simplification (degrees, EPSG:4326) before the point-in-polygon tests.
+    #   Boundary vertices far denser than the ~1 km grid spacing only add GEOS work;
+    #   0.0005 is about 50 m. None keeps the exact boundaries (default).
+    mapping_simplify_tolerance: Optional[float] = None
+    # - Threads for the point-in-polygon pass (Shapely 2 releases the GIL); None = CPU count
+    mapping_workers: Optional[int] = None
+
     # Variable configuration
     variables: Dict[str, Dict] = field(default_factory=lambda: {
         'ta': {
@@ -146,17 +214,7 @@ class FusionConfig:
     def get_hourly_columns(self, var_key: str) -> List[str]:
         """Return list of hourly column names for each variable"""
         var_info = self.variables[var_key]
-        prefix = var_info['col_prefix']
-        hours = var_info['hours']
-
-        if hours == 24:
-            # 1-hour intervals: t0001, t0102, ..., t2324
-            return [f"{prefix}{h:02d}{(h+1) % 24:02d}" for h in range(24)]
-        elif hours == 8:
-            # 3-hour intervals: s0003, s0306, ..., s2124
-            return [f"{prefix}{h*3:02d}{(h+1)*3:02d}" for h in range(8)]
-        else:
-            raise ValueError(f"Unsupported hours: {hours}")
+        return list(hourly_columns(var_info['col_prefix'], var_info['hours']))
 
 
 # Default configuration instance
@@ -4,25 +4,208 @@
 기상청 API허브에서 고해상도 격자자료를 다운로드
 """
 
+import atexit
+import json
+import logging
+import logging.handlers
 import os
+import queue
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional
+from typing import Optional, TextIO, Union
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import FusionConfig, DEFAULT_CONFIG
 
+logger = logging.getLogger(__name__)
+
+# 에러/HTML 응답 판별용 (응답 앞부분 400자에만 적용, 대소문자 무시)
+_NON_SPACE_RE = re.compile(r"\S")
+_NON_SPACE_BYTES_RE = re.compile(rb"\S")
+_ERROR_MARKER_RE = re.compile(r"<html|<!doctype html|forbidden|unauthorized", re.I)
+_ERROR_WORD_RE = re.compile(r"error", re.I)
+
+# 패키지 로거(fusion.*) 출력 설정은 실행 스크립트(run_*.py)가 enable_queue_logging()으로 선택합니다.
+# 라이브러리 코드는 logging.getLogger(__name__)만 사용하고 전역 logging 설정은 바꾸지 않습니다.
+_log_listener: Optional[logging.handlers.QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def enable_queue_logging(level: int = logging.INFO) -> None:
+    """패키지 로거에 QueueHandler + QueueListener(stdout)를 설치 (프로세스당 한 번, 실행 스크립트용).
+
+    기록은 큐에만 넣고 stdout 출력은 백그라운드 스레드가 하므로, 다운로드 워커 스레드가
+    stdout 잠금을 기다리지 않습니다.
+    """
+    global _log_listener
+    with _log_listener_lock:
+        if _log_listener is not None:
+            return
+        package_logger = logging.getLogger(__package__ or __name__)
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        package_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        package_logger.setLevel(level)
+
+
+def _reset_queue_logging_after_fork() -> None:
+    """fork된 자식 프로세스: 부모의 QueueHandler를 stdout 직접 출력으로 교체.
+
+    리스너 스레드는 fork로 복제되지 않으므로, 물려받은 QueueHandler에 쌓인 기록은 출력되지 않습니다
+    (날짜 단위 프로세스 풀 워커의 `fusion.*` 로그 유실).
+    """
+    global _log_listener, _log_listener_lock
+    _log_listener_lock = threading.Lock()
+    listener, _log_listener = _log_listener, None
+    if listener is None:
+        return
+    atexit.unregister(listener.stop)
+    package_logger = logging.getLogger(__package__ or __name__)
+    for handler in list(package_logger.handlers):
+        if isinstance(handler, logging.handlers.QueueHandler) and handler.queue is listener.queue:
+            package_logger.removeHandler(handler)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    package_logger.addHandler(stream_handler)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_queue_logging_after_fork)
+
+
+class _RateLimiter:
+    """여러 스레드가 공유하는 요청 제한기.
+
+    동시에 진행 중인 요청은 max_in_flight개로 제한하고, 각 요청이 끝난 뒤 pause초를 쉬고 나서
+    슬롯을 반납합니다 (max_in_flight=1이면 기존 "요청 1건 후 api_sleep_seconds 대기"와 동일).
+    """
+
+    def __init__(self, pause: float, max_in_flight: int = 1):
+        self.pause = max(0.0, float(pause))
+        self._slots = threading.BoundedSemaphore(max(1, int(max_in_flight)))
+
+    def __enter__(self) -> "_RateLimiter":
+        self._slots.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            if self.pause > 0:
+                time.sleep(self.pause)
+        finally:
+            self._slots.release()
+
+
+class _AppendLogFiles:
+    """검증 로그 파일 핸들 캐시 (경로별로 append 모드 핸들을 열어 두고 재사용, LRU 상한).
+
+    재시도가 몰리는 날에도 이벤트마다 open/close 하지 않도록 하며, 여러 스레드가 같은
+    파일에 기록해도 줄이 섞이지 않도록 잠금 안에서 기록합니다.
+    - 폴더는 파일을 처음 열 때만 생성 (호출마다 makedirs 하지 않음)
+    - flush=False(INFO 등)는 버퍼에 모아 두고, flush=True(WARN/ERROR) 기록 시 함께 내보냄
+    """
+
+    def __init__(self, max_open: int = 32):
+        self.max_open = max(1, int(max_open))
+        self._lock = threading.Lock()
+        self._handles: "OrderedDict[str, TextIO]" = OrderedDict()
+
+    def write(self, path: str, text: str, flush: bool = True) -> None:
+        with self._lock:
+            fh = self._handles.get(path)
+            if fh is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fh = open(path, "a", encoding="utf-8", buffering=8192)
+                self._handles[path] = fh
+                if len(self._handles) > self.max_open:
+                    _, oldest = self._handles.popitem(last=False)
+                    oldest.close()
+            else:
+                self._handles.move_to_end(path)
+            fh.write(text)
+            if flush:
+                fh.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            while self._handles:
+                _, fh = self._handles.popitem()
+                fh.close()
+
 
 class FusionDataDownloader:
     """융합기상정보 다운로드 클래스"""
     
     # API 엔드포인트
     GRID_NC_URL = "{base}/cgi-bin/url/nph-sfc_obs_nc_api"  # 전체영역 단일요소
+    USER_AGENT = f"kma-fusion-weather/1.0 {requests.utils.default_user_agent()}"
+    STREAM_CHUNK_SIZE = 64 * 1024  # save_dir 저장 시 스트리밍 청크 크기 (bytes)
+    WRITE_BUFFER_SIZE = 1 << 20  # 저장 파일 쓰기 버퍼 (청크를 모아 write 시스템 호출 횟수 감소)
     
     def __init__(self, auth_key: str, config: Optional[FusionConfig] = None):
         self.auth_key = auth_key
         self.config = config or DEFAULT_CONFIG
         self.config.ensure_dirs()
 
+        # 인스턴스마다 고정인 URL/인증 파라미터는 한 번만 구성
+        self._grid_nc_url = self.GRID_NC_URL.format(base=self.config.api_base_url)
+        self._base_params = {'authKey': self.auth_key}
+
+        # keep-alive 세션 (스레드 간 공유) + 전송 계층 재시도(연결 오류, 429/5xx)
+        # 풀 크기 = 변수 병렬 수 x 시간 병렬 수 (커넥션 대기 없이 동시 요청 가능하도록)
+        # - 여러 날짜 스레드가 이 downloader를 공유하면 동시 요청 상한(api_max_in_flight)이 더 클 수 있음
+        workers = max(
+            max(1, int(getattr(self.config, "download_workers", 1)))
+            * max(1, int(getattr(self.config, "variable_workers", 1))),
+            int(getattr(self.config, "api_max_in_flight", 1) or 1),
+        )
+        retry = Retry(
+            total=int(getattr(self.config, "http_retries", 0)),
+            backoff_factor=float(getattr(self.config, "http_retry_backoff", 0.0)),
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # 공통 헤더는 세션에 한 번만 설정 (ASCII 격자 응답은 gzip 전송 시 크기가 크게 줄어듦)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "User-Agent": self.USER_AGENT,
+        })
+
+        # 동시 요청 수(api_max_in_flight)와 요청 후 대기(api_sleep_seconds): 이 downloader를 쓰는 모든 스레드가 공유
+        self._rate_limiter = _RateLimiter(
+            getattr(self.config, "api_sleep_seconds", 0.0),
+            getattr(self.config, "api_max_in_flight", 1),
+        )
+
+        # 검증 로그 파일 핸들 (pipeline의 검증 로그도 같은 캐시를 통해 기록)
+        self.validation_logs = _AppendLogFiles()
+
+    def close(self) -> None:
+        """HTTP 세션(커넥션 풀)과 열려 있는 검증 로그 파일 정리."""
+        self.session.close()
+        self.validation_logs.close()
+
+    def __enter__(self) -> "FusionDataDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def _get_validation_log_path(self, date: str, obs: str) -> str:
         """검증/다운로드 오류 로그 파일 경로.
 
@@ -32,7 +215,7 @@ class FusionDataDownloader:
         year = date[:4]
         month = date[4:6]
         log_dir = os.path.join(self.config.fusion_raw_dir, "_validation_logs", year, month)
-        os.makedirs(log_dir, exist_ok=True)
+        # 폴더는 첫 기록 시 validation_logs가 생성
         return os.path.join(log_dir, f"{date}_{obs}.txt")
 
     def _append_validation_log(
@@ -54,38 +237,79 @@ class FusionDataDownloader:
             f"[{ts}] [{level}] tm={tm_part} obs={obs} :: {message}",
         ]
         if response_preview:
-            lines.append("  response_preview: " + response_preview.replace("\n", " ")[:500])
+            lines.append("  response_preview: " + response_preview[:500].replace("\n", " "))
 
-        with open(path, "a", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        self.validation_logs.write(path, "\n".join(lines) + "\n", flush=level != "INFO")
 
     @staticmethod
-    def _looks_like_error_response(text: str) -> bool:
+    def _looks_like_error_response(text: Union[str, bytes, None]) -> bool:
         """ASCII 응답이 데이터가 아닌 에러/HTML 본문처럼 보이는지 빠르게 판별."""
         if text is None:
             return True
 
-        t = text.strip()
-        if not t:
-            return True
+        # 전체 본문을 strip/lower 복사하지 않고, 첫 비공백 문자부터 400자만 검사
+        if isinstance(text, bytes):
+            # bytes 응답은 검사할 앞부분만 디코딩
+            m = _NON_SPACE_BYTES_RE.search(text)
+            if m is None:
+                return True
+            head = text[m.start():m.start() + 400].decode('utf-8', errors='replace')
+        else:
+            m = _NON_SPACE_RE.search(text)
+            if m is None:
+                return True
+            head = text[m.start():m.start() + 400]
 
-        head = t[:400].lower()
-        if "<html" in head or "<!doctype html" in head:
+        if _ERROR_MARKER_RE.search(head):
             return True
-        if "forbidden" in head or "unauthorized" in head:
-            return True
-        if "error" in head and "#" not in head:
+        if "#" not in head and _ERROR_WORD_RE.search(head):
             # 데이터 포맷이 아닌 에러 메시지일 가능성
             return True
         return False
     
+    @staticmethod
+    def _meta_path(filepath: str) -> str:
+        """저장 파일의 캐시 검증자(ETag/Last-Modified) sidecar 경로."""
+        return filepath + ".meta.json"
+
+    def _conditional_headers(self, filepath: str) -> Optional[dict]:
+        """기존 파일과 sidecar가 있으면 조건부 요청 헤더를 반환."""
+        if not os.path.exists(filepath):
+            return None
+        try:
+            with open(self._meta_path(filepath), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers or None
+
+    def _write_validator_meta(self, filepath: str, resp_headers) -> None:
+        """응답의 ETag/Last-Modified를 sidecar에 기록 (없으면 오래된 sidecar 제거)."""
+        meta_path = self._meta_path(filepath)
+        meta = {
+            "etag": resp_headers.get("ETag"),
+            "last_modified": resp_headers.get("Last-Modified"),
+        }
+        if not any(meta.values()):
+            if os.path.exists(meta_path):
+                os.remove(meta_path)
+            return
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+
     def download_hour_all_grid(
         self,
         tm: str,
         obs: str,
         save_dir: Optional[str] = None,
         disp: str = 'A',  # A: ASCII, B: Binary
-    ) -> Optional[str]:
+    ) -> Optional[Union[str, bytes]]:
         """
         특정 시각의 전체 영역 단일 요소 다운로드
         
@@ -93,68 +317,105 @@ class FusionDataDownloader:
             tm: 조회 시각 (YYYYMMDDHHmm, KST)
             obs: 요소 (ta, rn_60m, sd_3hr 등)
             save_dir: 저장 디렉토리
+                (revalidate_existing=True면 기존 파일은 skip_existing보다 우선해 ETag/Last-Modified 조건부 요청으로 재검증)
             disp: 출력 형태 (A: ASCII, B: Binary)
             
         Returns:
-            저장된 파일 경로 또는 None
+            저장된 파일 경로 (save_dir 미지정 시 응답 본문 bytes) 또는 None
         """
-        url = self.GRID_NC_URL.format(base=self.config.api_base_url)
+
+        filepath = None
+        cond_headers = None
+        if save_dir:
+            filename = f"{obs}_{tm}.txt" if disp == 'A' else f"{obs}_{tm}.bin"
+            filepath = os.path.join(save_dir, filename)
+            if getattr(self.config, "revalidate_existing", False):
+                # 이전에 받아둔 파일이 있으면 ETag/Last-Modified로 조건부 요청 (304면 본문 없이 기존 파일 재사용)
+                cond_headers = self._conditional_headers(filepath)
+            elif getattr(self.config, "skip_existing", False):
+                # 재실행 시 이미 받아둔 파일은 네트워크 호출 없이 재사용 (너무 작은 파일은 잘린 것으로 보고 재다운로드)
+                try:
+                    if os.stat(filepath).st_size >= int(getattr(self.config, "skip_existing_min_bytes", 1)):
+                        return filepath
+                except OSError:
+                    pass
         
-        params = {
-            'tm': tm,
-            'obs': obs,
-            'disp': disp,
-            'authKey': self.auth_key,
-        }
+        params = {'tm': tm, 'obs': obs, 'disp': disp, **self._base_params}
         
         try:
-            resp = requests.get(url, params=params, timeout=120)
-            
-            if resp.status_code == 403:
-                print(f"다운로드 거부 (403 Forbidden) - {obs}: API 권한을 확인해주세요.")
-                print(f"  기상청 API 허브(apihub.kma.go.kr) 마이페이지에서 '{obs}' 요소의 사용 권한이 있는지 확인이 필요합니다.")
-                self._append_validation_log(
-                    date=tm[:8],
-                    obs=obs,
-                    tm=tm,
-                    level="ERROR",
-                    message="HTTP 403 Forbidden",
-                    response_preview=resp.text if resp is not None else None,
-                )
-                return None
-                
-            resp.raise_for_status()
-
-            # 최소 검증: ASCII인데 데이터가 아닌 에러/HTML 응답이면 실패로 처리하고 로그를 남깁니다.
-            if disp == 'A' and self._looks_like_error_response(resp.text):
-                self._append_validation_log(
-                    date=tm[:8],
-                    obs=obs,
-                    tm=tm,
-                    level="ERROR",
-                    message="응답 본문이 비어있거나 에러/HTML로 보입니다.",
-                    response_preview=resp.text,
-                )
-                return None
-            
-            # 저장
-            if save_dir:
+            # stream=True: save_dir 저장 시 본문 전체를 메모리에 올리지 않고 청크 단위로 디스크에 기록
+            with self._rate_limiter, self.session.get(
+                self._grid_nc_url, params=params, headers=cond_headers, timeout=120, stream=True,
+            ) as resp:
+                if cond_headers and resp.status_code == 304:
+                    return filepath
+
+                if resp.status_code == 403:
+                    logger.error(
+                        "다운로드 거부 (403 Forbidden) - %s: API 권한을 확인해주세요.\n"
+                        "  기상청 API 허브(apihub.kma.go.kr) 마이페이지에서 '%s' 요소의 사용 권한이 있는지 확인이 필요합니다.",
+                        obs, obs,
+                    )
+                    self._append_validation_log(
+                        date=tm[:8],
+                        obs=obs,
+                        tm=tm,
+                        level="ERROR",
+                        message="HTTP 403 Forbidden",
+                        response_preview=resp.text[:500] if resp is not None else None,
+                    )
+                    return None
+
+                resp.raise_for_status()
+
+                if not save_dir:
+                    if disp != 'A':
+                        return resp.content
+
+                    # 격자 값은 ASCII 숫자뿐이므로 본문 전체를 문자열로 디코딩하지 않고 bytes 그대로 반환
+                    # (파서가 bytes를 직접 처리하고, 디코딩은 에러 검사용 앞부분/미리보기에서만 수행)
+                    body = resp.content
+                    # 최소 검증: ASCII인데 데이터가 아닌 에러/HTML 응답이면 실패로 처리하고 로그를 남깁니다.
+                    if self._looks_like_error_response(body):
+                        self._append_validation_log(
+                            date=tm[:8],
+                            obs=obs,
+                            tm=tm,
+                            level="ERROR",
+                            message="응답 본문이 비어있거나 에러/HTML로 보입니다.",
+                            response_preview=body[:500].decode(resp.encoding or 'utf-8', errors='replace'),
+                        )
+                        return None
+                    return body
+
+                # 저장: 첫 청크로만 에러/HTML 여부를 판별한 뒤 나머지는 그대로 스트리밍
+                chunks = resp.iter_content(chunk_size=self.STREAM_CHUNK_SIZE)
+                first = next(chunks, b"")
+                if disp == 'A':
+                    head_text = first.decode(resp.encoding or 'utf-8', errors='replace')
+                    if self._looks_like_error_response(head_text):
+                        self._append_validation_log(
+                            date=tm[:8],
+                            obs=obs,
+                            tm=tm,
+                            level="ERROR",
+                            message="응답 본문이 비어있거나 에러/HTML로 보입니다.",
+                            response_preview=head_text[:500],
+                        )
+                        return None
+
                 os.makedirs(save_dir, exist_ok=True)
-                filename = f"{obs}_{tm}.txt" if disp == 'A' else f"{obs}_{tm}.bin"
-                filepath = os.path.join(save_dir, filename)
-                
-                mode = 'w' if disp == 'A' else 'wb'
-                content = resp.text if disp == 'A' else resp.content
-                
-                with open(filepath, mode, encoding='utf-8' if disp == 'A' else None) as f:
-                    f.write(content)
-                
+
+                with open(filepath, 'wb', buffering=self.WRITE_BUFFER_SIZE) as f:
+                    f.write(first)
+                    for chunk in chunks:
+                        f.write(chunk)
+                self._write_validator_meta(filepath, resp.headers)
+
                 return filepath
             
-            return resp.text if disp == 'A' else resp.content
-            
         except Exception as e:
-            print(f"다운로드 실패 ({tm}, {obs}): {e}")
+            logger.warning("다운로드 실패 (%s, %s): %s", tm, obs, e)
             self._append_validation_log(
                 date=tm[:8],
                 obs=obs,
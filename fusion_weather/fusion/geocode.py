@@ -11,35 +11,53 @@
 -----------------
 1) NetCDF에서 위경도 배열을 추출 → flatten → 격자점 목록 생성
 2) Shapefile로 경계(폴리곤) 로드
-3) 격자점 → `GeoDataFrame`(Point geometry, `EPSG:4326`)
-4) `geopandas.sjoin(..., predicate='within')`로 공간 조인 수행
+3) 폴리곤 bbox로 후보 격자점을 추린 뒤 `shapely.contains_xy`로 포함 판정
+   (`geopandas.sjoin(..., how='left', predicate='within')`과 같은 결과, Point 객체 생성 없음)
 """
 
 import os
 import glob
-from typing import Optional, List
+import codecs
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, List, Tuple
 
 import numpy as np
 import pandas as pd
 import geopandas as gpd
-from shapely.geometry import Point
+import shapely
 import xarray as xr
 
 from .config import FusionConfig, DEFAULT_CONFIG
 
+try:
+    import pyogrio  # noqa: F401  (GDAL 벡터 API로 컬럼 단위 일괄 읽기 — fiona보다 빠름)
+    _SHP_READ_ENGINE: Optional[str] = "pyogrio"
+except ImportError:
+    _SHP_READ_ENGINE = None  # geopandas 기본 엔진 사용
+
+
+# 매핑 테이블의 지역 코드/명칭 컬럼, Parquet 압축 방식
+MAPPING_LABEL_COLUMNS = ('HJD_CD', 'HJD_NM', 'EMD_CD', 'EMD_NM')
+MAPPING_PARQUET_COMPRESSION = 'zstd'
+
 
 # ── 공통 유틸리티 ──────────────────────────────────────────────
 
 
 def _find_variable(ds: xr.Dataset, candidates: list) -> Optional[str]:
-    """`xarray.Dataset`에서 후보 변수명 중 존재하는 것 찾기."""
+    """`xarray.Dataset`에서 후보 변수명 중 존재하는 것 찾기 (대소문자 무시 일치도 허용)."""
+    # 소문자 → 원래 이름 (같은 소문자 이름이 여럿이면 먼저 나온 변수 우선)
+    lower_map = {}
+    for v in ds.data_vars:
+        lower_map.setdefault(v.lower(), v)
+
     for name in candidates:
         if name in ds.data_vars:
             return name
-        if name.lower() in [v.lower() for v in ds.data_vars]:
-            for v in ds.data_vars:
-                if v.lower() == name.lower():
-                    return v
+        found = lower_map.get(name.lower())
+        if found is not None:
+            return found
     return None
 
 
@@ -51,14 +69,16 @@ def _find_column(df: pd.DataFrame, candidates: list) -> Optional[str]:
     return None
 
 
-def _load_grid_coordinates(config: FusionConfig) -> pd.DataFrame:
+def _load_grid_coordinates(config: FusionConfig) -> Tuple[np.ndarray, np.ndarray]:
     """격자 좌표 NetCDF 파일 로드.
 
-    반환: DataFrame (grid_idx, lat, lon)
+    반환: (lat, lon) 1차원 배열 — 배열 위치가 곧 grid_idx
     """
     nc_path = config.grid_latlon_nc
 
-    with xr.open_dataset(nc_path) as ds:
+    # 위경도 배열만 한 번 읽으므로 시간/좌표 해석과 xarray 내부 캐시는 생략
+    # (_FillValue/scale_factor 처리는 유지해야 하므로 decode_cf 자체는 끄지 않음)
+    with xr.open_dataset(nc_path, decode_times=False, decode_coords=False, cache=False) as ds:
         lat_var = _find_variable(ds, ['lat', 'latitude', 'LAT'])
         lon_var = _find_variable(ds, ['lon', 'longitude', 'LON'])
 
@@ -76,18 +96,102 @@ def _load_grid_coordinates(config: FusionConfig) -> pd.DataFrame:
             lon_data = ds[lon_var].values
 
         if lat_data.ndim == 2:
-            lat_flat = lat_data.flatten()
-            lon_flat = lon_data.flatten()
+            # 이미 C 연속 배열이면 복사 없이 1차원 뷰로 사용
+            lat_flat = np.ascontiguousarray(lat_data).ravel()
+            lon_flat = np.ascontiguousarray(lon_data).ravel()
         else:
-            lon_grid, lat_grid = np.meshgrid(lon_data, lat_data)
-            lat_flat = lat_grid.flatten()
-            lon_flat = lon_grid.flatten()
+            # meshgrid(2차원 배열 2개) 없이 행 우선(C) 순서의 1차원 좌표를 바로 생성
+            lat_flat = np.repeat(lat_data, lon_data.size)
+            lon_flat = np.tile(lon_data, lat_data.size)
+
+        return lat_flat, lon_flat
+
+
+def _points_in_polygons(
+    lon: np.ndarray,
+    lat: np.ndarray,
+    polygons: np.ndarray,
+    workers: Optional[int] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """격자점(lon, lat 배열)과 그 점을 포함하는 폴리곤의 위치 쌍을 반환.
 
-        return pd.DataFrame({
-            'grid_idx': range(len(lat_flat)),
-            'lat': lat_flat,
-            'lon': lon_flat,
-        })
+    격자점마다 `Point`를 만들지 않고, 경도 정렬 + `searchsorted`로 폴리곤 bbox 안의 후보만
+    추린 뒤 `shapely.contains_xy`로 판정합니다. (경계 위의 점은 `within`과 같이 제외)
+
+    workers: 병렬 스레드 수 (None이면 CPU 수)
+
+    반환: (point_idx, poly_idx) — 격자점 순, 같은 격자점 안에서는 폴리곤 순으로 정렬
+    """
+    # 폴리곤별 GEOS prepared geometry(엣지 인덱스)를 한 번에 생성해 포함 판정에 재사용
+    shapely.prepare(polygons)
+
+    empty = np.empty(0, dtype=np.int64)
+    bounds = shapely.bounds(polygons)  # (n, 4): minx, miny, maxx, maxy
+    valid = np.isfinite(bounds).all(axis=1)
+    if not valid.any():
+        return empty, empty
+
+    # 전체 폴리곤 범위(bbox) 밖의 격자점(해상, 주변국 등)은 정렬/판정 대상에서 미리 제외
+    minx, miny = bounds[valid, 0].min(), bounds[valid, 1].min()
+    maxx, maxy = bounds[valid, 2].max(), bounds[valid, 3].max()
+    in_box = np.flatnonzero((lon >= minx) & (lon <= maxx) & (lat >= miny) & (lat <= maxy))
+
+    order = in_box[np.argsort(lon[in_box], kind='stable')]
+    lon_sorted = lon[order]
+    lo = np.searchsorted(lon_sorted, bounds[:, 0], side='left')
+    hi = np.searchsorted(lon_sorted, bounds[:, 2], side='right')
+
+    def _scan(poly_ids: np.ndarray) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        point_parts = []
+        poly_parts = []
+        for j in poly_ids:
+            cand = order[lo[j]:hi[j]]
+            cand_lat = lat[cand]
+            cand = cand[(cand_lat >= bounds[j, 1]) & (cand_lat <= bounds[j, 3])]
+            if cand.size == 0:
+                continue
+            hit = cand[shapely.contains_xy(polygons[j], lon[cand], lat[cand])]
+            if hit.size:
+                point_parts.append(hit)
+                poly_parts.append(np.full(hit.size, j, dtype=np.int64))
+        return point_parts, poly_parts
+
+    # 폴리곤 묶음별로 스레드 병렬 처리 (shapely 2 벡터 연산은 GIL을 해제)
+    todo = np.flatnonzero(valid & (hi > lo))
+    # 힐베르트 곡선 순서로 처리: 연속으로 처리되는(같은 묶음의) 폴리곤이 공간적으로 가까워
+    # 후보 격자점 구간(order 슬라이스)과 lat/lon 배열 접근이 캐시에 잘 맞음
+    # (포함 판정은 GEOS 연산 위주의 compute-bound 작업이라 결과 정렬 순서와는 무관)
+    if len(todo) > 1:
+        hilbert = gpd.GeoSeries(polygons[todo]).hilbert_distance().to_numpy()
+        todo = todo[np.argsort(hilbert, kind='stable')]
+    n_workers = max(1, min(int(workers or os.cpu_count() or 1), len(todo)))
+    if n_workers == 1:
+        point_parts, poly_parts = _scan(todo)
+    else:
+        point_parts, poly_parts = [], []
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            # 작은 묶음으로 나눠 폴리곤 크기 편차가 있어도 스레드 간 부하가 고르게 분산되도록 함
+            for pts, polys in ex.map(_scan, np.array_split(todo, n_workers * 4)):
+                point_parts.extend(pts)
+                poly_parts.extend(polys)
+
+    if not point_parts:
+        return empty, empty
+
+    point_idx = np.concatenate(point_parts)
+    poly_idx = np.concatenate(poly_parts)
+    sort = np.lexsort((poly_idx, point_idx))
+    return point_idx[sort], poly_idx[sort]
+
+
+def _read_shapefile(shp_path: str, encoding: Optional[str] = None) -> gpd.GeoDataFrame:
+    """shapefile 한 개 읽기 (pyogrio가 있으면 pyogrio 엔진 사용)."""
+    kwargs = {}
+    if encoding is not None:
+        kwargs['encoding'] = encoding
+    if _SHP_READ_ENGINE is not None:
+        kwargs['engine'] = _SHP_READ_ENGINE
+    return gpd.read_file(shp_path, **kwargs)
 
 
 def _load_shapefiles(
@@ -101,6 +205,9 @@ def _load_shapefiles(
         shp_dir: shapefile 디렉토리
         glob_pattern: glob 검색 패턴 (예: "bnd_dong*/*.shp")
         label: 로그 출력용 라벨 (예: "행정동", "법정동")
+
+    반환되는 GeoDataFrame은 EPSG:4326으로 변환된 상태이며, 같은 디렉토리에 GeoParquet
+    캐시(`_cache_*_epsg4326.parquet`)로 저장되어 다음 실행부터는 캐시를 읽습니다.
     """
     if not os.path.exists(shp_dir):
         raise FileNotFoundError(f"{label} 데이터 디렉토리가 없습니다: {shp_dir}")
@@ -118,19 +225,38 @@ def _load_shapefiles(
     for f in shp_files:
         print(f"         - {os.path.basename(f)}")
 
+    # 원본(경로/크기/수정시각)이 같으면 EPSG:4326으로 변환해 둔 GeoParquet 캐시를 바로 사용
+    cache_path = _shapefile_cache_path(shp_dir, shp_files)
+    if os.path.exists(cache_path):
+        try:
+            cached = gpd.read_parquet(cache_path)
+            print(f"       캐시 로드: {cache_path}")
+            return cached
+        except Exception as e:
+            print(f"       경고: 캐시 로드 실패, 원본에서 다시 읽습니다 - {e}")
+
     gdf_list = []
     for shp_path in shp_files:
         gdf = None
-        for encoding in ['utf-8', 'cp949', 'euc-kr']:
+        # 선언된 인코딩(.cpg / DBF 언어 드라이버)을 알면 한 번만 읽고, 모를 때만 후보를 차례로 시도
+        declared = _detect_shapefile_encoding(shp_path)
+        if declared is not None:
             try:
-                gdf = gpd.read_file(shp_path, encoding=encoding)
-                break
+                gdf = _read_shapefile(shp_path, encoding=declared)
             except Exception:
-                continue
+                gdf = None
+
+        if gdf is None:
+            for encoding in ['utf-8', 'cp949', 'euc-kr']:
+                try:
+                    gdf = _read_shapefile(shp_path, encoding=encoding)
+                    break
+                except Exception:
+                    continue
 
         if gdf is None:
             try:
-                gdf = gpd.read_file(shp_path)
+                gdf = _read_shapefile(shp_path)
             except Exception as e:
                 print(f"       경고: {shp_path} 로드 실패 - {e}")
                 continue
@@ -147,12 +273,109 @@ def _load_shapefiles(
     if combined_gdf.crs is None and gdf_list[0].crs is not None:
         combined_gdf.set_crs(gdf_list[0].crs, inplace=True)
 
+    if combined_gdf.crs is not None and combined_gdf.crs != 'EPSG:4326':
+        print(f"       좌표계 변환: {combined_gdf.crs} → EPSG:4326")
+        combined_gdf = combined_gdf.to_crs('EPSG:4326')
+
+    # 일부 파일만 읽힌 결과는 캐시하지 않음 (캐시 키가 원본 파일 기준이라 누락된 지역이 계속 재사용됨)
+    if len(gdf_list) < len(shp_files):
+        print(f"       경고: {label} shapefile {len(shp_files) - len(gdf_list)}개 로드 실패, 캐시를 저장하지 않습니다")
+        return combined_gdf
+
+    try:
+        combined_gdf.to_parquet(cache_path, index=False)
+    except Exception as e:
+        print(f"       경고: 캐시 저장 실패 - {e}")
+    else:
+        # 원본이 바뀌기 전의 캐시는 더 이상 쓰이지 않으므로 정리
+        for old_cache in glob.glob(os.path.join(shp_dir, "_cache_*_epsg4326.parquet")):
+            if os.path.abspath(old_cache) != os.path.abspath(cache_path):
+                try:
+                    os.remove(old_cache)
+                except OSError:
+                    pass
+
     return combined_gdf
 
 
+# DBF 헤더의 언어 드라이버 ID(29번째 바이트) → 인코딩 (한국 공공데이터에서 쓰이는 값만)
+_DBF_LDID_ENCODINGS = {
+    0x79: 'cp949',  # Korean Windows
+}
+
+
+def _detect_shapefile_encoding(shp_path: str) -> Optional[str]:
+    """shapefile의 DBF 인코딩을 파일을 파싱하지 않고 판별 (.cpg 우선, 다음으로 DBF 헤더).
+
+    판별할 수 없으면 None.
+    """
+    stem = os.path.splitext(shp_path)[0]
+
+    for cpg_path in (stem + '.cpg', stem + '.CPG'):
+        if os.path.exists(cpg_path):
+            try:
+                with open(cpg_path, 'r', encoding='ascii', errors='ignore') as f:
+                    declared = f.read().strip()
+            except OSError:
+                break
+            # 코드페이지 번호만 적힌 경우 (예: "949", "65001")
+            if declared.isdigit():
+                declared = 'utf-8' if declared == '65001' else f"cp{declared}"
+            try:
+                return codecs.lookup(declared).name
+            except LookupError:
+                break
+
+    for dbf_path in (stem + '.dbf', stem + '.DBF'):
+        if os.path.exists(dbf_path):
+            try:
+                with open(dbf_path, 'rb') as f:
+                    header = f.read(32)
+            except OSError:
+                return None
+            if len(header) >= 30:
+                return _DBF_LDID_ENCODINGS.get(header[29])
+            return None
+
+    return None
+
+
+def _shapefile_cache_path(shp_dir: str, shp_files: List[str]) -> str:
+    """shapefile 목록(경로, 크기, 수정시각) 기준 GeoParquet 캐시 경로."""
+    h = hashlib.md5()
+    for shp_path in sorted(shp_files):
+        stem = os.path.splitext(shp_path)[0]
+        for ext in ('.shp', '.shx', '.dbf', '.prj', '.cpg'):
+            path = stem + ext
+            if os.path.exists(path):
+                st = os.stat(path)
+                h.update(f"{os.path.relpath(path, shp_dir)}|{st.st_size}|{st.st_mtime_ns}\n".encode("utf-8"))
+    return os.path.join(shp_dir, f"_cache_{h.hexdigest()[:16]}_epsg4326.parquet")
+
+
+def _read_mapping_parquet(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """매핑 parquet 읽기 (메모리 맵, 필요한 컬럼만 디코딩)."""
+    return pd.read_parquet(path, columns=list(columns) if columns is not None else None, memory_map=True)
+
+
+def _compact_mapping(df: pd.DataFrame) -> pd.DataFrame:
+    """매핑 테이블을 작게 유지: grid_idx → int32, 지역 코드/명칭 → category.
+
+    지역 수(수천)에 비해 행 수(수백만)가 훨씬 많으므로 문자열 대신 카테고리 코드로 저장합니다.
+    (카테고리는 값의 정렬 순서를 따름)
+    """
+    out = {}
+    if 'grid_idx' in df.columns and len(df) and df['grid_idx'].max() <= np.iinfo(np.int32).max:
+        out['grid_idx'] = df['grid_idx'].astype(np.int32)
+    for col in MAPPING_LABEL_COLUMNS:
+        if col in df.columns:
+            out[col] = df[col].astype('category')
+    return df.assign(**out)
+
+
 def _build_mapping(
     config: FusionConfig,
-    polygon_gdf: gpd.GeoDataFrame,
+    load_polygons: Callable[[], gpd.GeoDataFrame],
     cd_candidates: List[str],
     nm_candidates: List[str],
     cd_out: str,
@@ -165,7 +388,7 @@ def _build_mapping(
 
     Args:
         config: FusionConfig
-        polygon_gdf: 지역 경계 GeoDataFrame
+        load_polygons: 지역 경계 GeoDataFrame을 읽는 함수 (매핑 파일이 없거나 재생성할 때만 호출)
         cd_candidates: 코드 컬럼 후보 리스트
         nm_candidates: 명칭 컬럼 후보 리스트
         cd_out: 출력 코드 컬럼명 (예: 'HJD_CD', 'EMD_CD')
@@ -176,51 +399,75 @@ def _build_mapping(
     """
     if not force_rebuild and os.path.exists(mapping_path):
         print(f"기존 {label} 매핑 파일 로드: {mapping_path}")
-        return pd.read_parquet(mapping_path)
+        return _read_mapping_parquet(mapping_path)
 
     print(f"격자-{label} 매핑 테이블 생성 중...")
 
-    grid_df = _load_grid_coordinates(config)
+    polygon_gdf = load_polygons()
+    grid_lat, grid_lon = _load_grid_coordinates(config)
     print(f"       {label} 수: {len(polygon_gdf):,}")
 
-    grid_points = gpd.GeoDataFrame(
-        grid_df,
-        geometry=[Point(lon, lat) for lon, lat in zip(grid_df['lon'], grid_df['lat'])],
-        crs='EPSG:4326',
-    )
-
     if polygon_gdf.crs != 'EPSG:4326':
         print(f"       좌표계 변환: {polygon_gdf.crs} → EPSG:4326")
         polygon_gdf = polygon_gdf.to_crs('EPSG:4326')
 
-    mapping = gpd.sjoin(grid_points, polygon_gdf, how='left', predicate='within')
+    polygons = np.asarray(polygon_gdf.geometry.values)
+    tolerance = getattr(config, 'mapping_simplify_tolerance', None)
+    if tolerance:
+        print(f"       경계 단순화: tolerance={tolerance}")
+        polygons = shapely.simplify(polygons, tolerance, preserve_topology=True)
+
+    point_idx, poly_idx = _points_in_polygons(
+        grid_lon.astype(np.float64, copy=False),
+        grid_lat.astype(np.float64, copy=False),
+        polygons,
+        workers=getattr(config, 'mapping_workers', None),
+    )
+
+    # left join: 어느 폴리곤에도 속하지 않는 격자점도 한 행으로 남김 (폴리곤 위치 -1)
+    matched = np.zeros(len(grid_lat), dtype=bool)
+    matched[point_idx] = True
+    unmatched = np.flatnonzero(~matched)
+    rows = np.concatenate([point_idx, unmatched])
+    right = np.concatenate([poly_idx, np.full(len(unmatched), -1, dtype=np.int64)])
+    sort = np.argsort(rows, kind='stable')
+    rows, right = rows[sort], right[sort]
 
-    found_cd = _find_column(mapping, cd_candidates)
-    found_nm = _find_column(mapping, nm_candidates)
+    found_cd = _find_column(polygon_gdf, cd_candidates)
+    found_nm = _find_column(polygon_gdf, nm_candidates)
 
     if found_cd is None or found_nm is None:
         available_cols = [
-            c for c in mapping.columns
+            c for c in polygon_gdf.columns
             if c not in ['grid_idx', 'lat', 'lon', 'geometry', 'index_right']
         ]
         print(f"       경고: {label} 코드/명칭 컬럼을 찾지 못했습니다.")
         print(f"       사용 가능한 컬럼: {available_cols}")
         print(f"       찾은 코드 컬럼: {found_cd}, 명칭 컬럼: {found_nm}")
 
-    result_df = pd.DataFrame({
-        'grid_idx': mapping['grid_idx'],
-        'lat': mapping['lat'],
-        'lon': mapping['lon'],
-        cd_out: mapping[found_cd] if found_cd else None,
-        nm_out: mapping[found_nm] if found_nm else None,
-    })
+    def _take(col: Optional[str]) -> pd.Categorical:
+        # 격자점마다 문자열을 만들지 않고, 폴리곤 단위 값 목록(정렬)에 대한 코드 번호로 바로 범주형 생성
+        # 폴리곤 위치 -1(미매칭)이나 값이 없는 폴리곤은 코드 -1 = NaN (sjoin left의 미매칭 행과 동일)
+        if not col or len(polygon_gdf) == 0:
+            return pd.Categorical.from_codes(np.full(len(right), -1, dtype=np.int32), categories=[])
+        poly_codes, categories = pd.factorize(polygon_gdf[col].to_numpy(), sort=True)
+        codes = np.where(right >= 0, poly_codes[right], -1).astype(np.int32, copy=False)
+        return pd.Categorical.from_codes(codes, categories=categories)
+
+    result_df = _compact_mapping(pd.DataFrame({
+        'grid_idx': rows,
+        'lat': grid_lat[rows],
+        'lon': grid_lon[rows],
+        cd_out: _take(found_cd),
+        nm_out: _take(found_nm),
+    }))
 
     null_count = result_df[cd_out].isna().sum()
     print(f"       매핑 성공: {len(result_df) - null_count:,}")
     print(f"       매핑 실패: {null_count:,}")
 
     os.makedirs(os.path.dirname(mapping_path), exist_ok=True)
-    result_df.to_parquet(mapping_path, index=False)
+    result_df.to_parquet(mapping_path, index=False, compression=MAPPING_PARQUET_COMPRESSION)
     print(f"       저장 완료: {mapping_path}")
 
     return result_df
@@ -243,14 +490,14 @@ class GridToHjdMapper:
 
     def build_mapping(self, force_rebuild: bool = False) -> pd.DataFrame:
         """격자 → 행정동 매핑 테이블 생성/로드."""
-        hjd_gdf = _load_shapefiles(
-            self.config.geodata_hjd_dir,
-            glob_pattern=os.path.join("bnd_dong*", "*.shp"),
-            label="행정동",
-        )
+        # 경계 shapefile은 매핑 파일을 새로 만들 때만 읽음 (기존 매핑 재사용 시 로드 생략)
         self._mapping_df = _build_mapping(
             config=self.config,
-            polygon_gdf=hjd_gdf,
+            load_polygons=lambda: _load_shapefiles(
+                self.config.geodata_hjd_dir,
+                glob_pattern=os.path.join("bnd_dong*", "*.shp"),
+                label="행정동",
+            ),
             cd_candidates=['adm_cd', 'ADSTRD_CD', 'HJD_CD', 'ADM_CD', 'ADMD_CD'],
             nm_candidates=['adm_nm', 'ADSTRD_NM', 'HJD_NM', 'ADM_NM', 'ADMD_NM'],
             cd_out='HJD_CD',
@@ -261,14 +508,20 @@ class GridToHjdMapper:
         )
         return self._mapping_df
 
-    def load_mapping(self) -> pd.DataFrame:
-        """저장된 행정동 매핑 테이블 로드."""
+    def load_mapping(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """저장된 행정동 매핑 테이블 로드.
+
+        Args:
+            columns: 필요한 컬럼만 읽을 때 지정 (예: ['grid_idx', ...]). 지정하면 캐시하지 않음.
+        """
         if self._mapping_df is not None:
-            return self._mapping_df
+            return self._mapping_df if columns is None else self._mapping_df[list(columns)]
 
         path = self.config.grid_hjd_mapping_file
         if os.path.exists(path):
-            self._mapping_df = pd.read_parquet(path)
+            if columns is not None:
+                return _read_mapping_parquet(path, columns)
+            self._mapping_df = _read_mapping_parquet(path)
             return self._mapping_df
         else:
             raise FileNotFoundError(
@@ -304,14 +557,14 @@ class GridToBjdMapper:
 
     def build_mapping(self, force_rebuild: bool = False) -> pd.DataFrame:
         """격자 → 법정동 매핑 테이블 생성/로드."""
-        bjd_gdf = _load_shapefiles(
-            self.config.geodata_umd_dir,
-            glob_pattern=os.path.join("LSMD_ADM_SECT_UMD_*", "*.shp"),
-            label="법정동",
-        )
+        # 경계 shapefile은 매핑 파일을 새로 만들 때만 읽음 (기존 매핑 재사용 시 로드 생략)
         self._mapping_df = _build_mapping(
             config=self.config,
-            polygon_gdf=bjd_gdf,
+            load_polygons=lambda: _load_shapefiles(
+                self.config.geodata_umd_dir,
+                glob_pattern=os.path.join("LSMD_ADM_SECT_UMD_*", "*.shp"),
+                label="법정동",
+            ),
             cd_candidates=['EMD_CD', 'emd_cd', 'ADM_CD', 'BJDONG_CD'],
             nm_candidates=['EMD_NM', 'emd_nm', 'ADM_NM', 'BJDONG_NM'],
             cd_out='EMD_CD',
@@ -322,14 +575,20 @@ class GridToBjdMapper:
         )
         return self._mapping_df
 
-    def load_mapping(self) -> pd.DataFrame:
-        """저장된 법정동 매핑 테이블 로드."""
+    def load_mapping(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """저장된 법정동 매핑 테이블 로드.
+
+        Args:
+            columns: 필요한 컬럼만 읽을 때 지정 (예: ['grid_idx', ...]). 지정하면 캐시하지 않음.
+        """
         if self._mapping_df is not None:
-            return self._mapping_df
+            return self._mapping_df if columns is None else self._mapping_df[list(columns)]
 
         path = self.config.grid_bjd_mapping_file
         if os.path.exists(path):
-            self._mapping_df = pd.read_parquet(path)
+            if columns is not None:
+                return _read_mapping_parquet(path, columns)
+            self._mapping_df = _read_mapping_parquet(path)
             return self._mapping_df
         else:
             raise FileNotFoundError(
@@ -351,7 +610,7 @@ def build_unified_mapping(
 
     if not force_rebuild and os.path.exists(unified_path):
         print(f"기존 통합 매핑 파일 로드: {unified_path}")
-        return pd.read_parquet(unified_path)
+        return _read_mapping_parquet(unified_path)
 
     print("통합 매핑 테이블(HJD+BJD) 생성 중...")
 
@@ -368,8 +627,10 @@ def build_unified_mapping(
         how='outer',
     )
 
+    unified = _compact_mapping(unified)
+
     os.makedirs(os.path.dirname(unified_path), exist_ok=True)
-    unified.to_parquet(unified_path, index=False)
+    unified.to_parquet(unified_path, index=False, compression=MAPPING_PARQUET_COMPRESSION)
 
     both_valid = unified['HJD_CD'].notna() & unified['EMD_CD'].notna()
     print(f"       통합 매핑 완료: {both_valid.sum():,} 격자점 (양쪽 모두 매핑)")
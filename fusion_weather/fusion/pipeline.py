@@ -4,19 +4,160 @@
 다운로드 → 파싱 → 시간 집계 → 공간 집계(행정동/법정동) → 출력
 """
 
+import logging
+import multiprocessing
+import json
 import os
+import pickle
+import sys
+import random
+import re
+import shutil
+import tempfile
+import warnings
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, List, Dict, Iterator, Union
 import time
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from tqdm import tqdm
 
-from .config import FusionConfig, DEFAULT_CONFIG
+from .config import FusionConfig, DEFAULT_CONFIG, hourly_columns
 from .geocode import GridToHjdMapper, GridToBjdMapper, build_unified_mapping
 from .download import FusionDataDownloader
-from .aggregate import TimeAggregator, SpatialAggregator, OutputFormatter
+from .aggregate import (
+    TimeAggregator, SpatialAggregator, OutputFormatter, StreamingCsvWriter, StreamingParquetWriter,
+)
+
+logger = logging.getLogger(__name__)
+
+# 중간 결과 parquet 스키마 메타데이터에 집계 조건을 기록하는 키 (_save_interim / _read_fresh_interim)
+_INTERIM_META_KEY = b'fusion_weather.interim'
+
+
+# 격자 응답의 주석/헤더 라인 (`#`으로 시작, 앞쪽 공백 허용)
+_COMMENT_LINE_RE = re.compile(r"^[ \t\r]*#[^\n]*", re.M)
+_COMMENT_LINE_BYTES_RE = re.compile(rb"^[ \t\r]*#[^\n]*", re.M)
+
+# 다운로드 시각 목록 (import 시 한 번만 생성): 1시간 간격 / 적설 3시간 간격, tm 접미사(HHmm)
+_HOURS_1H = tuple(range(24))
+_HOURS_3H = tuple(range(0, 24, 3))
+_TM_SUFFIX = tuple(f"{h:02d}00" for h in range(24))
+
+
+@lru_cache(maxsize=4)
+def _read_expected_grid_n_from_nc(nc_path: str) -> Optional[int]:
+    """NetCDF 격자 파일의 격자점 수(ny*nx). 헤더(차원 정보)만 읽고 결과는 경로별로 캐시."""
+    try:
+        import netCDF4
+
+        with netCDF4.Dataset(nc_path) as ds:
+            dims = ds.dimensions
+            if "ny" in dims and "nx" in dims:
+                return int(dims["ny"].size) * int(dims["nx"].size)
+            if "lat" in ds.variables:
+                lat = ds.variables["lat"]
+                # 1차원 위경도 축이면 격자점 수는 lat × lon (geocode._load_grid_coordinates와 동일)
+                if lat.ndim == 1 and "lon" in ds.variables and ds.variables["lon"].ndim == 1:
+                    return int(lat.size) * int(ds.variables["lon"].size)
+                return int(lat.size)
+    except Exception:
+        return None
+    return None
+
+
+def _response_preview(response) -> Optional[str]:
+    """검증 로그용 응답 미리보기 (텍스트 응답의 앞 500자, bytes 응답은 앞 500바이트만 디코딩)"""
+    if isinstance(response, bytes):
+        return response[:500].decode("utf-8", errors="replace")
+    return response[:500] if isinstance(response, str) else None
+
+
+def _head_tail_lines(text: str, n: int) -> tuple:
+    """텍스트의 앞 n줄, 뒤 n줄(전체가 n줄 이하면 빈 리스트), 전체 줄 수.
+
+    `text.splitlines()` 없이 개행 위치 검색(find/rfind)과 count로 계산합니다.
+    """
+    total = text.count("\n") + (0 if not text or text.endswith("\n") else 1)
+
+    end = -1
+    for _ in range(n):
+        end = text.find("\n", end + 1)
+        if end < 0:
+            break
+    head = (text if end < 0 else text[:end + 1]).splitlines()[:n]
+
+    tail: List[str] = []
+    if total > n:
+        start = len(text) - 1 if text.endswith("\n") else len(text)
+        for _ in range(n):
+            start = text.rfind("\n", 0, start)
+            if start < 0:
+                break
+        tail = text[start + 1:].splitlines()[-n:]
+    return head, tail, total
+
+
+def _raw_cache_path(raw_dir: str, var: str, date: str) -> str:
+    """raw 일별 캐시 파일 경로 `{raw_dir}/{var}_{date}_parsed.parquet`"""
+    return f"{raw_dir}{os.sep}{var}_{date}_parsed.parquet"
+
+
+@dataclass(frozen=True)
+class VarMeta:
+    """변수별 고정 메타데이터 (config.variables 항목에서 한 번만 계산)"""
+    col_prefix: str
+    is_3hourly: bool
+    hours: int
+    hourly_agg: str
+
+    @classmethod
+    def from_config(cls, var: str, info: Dict) -> "VarMeta":
+        """config.variables 항목 → VarMeta (설정에 없는 키는 기본값)"""
+        hours = info.get('hours', 24)
+        return cls(
+            col_prefix=info.get('col_prefix', var[0]),
+            is_3hourly=hours == 8,
+            hours=hours,
+            hourly_agg=info.get('hourly_agg', 'mean'),
+        )
+
+
+def _read_raw_day_arrays(cache_path: str) -> Dict[str, np.ndarray]:
+    """raw 일별 캐시에서 grid_idx/hour/value 컬럼만 NumPy 배열로 읽음 (DataFrame 생성 없음).
+
+    `date` 컬럼은 파일명 날짜와 같은 값 하나뿐이므로 읽지 않습니다(예전 캐시는 문자열 반복 컬럼).
+    파일은 메모리 맵으로 읽고, 컬럼마다 청크를 하나로 합쳐 연속 배열로 변환합니다.
+    """
+    table = pq.read_table(cache_path, columns=['grid_idx', 'hour', 'value'], memory_map=True)
+    return {
+        name: table.column(name).combine_chunks().to_numpy(zero_copy_only=False)
+        for name in ('grid_idx', 'hour', 'value')
+    }
+
+
+def _raw_day_frame(arrays: Dict[str, np.ndarray], date: str) -> pd.DataFrame:
+    """grid_idx/hour/value 배열 → raw 일별 DataFrame (date는 1바이트 코드의 카테고리 컬럼)"""
+    n = len(arrays['grid_idx'])
+    return pd.DataFrame({
+        'grid_idx': arrays['grid_idx'],
+        'date': pd.Categorical.from_codes(np.zeros(n, dtype=np.int8), categories=[date]),
+        'hour': arrays['hour'],
+        'value': arrays['value'],
+    })
+
+
+def _read_raw_day_cache(cache_path: str, date: str) -> pd.DataFrame:
+    """raw 일별 캐시(`{var}_{date}_parsed.parquet`) 로드."""
+    return _raw_day_frame(_read_raw_day_arrays(cache_path), date)
 
 
 class FusionPipeline:
@@ -36,15 +177,111 @@ class FusionPipeline:
         self.time_agg = TimeAggregator(self.config)
         self.formatter = OutputFormatter(self.config)
 
+        # raw 캐시 루트와 연월별 폴더 경로 캐시 (날짜/변수 루프에서 경로 조합 반복 방지)
+        self._raw_root = self.config.fusion_raw_dir
+        self._raw_dirs: Dict[str, str] = {}
+        # 이미 생성을 확인한 폴더 (스니펫/캐시/중간 결과 저장 시 makedirs 반복 방지)
+        self._ensured_dirs: set = set()
+
+        # 변수별 고정 메타데이터: {var: VarMeta}
+        self._var_meta: Dict[str, VarMeta] = {
+            var: VarMeta.from_config(var, info) for var, info in self.config.variables.items()
+        }
+
+        # 날짜(연월)별 변수 필터 결과 캐시: {(YYYYMM, variables): (var_list, 안내 메시지)}
+        self._var_filter_cache: Dict[tuple, tuple] = {}
+
         # region_type별 매핑/집계 캐시: {'hjd': (mapping_df, SpatialAggregator), ...}
         self._region_cache: Dict[str, tuple] = {}
-
-        # 다운로드/파싱 단계에서만 필요할 때 사용할 “기대 격자 수” 캐시.
-        # - 후처리(공간집계)에서는 매핑 테이블이 필요하지만,
-        # - 다운로드 전용(A 단계)에서는 매핑 테이블 전체(4.2M)를 매번 로드하는 것이 부담이므로
-        #   NetCDF 차원(ny*nx)에서 기대 격자 수를 빠르게 계산해 Strict 검증에 사용합니다.
-        self._expected_grid_n: Optional[int] = None
     
+    def close(self) -> None:
+        """다운로더의 HTTP 세션/검증 로그 파일 정리."""
+        self.downloader.close()
+
+    def __enter__(self) -> "FusionPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _ensure_dir(self, path: str) -> None:
+        """폴더 생성 (이 파이프라인에서 이미 만든 폴더는 makedirs를 다시 호출하지 않음)"""
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+
+    def _output_ext(self) -> str:
+        """월/연도별 결과 파일 확장자 (config.output_format: csv 또는 parquet)"""
+        fmt = str(getattr(self.config, "output_format", "csv") or "csv").lower()
+        if fmt not in ("csv", "parquet"):
+            raise ValueError(f"지원하지 않는 output_format: {fmt} (csv 또는 parquet)")
+        return fmt
+
+    def _output_columns(self, variables: List[str], region_type: str) -> List[str]:
+        """월/연도별 결과 파일 컬럼: date + 요청 변수의 시간대 컬럼 전체 + 지역코드 (merge_variables 순서)"""
+        _, spatial_agg = self._get_region(region_type)
+        value_cols = []
+        for var in variables:
+            meta = self._get_var_meta(var)
+            value_cols.extend(hourly_columns(meta.col_prefix, meta.hours))
+        empty = pd.DataFrame(columns=['date'] + value_cols + spatial_agg.id_cols)
+        return list(self.formatter.merge_variables({'': empty}).columns)
+
+    @staticmethod
+    def _open_output_writer(output_path: str, columns: Optional[List[str]] = None) -> StreamingCsvWriter:
+        """결과 파일 확장자에 맞는 스트리밍 writer (columns: 고정 출력 컬럼, `_output_columns`)"""
+        if output_path.endswith(".parquet"):
+            return StreamingParquetWriter(output_path, columns)
+        return StreamingCsvWriter(output_path, columns)
+
+    def _raw_dir(self, date: str) -> str:
+        """raw 캐시 폴더 `fusion_raw/YYYY/MM` (연월별로 한 번만 조합)"""
+        key = date[:6]
+        raw_dir = self._raw_dirs.get(key)
+        if raw_dir is None:
+            raw_dir = self._raw_dirs[key] = os.path.join(self._raw_root, date[:4], date[4:6])
+        return raw_dir
+
+    def _get_var_meta(self, var: str) -> VarMeta:
+        """변수 메타데이터. 설정에 없는 변수는 기본값."""
+        meta = self._var_meta.get(var)
+        if meta is None:
+            meta = self._var_meta[var] = VarMeta.from_config(var, self.config.variables.get(var, {}))
+        return meta
+
+    def _filter_variables_for_date(
+        self,
+        date: str,
+        variables: List[str],
+        verbose: bool = False,
+    ) -> List[str]:
+        """해당 날짜에 생산되지 않는 변수(적설 sd_3hr)를 제외한 변수 목록.
+
+        - snow_start_year 이전 연도, 여름철(6~9월)에는 적설 제외
+        - 결과는 (연월, 변수 목록)별로 캐시 (한 달 동안 같은 판단을 반복하지 않음)
+        """
+        key = (date[:6], tuple(variables))
+        cached = self._var_filter_cache.get(key)
+        if cached is None:
+            var_list = list(variables)
+            messages: List[str] = []
+            if 'sd_3hr' in var_list:
+                int_year = int(date[:4])
+                int_month = int(date[4:6])
+                if int_year < self.config.snow_start_year:
+                    messages.append(f"  적설 데이터는 {self.config.snow_start_year}년부터 제공됩니다.")
+                if int_month in (6, 7, 8, 9):
+                    messages.append(f"  여름철({int_month}월)에는 적설 데이터가 생산되지 않습니다.")
+                if messages:
+                    var_list = [v for v in var_list if v != 'sd_3hr']
+            cached = self._var_filter_cache[key] = (var_list, messages)
+
+        var_list, messages = cached
+        if verbose:
+            for message in messages:
+                print(message)
+        return list(var_list)
+
     def ensure_mapping(self, region_type: str = 'hjd', force_rebuild: bool = False):
         """격자-지역 매핑 테이블 확보 (hjd, bjd, both)"""
         if region_type not in self._region_cache or force_rebuild:
@@ -62,6 +299,56 @@ class FusionPipeline:
             spatial_agg = SpatialAggregator(mapping_df, self.config)
             self._region_cache[region_type] = (mapping_df, spatial_agg)
 
+    @contextmanager
+    def _shared_regions(self, region_type: str):
+        """날짜 단위 프로세스 풀 워커에 넘길 매핑을 준비해 {region_type: 매핑}으로 넘겨줌 (`_init_day_worker`용).
+
+        - fork(Linux): 부모의 (mapping_df, SpatialAggregator)를 그대로 넘김. 워커는 fork로 물려받은
+          메모리를 copy-on-write로 읽기만 하므로 매핑, LUT, 소속 행렬(CSR)은 워커 수와 관계없이 한 벌.
+          소속 행렬은 워커마다 만들지 않도록 여기서 미리 생성.
+        - spawn/forkserver: 집계에 필요한 grid_idx + 지역 코드 컬럼만 임시 Arrow IPC(무압축) 파일로 내려 두고
+          경로를 넘김. 워커는 `_load_region_ipc`로 메모리 맵해 읽으므로 매핑 컬럼은 페이지 캐시를 공유하지만,
+          LUT/소속 행렬은 워커마다 따로 만듦. 블록을 벗어나면 임시 파일을 삭제하므로 워커 풀은 이 블록 안에서
+          종료해야 합니다.
+        """
+        mapping_df, spatial_agg = self._get_region(region_type)
+        context = _day_pool_context()
+        if context is not None and context.get_start_method() == 'fork':
+            n_grid = self._get_expected_grid_n()
+            if n_grid and spatial_agg._code_lut is not None:
+                spatial_agg._get_group_matrix(n_grid)
+            yield {region_type: (mapping_df, spatial_agg)}
+            return
+
+        tmp_dir = tempfile.mkdtemp(prefix='fusion_region_')
+        try:
+            path = os.path.join(tmp_dir, f"{region_type}.arrow")
+            columns = ['grid_idx'] + list(spatial_agg.id_cols)
+            table = pa.Table.from_pandas(mapping_df[columns], preserve_index=False)
+            with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+            del table
+            yield {region_type: path}
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _load_region_ipc(self, region_type: str, path: str) -> None:
+        """`_shared_regions`가 만든 IPC 파일을 메모리 맵으로 읽어 region 캐시에 등록"""
+        table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+        mapping_df = table.to_pandas(split_blocks=True)
+        self._region_cache[region_type] = (mapping_df, SpatialAggregator(mapping_df, self.config))
+
+    @contextmanager
+    def _day_pool(self, region_type: str, max_workers: int):
+        """날짜 단위 후처리 프로세스 풀 (워커당 FusionPipeline 하나, 매핑은 `_shared_regions`로 공유)"""
+        with self._shared_regions(region_type) as shared_regions, ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=_day_pool_context(),
+            initializer=_init_day_worker,
+            initargs=(self.auth_key, self.config, shared_regions),
+        ) as ex:
+            yield ex
+
     def _get_region(self, region_type: str):
         """캐시된 (mapping_df, spatial_agg) 반환."""
         if region_type not in self._region_cache:
@@ -72,39 +359,23 @@ class FusionPipeline:
         """격자 API 응답의 기대 값 개수(N)를 반환.
 
         우선순위:
-        1) 이미 매핑 테이블이 로드되어 있으면 `len(self._grid_mapping)` 사용
-        2) 아니면 NetCDF(`sfc_grid_latlon.nc`)의 차원/변수 크기에서 계산(ny*nx 또는 lat.size)
+        1) NetCDF(`sfc_grid_latlon.nc`)의 차원/변수 크기에서 계산(ny*nx) — 경로별로 프로세스당 한 번만 읽음
+        2) NetCDF가 없고 매핑 테이블이 이미 로드되어 있으면 `grid_idx` 최대값 + 1 사용
 
         목적:
-        - A(다운로드 전용) 단계에서 매핑 테이블 전체 로드 없이도 Strict 파싱 검증을 할 수 있게 함.
+        - A(다운로드 전용) 단계에서 매핑 테이블 전체(4.2M) 로드 없이도 Strict 파싱 검증을 할 수 있게 함.
         """
-        if self._grid_mapping is not None:
-            return len(self._grid_mapping)
-
-        if self._expected_grid_n is not None:
-            return self._expected_grid_n
-
         nc_path = getattr(self.config, "grid_latlon_nc", None)
-        if not nc_path or not os.path.exists(nc_path):
-            return None
+        if nc_path and os.path.exists(nc_path):
+            n = _read_expected_grid_n_from_nc(nc_path)
+            if n is not None:
+                return n
 
-        try:
-            import xarray as xr
-
-            with xr.open_dataset(nc_path) as ds:
-                sizes = dict(getattr(ds, "sizes", {}))
-                if "ny" in sizes and "nx" in sizes:
-                    n = int(sizes["ny"]) * int(sizes["nx"])
-                elif "lat" in ds:
-                    # ds['lat'].size는 데이터를 실제로 로드하지 않고 shape로부터 계산됩니다.
-                    n = int(ds["lat"].size)
-                else:
-                    return None
+        for mapping_df, _ in self._region_cache.values():
+            if 'grid_idx' in mapping_df.columns and len(mapping_df):
+                return int(mapping_df['grid_idx'].max()) + 1
 
-            self._expected_grid_n = n
-            return n
-        except Exception:
-            return None
+        return None
 
     def ensure_day_cache(
         self,
@@ -122,30 +393,27 @@ class FusionPipeline:
               "failed": {var: "error message"}
             }
         """
-        year = date[:4]
-        month = date[4:6]
-
         # 적설 데이터 가능 여부 확인(기존 process_day와 동일한 정책)
-        var_list = list(variables)
-        if "sd_3hr" in var_list:
-            int_year = int(year)
-            int_month = int(month)
-            if int_year < self.config.snow_start_year:
-                var_list = [v for v in var_list if v != "sd_3hr"]
-            if int_month in [6, 7, 8, 9]:
-                var_list = [v for v in var_list if v != "sd_3hr"]
+        var_list = self._filter_variables_for_date(date, variables)
 
-        raw_dir = os.path.join(self.config.fusion_raw_dir, year, month)
+        raw_dir = self._raw_dir(date)
 
         ok: Dict[str, str] = {}
         failed: Dict[str, str] = {}
-        for var in var_list:
-            cache_path = os.path.join(raw_dir, f"{var}_{date}_parsed.parquet")
-            try:
-                self._load_or_download_day(date, var, raw_dir)
-                ok[var] = cache_path
-            except Exception as e:
-                failed[var] = f"{type(e).__name__}: {e}"
+        if not var_list:
+            return {"ok": ok, "failed": failed}
+
+        # 변수 간 데이터 의존성이 없으므로 변수별 다운로드를 동시에 진행 (시간 단위 병렬과 중첩)
+        n_workers = max(1, min(len(var_list), int(getattr(self.config, "variable_workers", 1))))
+        with ThreadPoolExecutor(max_workers=n_workers) as ex:
+            futures = {var: ex.submit(self._load_or_download_day, date, var, raw_dir) for var in var_list}
+            for var, fut in futures.items():
+                cache_path = _raw_cache_path(raw_dir, var, date)
+                try:
+                    fut.result()
+                    ok[var] = cache_path
+                except Exception as e:
+                    failed[var] = f"{type(e).__name__}: {e}"
 
         return {"ok": ok, "failed": failed}
 
@@ -172,73 +440,144 @@ class FusionPipeline:
         mapping_df, spatial_agg = self._get_region(region_type)
 
         year = date[:4]
-        month = date[4:6]
 
         # 적설 데이터 가능 여부 확인(기존 process_day와 동일한 정책)
-        var_list = list(variables)
-        if "sd_3hr" in var_list:
-            int_year = int(year)
-            int_month = int(month)
-            if int_year < self.config.snow_start_year:
-                var_list = [v for v in var_list if v != "sd_3hr"]
-            if int_month in [6, 7, 8, 9]:
-                var_list = [v for v in var_list if v != "sd_3hr"]
-
-        raw_dir = os.path.join(self.config.fusion_raw_dir, year, month)
-        results: Dict[str, pd.DataFrame] = {}
+        var_list = self._filter_variables_for_date(date, variables)
 
-        for var in var_list:
-            var_info = self.config.variables.get(var, {})
-            col_prefix = var_info.get("col_prefix", var[0])
-            is_3hourly = var_info.get("hours", 24) == 8
+        raw_dir = self._raw_dir(date)
+        day_arrays: Dict[str, Dict[str, np.ndarray]] = {}
 
-            cache_path = os.path.join(raw_dir, f"{var}_{date}_parsed.parquet")
+        for var in var_list:
+            cache_path = _raw_cache_path(raw_dir, var, date)
             if not os.path.exists(cache_path):
                 # B 정책: 누락은 스킵 (상위 스크립트에서 요약)
                 continue
 
-            df_raw = pd.read_parquet(cache_path)
-            if df_raw is None or len(df_raw) == 0:
+            # DataFrame을 거치지 않고 배열로 바로 읽어 집계 (배치가 맞지 않을 때만 DataFrame으로 피벗)
+            arrays = _read_raw_day_arrays(cache_path)
+            if len(arrays['value']) == 0:
                 continue
+            day_arrays[var] = arrays
 
-            df_hourly = df_raw
-
-            # 피벗 (시간 → 컬럼)
-            df_pivot = self.time_agg.pivot_hourly_to_columns(
-                df_hourly,
-                var_col="value",
-                col_prefix=col_prefix,
-                is_3hourly=is_3hourly,
-            )
+        # 피벗 (시간 → 컬럼) + 공간 집계 (격자 → 지역) + 변수 병합
+        final_df = self._aggregate_day_vars(day_arrays, date, spatial_agg)
 
-            # 공간 집계 (격자 → 지역)
-            value_cols = [c for c in df_pivot.columns if c.startswith(col_prefix)]
-            df_agg = spatial_agg.aggregate_grid_to_region(
-                df_pivot,
-                value_cols=value_cols,
-                method="mean",
-            )
-            results[var] = df_agg
-
-        if not results:
+        if final_df is None:
             return pd.DataFrame()
 
-        final_df = self.formatter.merge_variables(results)
-
         if save_interim:
             interim_dir = os.path.join(self.config.fusion_interim_dir, year)
-            os.makedirs(interim_dir, exist_ok=True)
+            self._ensure_dir(interim_dir)
             interim_path = os.path.join(interim_dir, f"fusion_{date}_{region_type}.parquet")
-            final_df.to_parquet(interim_path, index=False)
+            self._save_interim(final_df, interim_path, var_list, region_type)
 
         return final_df
 
+    def _aggregate_day_vars(
+        self,
+        day_arrays: Dict[str, Dict[str, np.ndarray]],
+        date: str,
+        spatial_agg: SpatialAggregator,
+    ) -> Optional[pd.DataFrame]:
+        """변수별 raw 배열 → 변수를 병합한 지역별 시간대 평균 (변수가 없으면 None).
+
+        모든 변수가 raw 캐시 배치 그대로면 변수별 (격자 × 시간대) 배열을 가로로 이어 붙여
+        희소 행렬 집계를 한 번만 수행합니다 (변수별 집계 후 merge_variables로 외부 조인한 결과와 같음).
+        아니면 변수별로 집계해 merge_variables로 병합합니다.
+        """
+        if len(day_arrays) > 1:
+            matrices = []
+            for var, arrays in day_arrays.items():
+                meta = self._get_var_meta(var)
+                matrix = self.time_agg.hourly_matrix(
+                    arrays['grid_idx'], arrays['hour'], arrays['value'], meta.col_prefix, is_3hourly=meta.is_3hourly,
+                )
+                if matrix is None:
+                    break
+                matrices.append(matrix)
+            else:
+                value_cols = [c for _, cols in matrices for c in cols]
+                if (
+                    len({values.shape[0] for values, _ in matrices}) == 1
+                    and len(set(value_cols)) == len(value_cols)
+                ):
+                    values = np.hstack([values for values, _ in matrices])
+                    df_agg = spatial_agg.aggregate_hourly_matrix(values, value_cols, date)
+                    if df_agg is not None:
+                        # 변수 하나짜리 merge_variables와 같은 컬럼 순서로 정렬
+                        return self.formatter.merge_variables({'': df_agg})
+
+        results: Dict[str, pd.DataFrame] = {}
+        for var, arrays in day_arrays.items():
+            meta = self._get_var_meta(var)
+            results[var] = self._aggregate_day_arrays(arrays, date, meta.col_prefix, meta.is_3hourly, spatial_agg)
+        if not results:
+            return None
+        return self.formatter.merge_variables(results)
+
+    def _aggregate_day_arrays(
+        self,
+        arrays: Dict[str, np.ndarray],
+        date: str,
+        col_prefix: str,
+        is_3hourly: bool,
+        spatial_agg: SpatialAggregator,
+    ) -> pd.DataFrame:
+        """하루치 raw 배열(grid_idx, hour, value) → 지역별 시간대 평균.
+
+        raw 캐시 배치 그대로면 (격자 × 시간대) 배열을 희소 행렬로 바로 집계하고(피벗 생략),
+        그렇지 않으면 피벗 후 aggregate_grid_to_region(mean)을 사용합니다. 두 경로의 결과는 같습니다.
+        """
+        df_agg = self._aggregate_day_matrix(arrays, date, col_prefix, is_3hourly, spatial_agg)
+        if df_agg is not None:
+            return df_agg
+        return self._pivot_and_aggregate(_raw_day_frame(arrays, date), col_prefix, is_3hourly, spatial_agg)
+
+    def _aggregate_day_matrix(
+        self,
+        arrays: Dict[str, np.ndarray],
+        date: str,
+        col_prefix: str,
+        is_3hourly: bool,
+        spatial_agg: SpatialAggregator,
+    ) -> Optional[pd.DataFrame]:
+        """(격자 × 시간대) 배열 + 희소 행렬 집계. 배치/매핑 조건이 맞지 않으면 None"""
+        matrix = self.time_agg.hourly_matrix(
+            arrays['grid_idx'], arrays['hour'], arrays['value'], col_prefix, is_3hourly=is_3hourly,
+        )
+        if matrix is None:
+            return None
+        values, value_cols = matrix
+        return spatial_agg.aggregate_hourly_matrix(values, value_cols, date)
+
+    def _pivot_and_aggregate(
+        self,
+        df_raw: pd.DataFrame,
+        col_prefix: str,
+        is_3hourly: bool,
+        spatial_agg: SpatialAggregator,
+    ) -> pd.DataFrame:
+        """피벗(시간 → 컬럼) 후 공간 집계(격자 → 지역, 평균)"""
+        df_pivot = self.time_agg.pivot_hourly_to_columns(
+            df_raw,
+            var_col='value',
+            col_prefix=col_prefix,
+            is_3hourly=is_3hourly,
+        )
+
+        value_cols = [c for c in df_pivot.columns if c.startswith(col_prefix)]
+        return spatial_agg.aggregate_grid_to_region(
+            df_pivot,
+            value_cols=value_cols,
+            method='mean',
+        )
+
     def _get_validation_log_path(self, date: str, var: str) -> str:
         """검증/다운로드 오류 로그 파일 경로 (`data/fusion_raw` 하위 txt)."""
         year = date[:4]
         month = date[4:6]
         log_dir = os.path.join(self.config.fusion_raw_dir, "_validation_logs", year, month)
-        os.makedirs(log_dir, exist_ok=True)
+        # 폴더는 첫 기록 시 downloader.validation_logs가 생성
         return os.path.join(log_dir, f"{date}_{var}.txt")
 
     def _append_validation_log(
@@ -262,35 +601,37 @@ class FusionPipeline:
         if exception is not None:
             lines.append(f"  exception: {type(exception).__name__}: {exception}")
         if response_preview:
-            lines.append("  response_preview: " + response_preview.replace("\n", " ")[:500])
+            lines.append("  response_preview: " + response_preview[:500].replace("\n", " "))
 
-        with open(path, "a", encoding="utf-8") as f:
-            f.write("\n".join(lines) + "\n")
+        # INFO(재시도 대기 안내 등)는 버퍼링, WARN/ERROR는 즉시 flush
+        self.downloader.validation_logs.write(path, "\n".join(lines) + "\n", flush=level != "INFO")
         return path
 
-    @staticmethod
     def _write_response_snippet(
+        self,
         *,
         raw_dir: str,
         var: str,
         tm: str,
-        response_text: Optional[str],
+        response_text: Union[str, bytes, None],
         exception: Optional[BaseException] = None,
     ) -> Optional[str]:
         """파싱/검증 실패 시 원문 전체를 저장하지 않고, 디버깅용 스니펫만 저장."""
         if response_text is None:
             return None
+        if isinstance(response_text, bytes):
+            # 다운로드 응답은 bytes로 전달되므로 실패 시에만 디코딩
+            response_text = response_text.decode("utf-8", errors="replace")
 
-        os.makedirs(raw_dir, exist_ok=True)
+        self._ensure_dir(raw_dir)
         path = os.path.join(raw_dir, f"{var}_{tm}_error_snippet.txt")
 
-        lines = response_text.splitlines()
-        head_lines = lines[:30]
-        tail_lines = lines[-30:] if len(lines) > 30 else []
+        # 응답 전체를 줄 리스트로 만들지 않고, 앞/뒤 30줄 위치만 찾아서 잘라냄 (큰 응답에서 메모리 절약)
+        head_lines, tail_lines, total_lines = _head_tail_lines(response_text, 30)
 
         with open(path, "w", encoding="utf-8") as f:
             f.write(f"tm={tm} var={var}\n")
-            f.write(f"total_chars={len(response_text):,} total_lines={len(lines):,}\n")
+            f.write(f"total_chars={len(response_text):,} total_lines={total_lines:,}\n")
             if exception is not None:
                 f.write(f"exception={type(exception).__name__}: {exception}\n")
             f.write("\n--- head (first 30 lines) ---\n")
@@ -324,71 +665,161 @@ class FusionPipeline:
         _, spatial_agg = self._get_region(region_type)
 
         year = date[:4]
-        month = date[4:6]
 
         # 적설 데이터 가능 여부 확인
-        if 'sd_3hr' in variables:
-            int_year = int(year)
-            int_month = int(month)
+        variables = self._filter_variables_for_date(date, variables, verbose=True)
 
-            if int_year < self.config.snow_start_year:
-                variables = [v for v in variables if v != 'sd_3hr']
-                print(f"  적설 데이터는 {self.config.snow_start_year}년부터 제공됩니다.")
+        interim_dir = os.path.join(self.config.fusion_interim_dir, year)
+        suffix = f"_{region_type}" if region_type != 'hjd' else ""
+        interim_path = os.path.join(interim_dir, f"fusion_{date}{suffix}.parquet")
 
-            if int_month in [6, 7, 8, 9]:
-                variables = [v for v in variables if v != 'sd_3hr']
-                print(f"  여름철({int_month}월)에는 적설 데이터가 생산되지 않습니다.")
+        # 재실행 시: 같은 변수 구성의 중간 결과가 매핑/raw 캐시보다 최신이면 집계 없이 그대로 사용
+        if save_interim:
+            cached = self._read_fresh_interim(interim_path, date, variables, region_type)
+            if cached is not None:
+                print(f"  중간 결과 재사용: {interim_path}")
+                return cached
 
-        results = {}
+        day_arrays: Dict[str, Dict[str, np.ndarray]] = {}
 
         for var in variables:
-            var_info = self.config.variables.get(var, {})
-            col_prefix = var_info.get('col_prefix', var[0])
-            is_3hourly = var_info.get('hours', 24) == 8
-
             print(f"  [{var}] 처리 중...")
 
-            raw_dir = os.path.join(self.config.fusion_raw_dir, year, month)
-            df_raw = self._load_or_download_day(date, var, raw_dir)
+            df_raw = self._load_or_download_day(date, var, self._raw_dir(date))
 
             if df_raw is None or len(df_raw) == 0:
                 print(f"    데이터 없음, 건너뜀")
                 continue
 
-            df_hourly = df_raw
+            day_arrays[var] = {name: df_raw[name].to_numpy() for name in ('grid_idx', 'hour', 'value')}
+            print(f"    로드 완료: {len(df_raw):,} 행")
 
-            df_pivot = self.time_agg.pivot_hourly_to_columns(
-                df_hourly,
-                var_col='value',
-                col_prefix=col_prefix,
-                is_3hourly=is_3hourly,
-            )
+        # 피벗 (시간 → 컬럼) + 공간 집계 (격자 → 지역) + 변수 병합, 가능하면 변수들을 한 번에 집계
+        final_df = self._aggregate_day_vars(day_arrays, date, spatial_agg)
 
-            value_cols = [c for c in df_pivot.columns if c.startswith(col_prefix)]
-            df_agg = spatial_agg.aggregate_grid_to_region(
-                df_pivot,
-                value_cols=value_cols,
-                method='mean',
-            )
-            
-            results[var] = df_agg
-            print(f"    완료: {len(df_agg)} 지역")
-
-        # 5. 변수 병합
-        if results:
-            final_df = self.formatter.merge_variables(results)
+        if final_df is not None:
+            print(f"  집계 완료: {len(final_df)} 지역")
 
             if save_interim:
-                interim_dir = os.path.join(self.config.fusion_interim_dir, year)
-                os.makedirs(interim_dir, exist_ok=True)
-                suffix = f"_{region_type}" if region_type != 'hjd' else ""
-                interim_path = os.path.join(interim_dir, f"fusion_{date}{suffix}.parquet")
-                final_df.to_parquet(interim_path, index=False)
+                self._ensure_dir(interim_dir)
+                self._save_interim(final_df, interim_path, variables, region_type)
 
             return final_df
 
         return pd.DataFrame()
+
+    def _interim_meta(self, variables: List[str], region_type: str) -> bytes:
+        """중간 결과 parquet에 함께 저장하는 집계 조건 (변수 구성, 집계 단위, 값 dtype)"""
+        value_dtype = getattr(self.config, "value_dtype", None) or np.float64
+        return json.dumps({
+            'variables': sorted(variables),
+            'region_type': region_type,
+            'value_dtype': np.dtype(value_dtype).name,
+        }).encode('utf-8')
+
+    def _save_interim(self, df: pd.DataFrame, interim_path: str, variables: List[str], region_type: str) -> None:
+        """중간 결과 저장 (재사용 판단용 집계 조건을 parquet 스키마 메타데이터에 기록)"""
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[_INTERIM_META_KEY] = self._interim_meta(variables, region_type)
+        pq.write_table(table.replace_schema_metadata(metadata), interim_path)
+
+    def _read_fresh_interim(
+        self,
+        interim_path: str,
+        date: str,
+        variables: List[str],
+        region_type: str,
+    ) -> Optional[pd.DataFrame]:
+        """process_day 중간 결과(parquet)를 재사용할 수 있으면 로드, 아니면 None.
+
+        - 저장 시 기록한 집계 조건(변수 구성, 집계 단위, value_dtype)이 현재 요청과 같을 때만 재사용
+        - 매핑 파일과 변수별 raw 캐시가 없거나 중간 결과보다 나중에 수정되었으면 재사용하지 않음
+        """
+        try:
+            interim_mtime = os.stat(interim_path).st_mtime_ns
+            stored = (pq.read_schema(interim_path).metadata or {}).get(_INTERIM_META_KEY)
+        except (OSError, pa.ArrowInvalid):
+            return None
+        if stored != self._interim_meta(variables, region_type):
+            return None
+
+        mapping_path = {
+            'hjd': self.config.grid_hjd_mapping_file,
+            'bjd': self.config.grid_bjd_mapping_file,
+            'both': self.config.grid_unified_mapping_file,
+        }.get(region_type)
+        raw_dir = self._raw_dir(date)
+        sources = [mapping_path] + [_raw_cache_path(raw_dir, var, date) for var in variables]
+        for path in sources:
+            try:
+                if os.stat(path).st_mtime_ns > interim_mtime:
+                    return None
+            except (OSError, TypeError):
+                return None
+
+        return pd.read_parquet(interim_path)
     
+    def _iter_month_days(
+        self,
+        year: int,
+        month: int,
+        variables: List[str],
+        region_type: str = 'hjd',
+        day_pool: Optional[ProcessPoolExecutor] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        한 달의 일별 집계 결과를 날짜순으로 하나씩 반환 (처리 실패/빈 날짜는 건너뜀)
+
+        day_pool: `_day_pool`로 연 프로세스 풀 (process_year처럼 여러 달에 재사용). 없으면
+            config.day_workers > 1일 때 이 달만을 위한 풀을 만듦
+        """
+        # 해당 월의 일수 계산
+        if month == 12:
+            next_month = datetime(year + 1, 1, 1)
+        else:
+            next_month = datetime(year, month + 1, 1)
+        
+        first_day = datetime(year, month, 1)
+        num_days = (next_month - first_day).days
+        
+        print(f"\n{'='*60}")
+        print(f"월별 처리: {year}년 {month}월 ({num_days}일)")
+        print(f"{'='*60}")
+        
+        dates = [f"{year}{month:02d}{day:02d}" for day in range(1, num_days + 1)]
+
+        day_workers = max(1, min(num_days, int(getattr(self.config, "day_workers", 1) or 1)))
+        with ExitStack() as stack:
+            if day_pool is None and day_workers > 1:
+                day_pool = stack.enter_context(self._day_pool(region_type, day_workers))
+
+            if day_pool is not None:
+                # 날짜별 처리는 서로 독립적이므로 프로세스 풀로 병렬 실행 (피벗/공간집계의 CPU 구간이 GIL에 묶이지 않음)
+                # - ex.map은 제출 순서대로 결과를 돌려주므로 날짜 순서는 순차 처리와 같음
+                tasks = [(date, variables, region_type) for date in dates]
+                for date, df, error in tqdm(
+                    day_pool.map(_process_day_worker, tasks), total=len(tasks), desc=f"{year}-{month:02d}"
+                ):
+                    if error is not None:
+                        print(f"\n  {date} 처리 실패: {error}")
+                        continue
+                    if len(df) > 0:
+                        yield df
+            else:
+                for date in tqdm(dates, desc=f"{year}-{month:02d}"):
+                    try:
+                        df = self.process_day(date, variables, save_interim=True, region_type=region_type)
+                    except Exception as e:
+                        print(f"\n  {date} 처리 실패: {e}")
+                        continue
+                    if len(df) > 0:
+                        yield df
+
+    def _month_output_path(self, year: int, month: int) -> str:
+        output_dir = os.path.join(self.config.fusion_output_dir, str(year))
+        return os.path.join(output_dir, f"fusion_{year}{month:02d}.{self._output_ext()}")
+
     def process_month(
         self,
         year: int,
@@ -410,44 +841,61 @@ class FusionPipeline:
         if variables is None:
             variables = ['ta', 'rn_60m']
         
-        # 해당 월의 일수 계산
-        if month == 12:
-            next_month = datetime(year + 1, 1, 1)
-        else:
-            next_month = datetime(year, month + 1, 1)
-        
-        first_day = datetime(year, month, 1)
-        num_days = (next_month - first_day).days
-        
-        print(f"\n{'='*60}")
-        print(f"월별 처리: {year}년 {month}월 ({num_days}일)")
-        print(f"{'='*60}")
-        
-        monthly_dfs = []
-        
-        for day in tqdm(range(1, num_days + 1), desc=f"{year}-{month:02d}"):
-            date = f"{year}{month:02d}{day:02d}"
-            try:
-                df = self.process_day(date, variables, save_interim=True, region_type=region_type)
-                if len(df) > 0:
-                    monthly_dfs.append(df)
-            except Exception as e:
-                print(f"\n  {date} 처리 실패: {e}")
-                continue
+        monthly_dfs = list(self._iter_month_days(year, month, variables, region_type=region_type))
         
         if monthly_dfs:
+            # 컬럼은 process_year(_stream_month)의 월별 파일과 같은 고정 구성 (이 달에 없는 시간대/변수 컬럼은 빈 값)
+            columns = self._output_columns(variables, region_type)
             result = pd.concat(monthly_dfs, ignore_index=True)
             
             # 월별 결과 저장
-            output_dir = os.path.join(self.config.fusion_output_dir, str(year))
-            os.makedirs(output_dir, exist_ok=True)
-            output_path = os.path.join(output_dir, f"fusion_{year}{month:02d}.csv")
-            result.to_csv(output_path, index=False, encoding='utf-8-sig')
+            output_path = self._month_output_path(year, month)
+            with self._open_output_writer(output_path, columns) as writer:
+                writer.append(result)
             print(f"\n저장 완료: {output_path}")
             
-            return result
+            return result.reindex(columns=columns)
         
         return pd.DataFrame()
+
+    def _stream_month(
+        self,
+        year: int,
+        month: int,
+        variables: List[str],
+        region_type: str,
+        year_writer: Union[StreamingCsvWriter, StreamingParquetWriter],
+        day_pool: Optional[ProcessPoolExecutor] = None,
+    ) -> int:
+        """
+        한 달 데이터를 처리해 일별 결과를 월별 파일에 바로 이어 쓰고, 달이 끝까지 처리되면
+        year_writer(연도별 파일)에도 추가 (실패한 달은 연도별 파일에 일부만 들어가지 않음)
+        
+        process_month와 달리 월별 DataFrame을 메모리에 모으지 않음 (최대 메모리: 월 → 일 단위)
+        day_pool: process_year가 연 단위로 한 번 띄운 프로세스 풀 (`_iter_month_days` 참고)
+        
+        Returns:
+            월별 파일에 기록한 행 수 (0이면 파일을 만들지 않음)
+        """
+        output_path = self._month_output_path(year, month)
+        # 일별 결과는 임시 파일에 모아 두었다가 월별 파일이 확정된 뒤에만 연도별 파일에 이어 씀
+        # (중간에 실패한 달은 월별/연도별 파일 어디에도 남지 않음, 메모리는 여전히 일 단위)
+        with tempfile.TemporaryFile(prefix='fusion_month_') as spool:
+            n_days = 0
+            # 중단/예외 시 기록 중인 월별 파일은 확정하지 않음 (writer의 __exit__에서 폐기)
+            with self._open_output_writer(output_path, year_writer.columns) as month_writer:
+                for df in self._iter_month_days(year, month, variables, region_type=region_type, day_pool=day_pool):
+                    month_writer.append(df)
+                    pickle.dump(df, spool, protocol=pickle.HIGHEST_PROTOCOL)
+                    n_days += 1
+                rows = month_writer.rows
+
+            spool.seek(0)
+            for _ in range(n_days):
+                year_writer.append(pickle.load(spool))
+        if rows > 0:
+            print(f"\n저장 완료: {output_path}")
+        return rows
     
     def process_year(
         self,
@@ -479,30 +927,40 @@ class FusionPipeline:
         print(f"변수: {variables}")
         print(f"{'#'*60}")
         
-        yearly_dfs = []
-        
-        for month in range(start_month, end_month + 1):
-            try:
-                df = self.process_month(year, month, variables, region_type=region_type)
-                if len(df) > 0:
-                    yearly_dfs.append(df)
-            except Exception as e:
-                print(f"\n{year}년 {month}월 처리 실패: {e}")
-                continue
-        
-        if yearly_dfs:
-            result = pd.concat(yearly_dfs, ignore_index=True)
-            
-            # 연도별 결과 저장
-            output_path = os.path.join(
-                self.config.fusion_output_dir,
-                f"fusion_weather_{year}.csv"
-            )
-            result.to_csv(output_path, index=False, encoding='utf-8-sig')
-            print(f"\n연도별 저장 완료: {output_path}")
-            print(f"총 레코드 수: {len(result):,}")
-            
-            return output_path
+        output_path = os.path.join(
+            self.config.fusion_output_dir,
+            f"fusion_weather_{year}.{self._output_ext()}"
+        )
+
+        # 일별 결과를 메모리에 모으지 않고 연도별 파일에 바로 이어 씀
+        # (최대 메모리: 연 단위 → 일 단위, 월별 파일도 _stream_month에서 같은 방식으로 기록)
+        # - day_workers > 1이면 프로세스 풀(과 워커에 넘길 매핑)은 연 단위로 한 번만 준비해 모든 달에 재사용
+        day_workers = max(1, int(getattr(self.config, "day_workers", 1) or 1))
+        with ExitStack() as pools, self._open_output_writer(
+            output_path, self._output_columns(variables, region_type)
+        ) as writer:
+            day_pool = pools.enter_context(self._day_pool(region_type, day_workers)) if day_workers > 1 else None
+            for month in range(start_month, end_month + 1):
+                try:
+                    self._stream_month(year, month, variables, region_type, year_writer=writer, day_pool=day_pool)
+                except BrokenProcessPool as e:
+                    print(f"\n{year}년 {month}월 처리 실패: {e}")
+                    # 워커가 비정상 종료된 풀은 다시 쓸 수 없으므로 다음 달을 위해 새로 띄움
+                    pools.close()
+                    day_pool = pools.enter_context(self._day_pool(region_type, day_workers))
+                    continue
+                except Exception as e:
+                    print(f"\n{year}년 {month}월 처리 실패: {e}")
+                    continue
+
+            if writer.rows > 0:
+                # 연도별 결과 저장
+                total_rows = writer.rows
+                writer.close()
+                print(f"\n연도별 저장 완료: {output_path}")
+                print(f"총 레코드 수: {total_rows:,}")
+
+                return output_path
         
         return ""
     
@@ -550,177 +1008,226 @@ class FusionPipeline:
         캐시된 파일이 있으면 로드, 없으면 API에서 다운로드
         """
         # 캐시 파일 확인
-        cache_path = os.path.join(raw_dir, f"{var}_{date}_parsed.parquet")
+        cache_path = _raw_cache_path(raw_dir, var, date)
         
         if os.path.exists(cache_path):
-            return pd.read_parquet(cache_path)
+            return _read_raw_day_cache(cache_path, date)
         
         # API 다운로드
-        var_info = self.config.variables.get(var, {})
-        is_3hourly = var_info.get('hours', 24) == 8
+        meta = self._get_var_meta(var)
         
-        # 시간 목록 생성
-        if is_3hourly:
-            # 적설: 3시간 간격 (00:00, 03:00, 06:00, ...)
-            hours = list(range(0, 24, 3))
-        else:
-            # 기온/강수: 1시간 간격
-            hours = list(range(24))
+        # 시간 목록 (적설: 3시간 간격 00, 03, 06, ... / 기온·강수: 1시간 간격)
+        hours = _HOURS_3H if meta.is_3hourly else _HOURS_1H
         
         expected_n = self._get_expected_grid_n()
-        all_data = []
+
+        # 시간대별 다운로드/파싱을 스레드로 동시에 수행 (네트워크 대기 시간 중첩)
+        # - 동시 요청 수/요청 후 대기(api_max_in_flight, api_sleep_seconds)는 downloader의 공유 limiter가 보장
+        # - 결과는 시간 순서대로 모읍니다.
+        workers = max(1, min(len(hours), int(getattr(self.config, "download_workers", 1))))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            futures = [
+                ex.submit(self._download_hour_values, date, var, hour, raw_dir, expected_n)
+                for hour in hours
+            ]
+            try:
+                hour_values = [fut.result() for fut in futures]
+            except BaseException:
+                # 한 시각이라도 최종 실패하면 이 날짜는 어차피 스킵되므로, 아직 시작하지 않은 요청은 취소
+                for fut in futures:
+                    fut.cancel()
+                raise
+
+        # 시간대 × 격자 2차원 배열을 미리 할당해 채운 뒤, 마지막에 평탄화해서 DataFrame을 한 번만 생성
+        # (시간대별 DataFrame 생성 + pd.concat 복사 제거)
+        n_grid = expected_n if expected_n else (len(hour_values[0]) if hour_values else 0)
+        value_dtype = getattr(self.config, "value_dtype", None) or np.float64
+        values = np.full((len(hours), n_grid), np.nan, dtype=value_dtype)
+        got = np.zeros(len(hours), dtype=bool)
+        for h_idx, grid_values in enumerate(hour_values):
+            if grid_values is None or len(grid_values) != n_grid:
+                continue
+            values[h_idx, :] = grid_values
+            got[h_idx] = True
+
+        # 시간대(컬럼) 누락 검증
+        if not got.all():
+            missing_hours = [h for h, ok in zip(hours, got) if not ok]
+            log_path = self._append_validation_log(
+                date=date,
+                var=var,
+                tm=f"{date}----",
+                level="ERROR",
+                message=f"시간대 누락: got={int(got.sum())}/{len(hours)} missing_hours={missing_hours}",
+            )
+            raise RuntimeError(f"시간대 누락: {date} {var}. validation_log={log_path}")
+
+        if n_grid:
+            total = len(hours) * n_grid
+            result = pd.DataFrame({
+                'grid_idx': np.tile(np.arange(n_grid, dtype=np.int32), len(hours)),
+                # 날짜는 하루 동안 하나뿐이므로 카테고리(코드 1바이트)로 보관
+                'date': pd.Categorical.from_codes(np.zeros(total, dtype=np.int8), categories=[date]),
+                'hour': np.repeat(np.asarray(hours, dtype=np.int8), n_grid),
+                'value': values.ravel(),
+            })
+            
+            # 캐시 저장
+            self._ensure_dir(raw_dir)
+            # (int32/int8/float32 컬럼 + 날짜는 dictionary 인코딩으로 저장)
+            compression = getattr(self.config, "raw_cache_compression", "zstd")
+            compression_level = getattr(self.config, "raw_cache_compression_level", None)
+            if not compression or not pa.Codec.supports_compression_level(compression):
+                # snappy 등 레벨 지정을 지원하지 않는 codec
+                compression_level = None
+            result.to_parquet(
+                cache_path,
+                index=False,
+                compression=compression,
+                compression_level=compression_level,
+            )
+            
+            return result
+        
+        return None
+    
+    def _download_hour_values(
+        self,
+        date: str,
+        var: str,
+        hour: int,
+        raw_dir: str,
+        expected_n: Optional[int],
+    ) -> np.ndarray:
+        """한 시각(tm)의 전체 격자를 다운로드/파싱/검증 (재시도 포함).
+
+        최종 실패 시 RuntimeError를 발생시킵니다 (상위 루프에서 날짜 스킵).
+        """
+        tm = date + _TM_SUFFIX[hour]
 
         retry_attempts = max(1, int(getattr(self.config, "download_retry_attempts", 1)))
         retry_initial_sleep = float(getattr(self.config, "download_retry_initial_sleep_seconds", 0.0))
         retry_backoff = float(getattr(self.config, "download_retry_backoff", 1.0))
+        retry_jitter = float(getattr(self.config, "download_retry_jitter", 0.0))
 
-        for hour in hours:
-            tm = f"{date}{hour:02d}00"
-
-            grid_values = None
-            last_log_path = None
-            last_exception: Optional[BaseException] = None
-            last_response_preview: Optional[str] = None
+        grid_values = None
+        last_log_path = None
+        last_exception: Optional[BaseException] = None
+        last_response_preview: Optional[str] = None
 
-            for attempt in range(1, retry_attempts + 1):
-                # API 호출
-                response = self.downloader.download_hour_all_grid(tm, var, save_dir=None, disp='A')
-                last_response_preview = response[:500] if isinstance(response, str) else None
+        for attempt in range(1, retry_attempts + 1):
+            # API 호출
+            response = self.downloader.download_hour_all_grid(tm, var, save_dir=None, disp='A')
+            # 응답 미리보기(앞 500자)는 실패 분기에서만 만듦 (성공 시 불필요한 슬라이스 복사 방지)
+            last_response_preview = None
 
-                if not response:
+            if not response:
+                last_log_path = self._append_validation_log(
+                    date=date,
+                    var=var,
+                    tm=tm,
+                    level="WARN" if attempt < retry_attempts else "ERROR",
+                    message=f"다운로드 실패/빈 응답 (attempt {attempt}/{retry_attempts})",
+                )
+            else:
+                # 응답 파싱 (Strict)
+                try:
+                    grid_values = self._parse_grid_response(response)
+                except Exception as e:
+                    last_exception = e
+                    last_response_preview = _response_preview(response)
+                    snippet_path = self._write_response_snippet(
+                        raw_dir=raw_dir,
+                        var=var,
+                        tm=tm,
+                        response_text=response,
+                        exception=e,
+                    )
                     last_log_path = self._append_validation_log(
                         date=date,
                         var=var,
                         tm=tm,
                         level="WARN" if attempt < retry_attempts else "ERROR",
-                        message=f"다운로드 실패/빈 응답 (attempt {attempt}/{retry_attempts})",
+                        message=f"파싱 실패(격자 개수/포맷 불일치 가능) (attempt {attempt}/{retry_attempts}). snippet={snippet_path}",
+                        exception=e,
+                        response_preview=last_response_preview,
                     )
                 else:
-                    # 응답 파싱 (Strict)
-                    try:
-                        grid_values = self._parse_grid_response(response)
-                    except Exception as e:
-                        last_exception = e
+                    if grid_values is None or len(grid_values) == 0:
+                        last_response_preview = _response_preview(response)
                         snippet_path = self._write_response_snippet(
                             raw_dir=raw_dir,
                             var=var,
                             tm=tm,
                             response_text=response,
-                            exception=e,
                         )
                         last_log_path = self._append_validation_log(
                             date=date,
                             var=var,
                             tm=tm,
                             level="WARN" if attempt < retry_attempts else "ERROR",
-                            message=f"파싱 실패(격자 개수/포맷 불일치 가능) (attempt {attempt}/{retry_attempts}). snippet={snippet_path}",
-                            exception=e,
+                            message=f"파싱 결과가 비어있음 (attempt {attempt}/{retry_attempts}). snippet={snippet_path}",
                             response_preview=last_response_preview,
                         )
-                    else:
-                        if grid_values is None or len(grid_values) == 0:
-                            snippet_path = self._write_response_snippet(
-                                raw_dir=raw_dir,
-                                var=var,
-                                tm=tm,
-                                response_text=response,
-                            )
-                            last_log_path = self._append_validation_log(
-                                date=date,
-                                var=var,
-                                tm=tm,
-                                level="WARN" if attempt < retry_attempts else "ERROR",
-                                message=f"파싱 결과가 비어있음 (attempt {attempt}/{retry_attempts}). snippet={snippet_path}",
-                                response_preview=last_response_preview,
-                            )
-                            grid_values = None
-                        elif expected_n is not None and len(grid_values) != expected_n:
-                            # 원칙적으로 `_parse_grid_response`에서 이미 걸러져야 하지만, 방어적으로 한 번 더 체크
-                            snippet_path = self._write_response_snippet(
-                                raw_dir=raw_dir,
-                                var=var,
-                                tm=tm,
-                                response_text=response,
-                            )
-                            last_log_path = self._append_validation_log(
-                                date=date,
-                                var=var,
-                                tm=tm,
-                                level="WARN" if attempt < retry_attempts else "ERROR",
-                                message=(
-                                    f"격자 길이 불일치: parsed={len(grid_values):,}, expected={expected_n:,} "
-                                    f"(attempt {attempt}/{retry_attempts}). snippet={snippet_path}"
-                                ),
-                                response_preview=last_response_preview,
-                            )
-                            grid_values = None
-
-                if grid_values is not None and len(grid_values) > 0:
-                    break
+                        grid_values = None
+                    elif expected_n is not None and len(grid_values) != expected_n:
+                        # 원칙적으로 `_parse_grid_response`에서 이미 걸러져야 하지만, 방어적으로 한 번 더 체크
+                        last_response_preview = _response_preview(response)
+                        snippet_path = self._write_response_snippet(
+                            raw_dir=raw_dir,
+                            var=var,
+                            tm=tm,
+                            response_text=response,
+                        )
+                        last_log_path = self._append_validation_log(
+                            date=date,
+                            var=var,
+                            tm=tm,
+                            level="WARN" if attempt < retry_attempts else "ERROR",
+                            message=(
+                                f"격자 길이 불일치: parsed={len(grid_values):,}, expected={expected_n:,} "
+                                f"(attempt {attempt}/{retry_attempts}). snippet={snippet_path}"
+                            ),
+                            response_preview=last_response_preview,
+                        )
+                        grid_values = None
 
-                if attempt < retry_attempts:
-                    sleep_seconds = retry_initial_sleep * (retry_backoff ** (attempt - 1))
-                    # 0초면 실질적으로 즉시 재시도(테스트/디버깅에서 유용)
-                    self._append_validation_log(
-                        date=date,
-                        var=var,
-                        tm=tm,
-                        level="INFO",
-                        message=f"재시도 대기: {sleep_seconds:.1f}s 후 재요청 (next_attempt {attempt + 1}/{retry_attempts})",
-                    )
-                    time.sleep(max(0.0, sleep_seconds))
+            if grid_values is not None and len(grid_values) > 0:
+                break
 
-            if grid_values is None or len(grid_values) == 0:
-                # 최종 실패: 상위 루프(process_month 등)에서 날짜를 건너뛰도록 예외 전파
-                final_log_path = self._append_validation_log(
+            if attempt < retry_attempts:
+                sleep_seconds = retry_initial_sleep * (retry_backoff ** (attempt - 1))
+                # 같은 장애 구간에서 실패한 스레드/워커들이 동시에 재요청하지 않도록 대기 시간을 무작위로 늘림
+                sleep_seconds *= 1.0 + random.uniform(0.0, max(0.0, retry_jitter))
+                # 0초면 실질적으로 즉시 재시도(테스트/디버깅에서 유용)
+                self._append_validation_log(
                     date=date,
                     var=var,
                     tm=tm,
-                    level="ERROR",
-                    message=(
-                        f"재시도 {retry_attempts}회 후에도 실패하여 날짜 스킵 대상입니다. "
-                        f"(상위 루프에서 continue) last_log={last_log_path}"
-                    ),
-                    exception=last_exception,
-                    response_preview=last_response_preview,
+                    level="INFO",
+                    message=f"재시도 대기: {sleep_seconds:.1f}s 후 재요청 (next_attempt {attempt + 1}/{retry_attempts})",
                 )
-                raise RuntimeError(f"다운로드/파싱 재시도 실패: {tm} {var}. validation_log={final_log_path}")
+                time.sleep(max(0.0, sleep_seconds))
 
-            df_hour = pd.DataFrame({
-                'grid_idx': range(len(grid_values)),
-                'date': date,
-                'hour': hour,
-                'value': grid_values,
-            })
-            all_data.append(df_hour)
-            
-            # API 호출 간격
-            time.sleep(self.config.api_sleep_seconds)
-        
-        # 시간대(컬럼) 누락 검증
-        if len(all_data) != len(hours):
-            missing_hours = sorted(set(hours) - set(df['hour'].iloc[0] for df in all_data))
-            log_path = self._append_validation_log(
+        if grid_values is None or len(grid_values) == 0:
+            # 최종 실패: 상위 루프(process_month 등)에서 날짜를 건너뛰도록 예외 전파
+            final_log_path = self._append_validation_log(
                 date=date,
                 var=var,
-                tm=f"{date}----",
+                tm=tm,
                 level="ERROR",
-                message=f"시간대 누락: got={len(all_data)}/{len(hours)} missing_hours={missing_hours}",
+                message=(
+                    f"재시도 {retry_attempts}회 후에도 실패하여 날짜 스킵 대상입니다. "
+                    f"(상위 루프에서 continue) last_log={last_log_path}"
+                ),
+                exception=last_exception,
+                response_preview=last_response_preview,
             )
-            raise RuntimeError(f"시간대 누락: {date} {var}. validation_log={log_path}")
+            raise RuntimeError(f"다운로드/파싱 재시도 실패: {tm} {var}. validation_log={final_log_path}")
 
-        if all_data:
-            result = pd.concat(all_data, ignore_index=True)
-            
-            # 캐시 저장
-            os.makedirs(raw_dir, exist_ok=True)
-            result.to_parquet(cache_path, index=False)
-            
-            return result
-        
-        return None
-    
-    def _parse_grid_response(self, response_text: str) -> Optional[np.ndarray]:
+        return grid_values
+
+    def _parse_grid_response(self, response_text: Union[str, bytes]) -> Optional[np.ndarray]:
         """
         격자 API 응답 파싱
         
@@ -730,26 +1237,32 @@ class FusionPipeline:
             return None
         
         try:
-            lines = response_text.strip().split('\n')
-            
-            # 주석/헤더 제외
-            data_lines = [l for l in lines if l.strip() and not l.strip().startswith('#')]
-            
-            if not data_lines:
+            # 주석/헤더 라인을 정규식 한 번으로 제거한 뒤, 남은 숫자 토큰(헤더/메타 포함 가능)을 추출
+            # - 빠른 경로: np.fromstring 으로 중간 리스트 없이 C 레벨에서 float64 배열로 변환
+            # - 숫자가 아닌 토큰이 섞여 있으면 기존처럼 토큰 단위로 걸러냄
+            # - bytes 응답은 UTF-8 디코딩 없이 그대로 처리 (숫자 토큰은 ASCII)
+            if isinstance(response_text, bytes):
+                cleaned = _COMMENT_LINE_BYTES_RE.sub(b"", response_text).replace(b',', b' ')
+            else:
+                cleaned = _COMMENT_LINE_RE.sub("", response_text).replace(',', ' ')
+            if not cleaned.strip():
                 return None
-            
-            # 모든 숫자 토큰 추출 (헤더/메타 포함 가능)
-            raw_numbers = []
-            for line in data_lines:
-                parts = line.replace(',', ' ').split()
-                for p in parts:
+
+            try:
+                with warnings.catch_warnings():
+                    # 숫자가 아닌 토큰을 만나면 numpy는 경고만 내고 중간에서 멈추므로 예외로 승격
+                    warnings.simplefilter("error", DeprecationWarning)
+                    raw_numbers = np.fromstring(cleaned, dtype=np.float64, sep=' ')
+            except (DeprecationWarning, ValueError):
+                parsed = []
+                for p in cleaned.split():
                     try:
-                        val = float(p)
-                        raw_numbers.append(val)
+                        parsed.append(float(p))
                     except ValueError:
                         continue
+                raw_numbers = np.array(parsed, dtype=np.float64)
 
-            if not raw_numbers:
+            if raw_numbers.size == 0:
                 return None
 
             # 기대 격자 수(= 매핑 테이블 길이)를 알면, 응답 값 개수는 반드시 일치해야 합니다.
@@ -773,15 +1286,17 @@ class FusionPipeline:
                         # 흔한 케이스: 앞쪽에 (nx, ny) 같은 격자 차원 정보가 포함되는 경우
                         # - 숫자만 뽑아오면 2개가 추가로 붙어 `expected_n + 2`가 될 수 있음
                         # - `nx * ny == expected_n`인 연속된 두 정수를 초반에서 찾으면 그 앞을 헤더로 간주
-                        scan_limit = min(20, original_n - 1)
-                        for i in range(scan_limit):
-                            a = raw_numbers[i]
-                            b = raw_numbers[i + 1]
-                            if float(int(a)) == a and float(int(b)) == b:
-                                if int(a) * int(b) == expected_n:
-                                    header_cut = i + 2
-                                    header_pair = (int(a), int(b))
-                                    break
+                        # (초반 21개 값에 대해 인접 쌍을 한 번에 검사)
+                        head = raw_numbers[:min(21, original_n)]
+                        a, b = head[:-1], head[1:]
+                        with np.errstate(invalid='ignore'):
+                            hit = np.flatnonzero(
+                                (a == np.floor(a)) & (b == np.floor(b)) & (a * b == expected_n)
+                            )
+                        if hit.size:
+                            i = int(hit[0])
+                            header_cut = i + 2
+                            header_pair = (int(a[i]), int(b[i]))
 
                         if header_cut is not None:
                             raw_numbers = raw_numbers[header_cut:]
@@ -789,8 +1304,8 @@ class FusionPipeline:
 
                     if len(raw_numbers) != expected_n:
                         # 디버깅을 위해 일부 토큰만 요약해서 메시지에 포함
-                        head_preview = raw_numbers[:10]
-                        tail_preview = raw_numbers[-10:] if len(raw_numbers) > 10 else raw_numbers
+                        head_preview = raw_numbers[:10].tolist()
+                        tail_preview = raw_numbers[-10:].tolist() if len(raw_numbers) > 10 else raw_numbers.tolist()
                         raise ValueError(
                             "격자 응답 값 개수 불일치: "
                             f"parsed={original_n:,}, expected={expected_n:,}, "
@@ -801,25 +1316,74 @@ class FusionPipeline:
 
             # 결측값/특수 코드 처리
             # -999: 결측, 2049: 데이터 없음 등 특수 코드 처리
-            values = []
-            for val in raw_numbers:
-                if val is None or (isinstance(val, float) and np.isnan(val)):
-                    values.append(np.nan)
-                    continue
-                if val < -900 or val > 2000:
-                    values.append(np.nan)
-                else:
-                    values.append(val)
+            # (raw_numbers 는 이 함수에서 새로 만든 배열이므로 복사 없이 제자리에서 마스킹)
+            values = raw_numbers
+            with np.errstate(invalid='ignore'):
+                np.putmask(values, (values < -900) | (values > 2000), np.nan)
 
-            return np.array(values) if values else None
+            return values if values.size else None
             
         except Exception as e:
             # 여기서 조용히 `None`을 반환하면 이후 단계에서 `grid_idx` 정합성 오류를 놓치기 쉬워집니다.
             # 반드시 예외를 전파해, 데이터/파싱 포맷 변경을 즉시 감지하도록 합니다.
-            print(f"파싱 오류: {e}")
+            logger.error("파싱 오류: %s", e)
             raise
 
 
+# 프로세스 풀 워커 전용 파이프라인 (워커 프로세스마다 하나)
+_WORKER_PIPELINE: Optional[FusionPipeline] = None
+
+
+def _day_pool_context():
+    """날짜 단위 프로세스 풀의 multiprocessing context.
+
+    Linux에서는 fork를 명시해 워커가 부모에 이미 import된 모듈(pandas/geopandas 등)을 그대로 물려받게 함
+    (spawn/forkserver처럼 워커마다 다시 import하지 않음). fork가 안전하지 않은 macOS/Windows는 플랫폼 기본값 사용.
+    """
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _init_day_worker(auth_key: str, config: FusionConfig, shared_regions: Optional[Dict[str, object]] = None) -> None:
+    """날짜 단위 프로세스 풀 initializer (process_month, run_process.py): 워커별 FusionPipeline 생성.
+
+    shared_regions: `_shared_regions`가 넘겨준 {region_type: (mapping_df, SpatialAggregator) 또는 IPC 경로}
+        — fork면 부모 객체를 그대로 등록, 경로면 매핑을 parquet 대신 메모리 맵으로 로드
+    """
+    global _WORKER_PIPELINE
+    _WORKER_PIPELINE = FusionPipeline(auth_key, config)
+    for region_type, region in (shared_regions or {}).items():
+        if isinstance(region, str):
+            _WORKER_PIPELINE._load_region_ipc(region_type, region)
+        else:
+            _WORKER_PIPELINE._region_cache[region_type] = region
+
+
+def _process_day_worker(task) -> tuple:
+    """워커에서 하루 처리. 예외는 피클링 문제를 피하기 위해 문자열로 반환합니다.
+
+    Returns:
+        (date, DataFrame 또는 None, 오류 메시지 또는 None)
+    """
+    date, variables, region_type = task
+    try:
+        df = _WORKER_PIPELINE.process_day(date, variables, save_interim=True, region_type=region_type)
+        return date, df, None
+    except Exception as e:
+        return date, None, str(e)
+
+
+def _process_cached_day_worker(task) -> tuple:
+    """`_process_day_worker`와 같되 raw 캐시만 사용 (process_day_from_cache, 다운로드 없음)."""
+    date, variables, region_type = task
+    try:
+        df = _WORKER_PIPELINE.process_day_from_cache(date, variables, save_interim=True, region_type=region_type)
+        return date, df, None
+    except Exception as e:
+        return date, None, str(e)
+
+
 def run_fusion_pipeline(
     auth_key: str,
     start_year: int,
@@ -7,7 +7,7 @@
 
 특징
 ----
-- 날짜 단위 병렬 처리(기본 4 workers)
+- 날짜 단위 병렬 처리(기본 4 workers, 스레드 — 작업 대부분이 HTTP 대기라 프로세스가 필요 없음)
 - 실패/재시도/검증 로그는 기존 로직대로 `data/fusion_raw/_validation_logs/...`에 남습니다.
 
 예시
@@ -19,13 +19,15 @@ python run_download_fusion.py --test-day 20241128 --variables ta,rn_60m,sd_3hr
 from __future__ import annotations
 
 import argparse
+import itertools
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import dotenv
+import pandas as pd
 
 # 실행 파일이 위치한 폴더를 기준으로 설정
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -39,7 +41,9 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--end-month", type=int, default=12)
     p.add_argument("--variables", type=str, default="ta,rn_60m")
     p.add_argument("--test-day", type=str, default=None, help="테스트용 하루(YYYYMMDD)만 다운로드")
-    p.add_argument("--max-workers", type=int, default=4, help="날짜 단위 병렬 worker 수 (기본 4)")
+    p.add_argument("--cache-compression", type=str, default="zstd", choices=["zstd", "lz4", "snappy", "none"],
+                    help="raw 캐시 parquet 압축 codec (기본 zstd, none=무압축)")
+    p.add_argument("--max-workers", type=int, default=4, help="날짜 단위 병렬 worker(스레드) 수이자 동시 API 요청 상한 (기본 4)")
     p.add_argument("--output-path", type=str, default=None, help="데이터 저장 경로 (기본값: project_root/data)")
     p.add_argument("--api-type", type=str, default="org", choices=["org", "public"],
                     help="API 유형: org=기관용(대용량), public=일반 (기본: org)")
@@ -54,24 +58,9 @@ def _iter_dates(
     end_month: int,
 ) -> List[str]:
     """연/월 범위에 해당하는 YYYYMMDD 날짜 리스트를 생성."""
-    out: List[str] = []
-
-    for year in range(start_year, end_year + 1):
-        m0 = start_month if year == start_year else 1
-        m1 = end_month if year == end_year else 12
-
-        for month in range(m0, m1 + 1):
-            first = datetime(year, month, 1)
-            if month == 12:
-                next_month = datetime(year + 1, 1, 1)
-            else:
-                next_month = datetime(year, month + 1, 1)
-            num_days = (next_month - first).days
-
-            for d in range(1, num_days + 1):
-                out.append(f"{year}{month:02d}{d:02d}")
-
-    return out
+    start = pd.Timestamp(start_year, start_month, 1)
+    end = pd.Timestamp(end_year, end_month, 1) + pd.offsets.MonthEnd(0)
+    return pd.date_range(start, end, freq="D").strftime("%Y%m%d").tolist()
 
 
 @dataclass
@@ -81,22 +70,11 @@ class _DayResult:
     failed_vars: List[Tuple[str, str]]  # (var, error)
 
 
-def _download_one_day_worker(
-    *,
-    project_root: str,
-    auth_key: str,
-    date: str,
-    variables: List[str],
-    output_path: str | None = None,
-    api_type: str = "org",
-) -> _DayResult:
-    # 워커 프로세스에서 import/초기화
-    from fusion.config import FusionConfig
-    from fusion.pipeline import FusionPipeline
+# 이 시간 동안 완료된 날짜가 하나도 없으면 진행 중인 날짜를 출력 (작업 자체는 계속 진행)
+_DAY_RESULT_TIMEOUT_SECONDS = 600
 
-    config = FusionConfig(project_root=project_root, custom_data_root=output_path, api_type=api_type)
-    pipeline = FusionPipeline(auth_key=auth_key, config=config)
 
+def _download_one_day_worker(pipeline, *, date: str, variables: List[str]) -> _DayResult:
     summary = pipeline.ensure_day_cache(date=date, variables=variables)
     ok = sorted(summary.get("ok", {}).keys())
     failed = sorted(summary.get("failed", {}).items())
@@ -105,8 +83,11 @@ def _download_one_day_worker(
 
 def main(argv: List[str] | None = None):
     from fusion.config import FusionConfig
+    from fusion.download import enable_queue_logging
+    from fusion.pipeline import FusionPipeline
 
     args = _build_arg_parser().parse_args(argv)
+    enable_queue_logging()
 
     # 루트 .env 파일 로드
     ROOT_DIR = os.path.dirname(BASE_DIR)
@@ -131,13 +112,23 @@ def main(argv: List[str] | None = None):
             end_month=args.end_month,
         )
 
+    max_workers = max(1, int(args.max_workers))
+
     print("=" * 70)
     print("[A] raw 다운로드/캐시 생성")
     print("=" * 70)
-    _temp_config = FusionConfig(project_root=project_root, custom_data_root=args.output_path, api_type=args.api_type)
+    config = FusionConfig(
+        project_root=project_root,
+        custom_data_root=args.output_path,
+        api_type=args.api_type,
+        raw_cache_compression=None if args.cache_compression == "none" else args.cache_compression,
+        # 동시 API 요청은 전체 max_workers건까지 (기존 프로세스 방식의 worker당 직렬 요청과 같은 부하)
+        api_max_in_flight=max_workers,
+    )
     print("project_root:", project_root)
-    print("api_type:", args.api_type, f"({_temp_config.api_base_url})")
-    print("dynamic_data_dir:", _temp_config.dynamic_data_dir)
+    print("api_type:", args.api_type, f"({config.api_base_url})")
+    print("dynamic_data_dir:", config.dynamic_data_dir)
+    print("cache_compression:", args.cache_compression)
     print("dates:", len(dates), "(first/last:", dates[0], "~", dates[-1], ")")
     print("variables:", variables)
     print("max_workers:", args.max_workers)
@@ -148,30 +139,55 @@ def main(argv: List[str] | None = None):
     failed_days = 0
     failed_details: List[_DayResult] = []
 
-    max_workers = max(1, int(args.max_workers))
-    with ProcessPoolExecutor(max_workers=max_workers) as ex:
-        futures = [
-            ex.submit(
-                _download_one_day_worker,
-                project_root=project_root,
-                auth_key=auth_key,
-                date=date,
-                variables=variables,
-                output_path=args.output_path,
-                api_type=args.api_type,
-            )
-            for date in dates
-        ]
-
-        for fut in as_completed(futures):
-            res = fut.result()
-            if res.failed_vars:
-                failed_days += 1
-                failed_details.append(res)
-                print(f"[FAIL] {res.date} ok={res.ok_vars} failed={len(res.failed_vars)}")
-            else:
-                ok_days += 1
-                print(f"[ OK ] {res.date} ok={res.ok_vars}")
+    # 작업이 HTTP 대기 위주(I/O bound)이므로 프로세스 대신 스레드로 병렬 처리
+    # - 모든 스레드가 FusionPipeline(세션/rate limiter) 하나를 공유하므로, 스레드 수와 관계없이
+    #   동시 요청은 api_max_in_flight(= max_workers)건, 각 요청 뒤 api_sleep_seconds 대기
+    pipeline = FusionPipeline(auth_key=auth_key, config=config)
+    ex = ThreadPoolExecutor(max_workers=max_workers)
+    # 전체 날짜를 한 번에 submit하지 않고 최대 2 * max_workers개만 대기열에 유지
+    date_iter = iter(dates)
+    active: Dict[Future, str] = {}
+
+    def _submit(date: str) -> None:
+        active[ex.submit(_download_one_day_worker, pipeline, date=date, variables=variables)] = date
+
+    try:
+        for date in itertools.islice(date_iter, 2 * max_workers):
+            _submit(date)
+
+        while active:
+            done, _ = wait(active, timeout=_DAY_RESULT_TIMEOUT_SECONDS, return_when=FIRST_COMPLETED)
+            if not done:
+                print(f"[WAIT] {_DAY_RESULT_TIMEOUT_SECONDS}초 동안 완료된 날짜 없음 (진행 중: {sorted(active.values())})")
+                continue
+
+            for fut in done:
+                date = active.pop(fut)
+                try:
+                    res = fut.result()
+                except Exception as e:
+                    # 워커 예외는 해당 날짜의 실패로 기록하고 나머지 날짜는 계속 진행
+                    err = f"{type(e).__name__}: {e}"
+                    res = _DayResult(date=date, ok_vars=[], failed_vars=[(v, err) for v in variables])
+
+                if res.failed_vars:
+                    failed_days += 1
+                    failed_details.append(res)
+                    print(f"[FAIL] {res.date} ok={res.ok_vars} failed={len(res.failed_vars)}")
+                else:
+                    ok_days += 1
+                    print(f"[ OK ] {res.date} ok={res.ok_vars}")
+
+                next_date = next(date_iter, None)
+                if next_date is not None:
+                    _submit(next_date)
+    except KeyboardInterrupt:
+        print("\n[중단] 대기 중인 날짜를 취소하고, 진행 중인 날짜가 끝나기를 기다립니다...")
+        ex.shutdown(wait=True, cancel_futures=True)
+        raise
+    finally:
+        ex.shutdown(wait=True)
+        pipeline.close()
 
     print("\n" + "=" * 70)
     print("완료")
@@ -0,0 +1,268 @@
+"""융합기상정보 다운로드 + 후처리 동시 실행 스크립트 (A+B 파이프라인)
+
+목표
+----
+- A 단계(run_download.py)와 B 단계(run_process.py)를 한 번에 실행하되, 날짜 단위로 겹쳐서 처리합니다.
+- 하루치 raw 캐시가 완성되는 즉시 후처리 프로세스 풀에 넘기므로, 전체 소요 시간이
+  (다운로드 + 후처리)의 합이 아니라 둘 중 긴 쪽에 가까워집니다.
+- 월/연도별 출력 파일은 run_process.py와 같은 경로/이름으로 저장합니다.
+
+정책
+----
+- 이미 raw 캐시가 있는 날짜/변수는 다시 다운로드하지 않습니다 (ensure_day_cache).
+- 다운로드에 실패한 변수가 있는 날짜는 후처리에서 스킵(B 정책)하고, 실패 목록을 요약 출력합니다.
+
+예시
+----
+python fusion_weather/run_pipelined.py --start-year 2024 --end-year 2024 --variables ta,rn_60m,sd_3hr
+python fusion_weather/run_pipelined.py --start-year 2024 --end-year 2024 --region-type both --day-workers 4
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime
+from functools import partial
+from typing import Dict, List
+
+import dotenv
+from tqdm import tqdm
+
+from run_download import _DayResult, _download_one_day_worker, _iter_dates
+
+# 실행 파일이 위치한 폴더를 기준으로 설정
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _build_arg_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="융합기상정보 다운로드 + 후처리 동시 실행 (A+B 단계)")
+    p.add_argument("--start-year", type=int, default=2024)
+    p.add_argument("--end-year", type=int, default=2024)
+    p.add_argument("--start-month", type=int, default=1)
+    p.add_argument("--end-month", type=int, default=12)
+    p.add_argument("--variables", type=str, default="ta,rn_60m")
+    p.add_argument("--output-path", type=str, default=None, help="데이터 저장 경로 (기본값: project_root/data)")
+    p.add_argument("--api-type", type=str, default="org", choices=["org", "public"],
+                    help="API 유형: org=기관용(대용량), public=일반 (기본: org)")
+    p.add_argument("--cache-compression", type=str, default="zstd", choices=["zstd", "lz4", "snappy", "none"],
+                    help="raw 캐시 parquet 압축 codec (기본 zstd, none=무압축)")
+    p.add_argument("--max-workers", type=int, default=4, help="날짜 단위 다운로드 worker(스레드) 수이자 동시 API 요청 상한 (기본 4)")
+    p.add_argument("--day-workers", type=int, default=None,
+                    help="날짜 단위 후처리 프로세스 수 (기본: config.day_workers=1)")
+    p.add_argument("--region-type", type=str, default="hjd", choices=["hjd", "bjd", "both"],
+                    help="집계 단위: hjd=행정동, bjd=법정동, both=둘 다 (기본: hjd)")
+    p.add_argument("--force-rebuild-mapping", action="store_true", help="매핑 테이블 강제 재생성")
+    p.add_argument("--output-format", type=str, default="csv", choices=["csv", "parquet"],
+                    help="월/연도별 결과 파일 형식 (기본: csv)")
+    return p
+
+
+def main(argv: List[str] | None = None):
+    from fusion.config import FusionConfig
+    from fusion.download import enable_queue_logging
+    from fusion.pipeline import FusionPipeline, _process_cached_day_worker
+
+    args = _build_arg_parser().parse_args(argv)
+    enable_queue_logging()
+
+    # 루트 .env 파일 로드
+    ROOT_DIR = os.path.dirname(BASE_DIR)
+    dotenv.load_dotenv(os.path.join(ROOT_DIR, ".env"))
+    auth_key = os.getenv("fusion_weather_authKey")
+    if not auth_key:
+        raise SystemExit("오류: 루트 .env에 fusion_weather_authKey를 설정해주세요")
+
+    variables = [v.strip() for v in args.variables.split(",") if v.strip()]
+    if not variables:
+        raise SystemExit("오류: variables가 비어있습니다")
+
+    dates = _iter_dates(
+        start_year=args.start_year,
+        end_year=args.end_year,
+        start_month=args.start_month,
+        end_month=args.end_month,
+    )
+    if not dates:
+        raise SystemExit("오류: 처리할 날짜가 없습니다")
+
+    region_type = args.region_type
+    suffix = f"_{region_type}"
+    max_workers = max(1, int(args.max_workers))
+
+    config = FusionConfig(
+        project_root=BASE_DIR,
+        custom_data_root=args.output_path,
+        api_type=args.api_type,
+        raw_cache_compression=None if args.cache_compression == "none" else args.cache_compression,
+        output_format=args.output_format,
+        # 동시 API 요청은 전체 max_workers건까지 (run_download.py와 같은 부하)
+        api_max_in_flight=max_workers,
+    )
+    day_workers = max(1, int(args.day_workers or config.day_workers or 1))
+    pipeline = FusionPipeline(auth_key=auth_key, config=config)
+    ext = pipeline._output_ext()
+
+    print("=" * 70)
+    print("[A+B] 다운로드 + 후처리 동시 실행")
+    print("=" * 70)
+    print("project_root:", BASE_DIR)
+    print("api_type:", args.api_type, f"({config.api_base_url})")
+    print("dynamic_data_dir:", config.dynamic_data_dir)
+    print("dates:", len(dates), "(first/last:", dates[0], "~", dates[-1], ")")
+    print("variables:", variables)
+    print("region_type:", region_type)
+    print("max_workers (다운로드):", max_workers)
+    print("day_workers (후처리):", day_workers)
+    print("output_format:", args.output_format)
+
+    # 매핑은 부모에서 먼저 확보(필요하면 생성)
+    pipeline.ensure_mapping(region_type, force_rebuild=args.force_rebuild_mapping)
+    mapping_df, _ = pipeline._get_region(region_type)
+    columns = pipeline._output_columns(variables, region_type)
+    print(f"매핑 완료: {len(mapping_df):,} 격자점")
+    print("start:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+    print()
+
+    ok_days = 0
+    failed_details: List[_DayResult] = []
+    results_paths: List[str] = []
+
+    with ExitStack() as stack:
+        stack.callback(pipeline.close)
+        # 후처리(B): CPU 작업이므로 프로세스 풀, 매핑은 워커와 공유 (fork면 부모의 매핑/집계 객체, 아니면 메모리 맵 IPC 파일)
+        process_exec = stack.enter_context(pipeline._day_pool(region_type, day_workers))
+        # 다운로드 스레드가 돌기 전에 워커 프로세스를 먼저 띄움 (스레드가 잡고 있는 lock을 fork로 물려받지 않도록)
+        process_exec.submit(int).result()
+
+        # 다운로드(A): HTTP 대기 위주이므로 스레드 풀 (모든 스레드가 pipeline의 세션/rate limiter를 공유)
+        download_exec = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+
+        # 날짜별 stage: 다운로드가 끝나면 (다운로드 결과, 후처리 future 또는 None)으로 채워짐
+        stages: Dict[str, Future] = {}
+
+        def _chain(date: str, stage: Future, download: Future) -> None:
+            try:
+                res = download.result()
+            except Exception as e:
+                err = f"{type(e).__name__}: {e}"
+                res = _DayResult(date=date, ok_vars=[], failed_vars=[(v, err) for v in variables])
+            try:
+                proc = None
+                if not res.failed_vars:
+                    # 캐시가 완성된 날짜는 바로 후처리 풀에 넘김 (출력 순서는 아래 소비 루프에서 날짜순으로 맞춤)
+                    proc = process_exec.submit(_process_cached_day_worker, (date, variables, region_type))
+                stage.set_result((res, proc))
+            except Exception as e:
+                stage.set_exception(e)
+
+        def _submit(date: str) -> None:
+            stage = stages[date] = Future()
+            download_exec.submit(_download_one_day_worker, pipeline, date=date, variables=variables).add_done_callback(
+                partial(_chain, date, stage)
+            )
+
+        # 소비 루프보다 최대 (다운로드 + 후처리 worker 수) x 2 날짜만 앞서 나가도록 제한 (대기 중인 결과 메모리 상한)
+        date_iter = iter(dates)
+        for date in itertools.islice(date_iter, 2 * (max_workers + day_workers)):
+            _submit(date)
+
+        # 일별 결과는 run_process.py와 같이 월/연도별 writer에 날짜순으로 바로 넘김
+        year_writer = month_writer = None
+        year_path = month_path = ""
+        cur_year = cur_month = None
+
+        def _close_writer(writer, path: str, is_year: bool) -> None:
+            if writer is not None and writer.rows > 0:
+                rows = writer.rows
+                writer.close()
+                if is_year:
+                    results_paths.append(path)
+                print(f"\n{'연도별 ' if is_year else ''}저장 완료: {path} (rows={rows:,})")
+
+        try:
+            for date in tqdm(dates, desc=f"A+B [{region_type}]"):
+                year, month = date[:4], date[4:6]
+                if (year, month) != (cur_year, cur_month):
+                    _close_writer(month_writer, month_path, is_year=False)
+                    if year != cur_year:
+                        _close_writer(year_writer, year_path, is_year=True)
+                        year_path = os.path.join(config.fusion_output_dir, f"fusion_weather_{year}{suffix}.{ext}")
+                        year_writer = pipeline._open_output_writer(year_path, columns)
+                    month_path = os.path.join(config.fusion_output_dir, year, f"fusion_{year}{month}{suffix}.{ext}")
+                    month_writer = pipeline._open_output_writer(month_path, columns)
+                    cur_year, cur_month = year, month
+
+                res, proc = stages.pop(date).result()
+                next_date = next(date_iter, None)
+                if next_date is not None:
+                    _submit(next_date)
+
+                if res.failed_vars:
+                    failed_details.append(res)
+                    print(f"\n[FAIL] {res.date} ok={res.ok_vars} failed={len(res.failed_vars)}")
+                    continue
+                ok_days += 1
+
+                _, df_day, error = proc.result()
+                if error is not None:
+                    print(f"\n  {date} 처리 실패: {error}")
+                    continue
+                if df_day is not None and len(df_day) > 0:
+                    month_writer.append(df_day)
+                    year_writer.append(df_day)
+
+            _close_writer(month_writer, month_path, is_year=False)
+            _close_writer(year_writer, year_path, is_year=True)
+        finally:
+            for writer in (month_writer, year_writer):
+                if writer is not None:
+                    writer.discard()
+
+    print("\n" + "=" * 70)
+    print("완료")
+    print("=" * 70)
+    print("ok_days:", ok_days)
+    print("failed_days:", len(failed_details))
+    print("end:", datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    if results_paths:
+        print("생성된 파일:")
+        for p in results_paths:
+            print("  -", p)
+
+    if failed_details:
+        print("\n[실패 요약(다운로드 실패 날짜는 후처리 스킵)]")
+        for r in sorted(failed_details, key=lambda x: x.date):
+            msg = ", ".join([f"{v}({e})" for v, e in r.failed_vars])
+            print(f"- {r.date}: {msg}")
+
+
+if __name__ == "__main__":
+    # PyCharm/IDE 디버깅 편의를 위한 하드코딩 실행 옵션
+    # - CLI로 실행할 때는 기본값(=USE_IDE_DEFAULTS=False)을 유지하세요.
+    # - IDE에서 실행/디버깅할 때는 아래 값만 수정한 뒤 실행하면 됩니다.
+
+    USE_IDE_DEFAULTS = False
+
+    # 데이터 경로 설정 (None이면 기본 경로 사용: project_root/data)
+    IDE_DATA_OUTPUT_PATH = None  # 예: r"E:\kma"
+
+    if USE_IDE_DEFAULTS:
+        ide_argv = [
+            "--start-year", "2024",
+            "--end-year", "2024",
+            "--start-month", "1",
+            "--end-month", "1",
+            "--variables", "ta,rn_60m,sd_3hr",
+            "--region-type", "both",
+        ]
+        if IDE_DATA_OUTPUT_PATH:
+            ide_argv.extend(["--output-path", IDE_DATA_OUTPUT_PATH])
+
+        main(argv=ide_argv)
+    else:
+        main()
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import argparse
 import os
+from contextlib import ExitStack
 from datetime import datetime
 from typing import List, Dict
 
@@ -45,18 +46,16 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--output-path", type=str, default=None, help="데이터 경로 (A단계의 --output-path와 동일하게 지정)")
     p.add_argument("--region-type", type=str, default="hjd", choices=["hjd", "bjd", "both"],
                     help="집계 단위: hjd=행정동, bjd=법정동, both=둘 다 (기본: hjd)")
+    p.add_argument("--day-workers", type=int, default=None,
+                    help="날짜 단위 병렬 프로세스 수 (기본: config.day_workers=1, 순차 처리)")
+    p.add_argument("--output-format", type=str, default="csv", choices=["csv", "parquet"],
+                    help="월/연도별 결과 파일 형식 (기본: csv)")
     return p
 
 
 def _iter_dates_for_month(year: int, month: int) -> List[str]:
-    if month == 12:
-        next_month = datetime(year + 1, 1, 1)
-    else:
-        next_month = datetime(year, month + 1, 1)
-
-    first = datetime(year, month, 1)
-    num_days = (next_month - first).days
-    return [f"{year}{month:02d}{d:02d}" for d in range(1, num_days + 1)]
+    first = pd.Timestamp(year, month, 1)
+    return pd.date_range(first, periods=first.days_in_month, freq="D").strftime("%Y%m%d").tolist()
 
 
 def _run_single_region(
@@ -105,49 +104,82 @@ def _run_single_region(
         return
 
     results_year_paths: List[str] = []
-
-    for year in range(args.start_year, args.end_year + 1):
-        yearly_dfs: List[pd.DataFrame] = []
-
-        m0 = args.start_month if year == args.start_year else 1
-        m1 = args.end_month if year == args.end_year else 12
-
-        for month in range(m0, m1 + 1):
-            monthly_dfs: List[pd.DataFrame] = []
-            dates = _iter_dates_for_month(year, month)
-
-            for date in tqdm(dates, desc=f"{year}-{month:02d} [{region_type}]"):
-                raw_dir = os.path.join(config.fusion_raw_dir, f"{year}", f"{month:02d}")
-                missing = [
-                    v
-                    for v in variables
-                    if not os.path.exists(os.path.join(raw_dir, f"{v}_{date}_parsed.parquet"))
-                ]
-                if missing:
-                    skipped[date] = missing
-                    continue
-
-                df_day = pipeline.process_day_from_cache(
+    ext = pipeline._output_ext()
+    # 월/연도별 파일 컬럼은 요청 변수 기준으로 고정 (날짜마다 빠진 시간대/변수 컬럼은 빈 값)
+    columns = pipeline._output_columns(variables, region_type)
+
+    # 날짜별 피벗/공간집계는 CPU 작업이고 서로 독립적이므로 프로세스 풀로 병렬 처리
+    # - 매핑은 위에서 부모가 먼저 확보해 두고 워커와 공유 (fork면 부모의 매핑/집계 객체, 아니면 메모리 맵 IPC 파일)
+    # - 워커당 FusionPipeline 하나를 initializer에서 만들어 재사용
+    # - ex.map은 제출 순서대로 결과를 돌려주므로 출력 파일의 날짜 순서는 순차 처리와 같음
+    day_workers = max(1, int(args.day_workers or config.day_workers or 1))
+    ex = None
+
+    def _iter_day_results(dates: List[str]):
+        if ex is None:
+            for date in dates:
+                yield date, pipeline.process_day_from_cache(
                     date, variables=variables, save_interim=True, region_type=region_type,
-                )
-                if df_day is not None and len(df_day) > 0:
-                    monthly_dfs.append(df_day)
-
-            if monthly_dfs:
-                month_df = pd.concat(monthly_dfs, ignore_index=True)
-                output_dir = os.path.join(config.fusion_output_dir, str(year))
-                os.makedirs(output_dir, exist_ok=True)
-                output_path = os.path.join(output_dir, f"fusion_{year}{month:02d}{suffix}.csv")
-                month_df.to_csv(output_path, index=False, encoding="utf-8-sig")
-                print(f"\n저장 완료: {output_path} (rows={len(month_df):,})")
-                yearly_dfs.append(month_df)
-
-        if yearly_dfs:
-            year_df = pd.concat(yearly_dfs, ignore_index=True)
-            output_path = os.path.join(config.fusion_output_dir, f"fusion_weather_{year}{suffix}.csv")
-            year_df.to_csv(output_path, index=False, encoding="utf-8-sig")
-            results_year_paths.append(output_path)
-            print(f"\n연도별 저장 완료: {output_path} (rows={len(year_df):,})")
+                ), None
+            return
+
+        from fusion.pipeline import _process_cached_day_worker
+
+        yield from ex.map(_process_cached_day_worker, [(date, variables, region_type) for date in dates])
+
+    with ExitStack() as stack:
+        if day_workers > 1:
+            ex = stack.enter_context(pipeline._day_pool(region_type, day_workers))
+
+        for year in range(args.start_year, args.end_year + 1):
+            m0 = args.start_month if year == args.start_year else 1
+            m1 = args.end_month if year == args.end_year else 12
+
+            # 일별 결과를 월/연도별로 메모리에 모으지 않고 writer에 바로 넘겨 조각 단위로 기록 (최대 메모리: 일 단위)
+            year_output_path = os.path.join(config.fusion_output_dir, f"fusion_weather_{year}{suffix}.{ext}")
+            with pipeline._open_output_writer(year_output_path, columns) as year_writer:
+                for month in range(m0, m1 + 1):
+                    raw_dir = os.path.join(config.fusion_raw_dir, f"{year}", f"{month:02d}")
+                    output_path = os.path.join(
+                        config.fusion_output_dir, str(year), f"fusion_{year}{month:02d}{suffix}.{ext}",
+                    )
+
+                    # 캐시 파일 존재 여부는 월 폴더를 한 번만 나열해서 확인 (날짜 × 변수마다 stat 하지 않음)
+                    try:
+                        with os.scandir(raw_dir) as it:
+                            present = {e.name for e in it}
+                    except FileNotFoundError:
+                        present = set()
+
+                    dates: List[str] = []
+                    for date in _iter_dates_for_month(year, month):
+                        missing = [v for v in variables if f"{v}_{date}_parsed.parquet" not in present]
+                        if missing:
+                            skipped[date] = missing
+                        else:
+                            dates.append(date)
+
+                    with pipeline._open_output_writer(output_path, columns) as month_writer:
+                        for date, df_day, error in tqdm(
+                            _iter_day_results(dates), total=len(dates), desc=f"{year}-{month:02d} [{region_type}]",
+                        ):
+                            if error is not None:
+                                print(f"\n  {date} 처리 실패: {error}")
+                                continue
+                            if df_day is not None and len(df_day) > 0:
+                                month_writer.append(df_day)
+                                year_writer.append(df_day)
+
+                        if month_writer.rows > 0:
+                            month_rows = month_writer.rows
+                            month_writer.close()
+                            print(f"\n저장 완료: {output_path} (rows={month_rows:,})")
+
+                if year_writer.rows > 0:
+                    year_rows = year_writer.rows
+                    year_writer.close()
+                    results_year_paths.append(year_output_path)
+                    print(f"\n연도별 저장 완료: {year_output_path} (rows={year_rows:,})")
 
     print("\n" + "=" * 70)
     print(f"[{region_type.upper()}] 완료")
@@ -171,9 +203,11 @@ def _run_single_region(
 
 def main(argv: List[str] | None = None):
     from fusion.config import FusionConfig
+    from fusion.download import enable_queue_logging
     from fusion.pipeline import FusionPipeline
 
     args = _build_arg_parser().parse_args(argv)
+    enable_queue_logging()
 
     # 루트 .env 파일 로드 (B단계는 다운로드하지 않으므로 auth_key는 선택사항)
     ROOT_DIR = os.path.dirname(BASE_DIR)
@@ -185,13 +219,17 @@ def main(argv: List[str] | None = None):
         raise SystemExit("오류: variables가 비어있습니다")
 
     project_root = BASE_DIR
-    config = FusionConfig(project_root=project_root, custom_data_root=args.output_path)
+    config = FusionConfig(
+        project_root=project_root, custom_data_root=args.output_path, output_format=args.output_format,
+    )
     pipeline = FusionPipeline(auth_key=auth_key, config=config)
 
     print("project_root:", project_root)
     print("data_dir (정적):", config.data_dir)
     print("dynamic_data_dir (동적):", config.dynamic_data_dir)
     print("region_type:", args.region_type)
+    print("output_format:", args.output_format)
+    print("day_workers:", args.day_workers or config.day_workers)
     print()
 
     _run_single_region(pipeline, config, args, variables, args.region_type)
@@ -0,0 +1,142 @@
+"""집계/출력 경로 회귀 테스트
+
+실행 (저장소 루트에서):
+    python -m unittest discover -s fusion_weather/tests -t fusion_weather
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from fusion.aggregate import (
+    SpatialAggregator, StreamingCsvWriter, StreamingParquetWriter, TimeAggregator, write_csv,
+)
+from fusion.config import FusionConfig
+
+
+def _grid_mapping(n_grid: int, rng: np.random.Generator, both: bool = False) -> pd.DataFrame:
+    """격자 일부(해양 등)는 매핑이 없는 격자-지역 매핑 테이블"""
+    grid_idx = np.flatnonzero(rng.random(n_grid) < 0.8)
+    mapping = pd.DataFrame({
+        'grid_idx': grid_idx,
+        'HJD_CD': rng.choice(['1111051500', '1111053000', '2611051000', '4113565000'], len(grid_idx)),
+    })
+    if both:
+        mapping['EMD_CD'] = rng.choice(['1111010100', '1111010200', '2611010100'], len(grid_idx))
+    return mapping
+
+
+def _raw_day(n_grid: int, hours, rng: np.random.Generator) -> dict:
+    """raw 일별 캐시 배치 (시간대 오름차순 × grid_idx 0..N-1), 결측 포함"""
+    values = rng.normal(10, 5, size=(len(hours), n_grid)).round(1).astype(np.float32)
+    values[rng.random(values.shape) < 0.1] = np.nan
+    values[1, :] = np.nan  # 전부 결측인 시간대
+    values[:, :5] = np.nan  # 전부 결측인 격자
+    return {
+        'grid_idx': np.tile(np.arange(n_grid), len(hours)),
+        'hour': np.repeat(np.asarray(hours), n_grid),
+        'value': values.ravel(),
+    }
+
+
+class AggregateHourlyMatrixTest(unittest.TestCase):
+    """희소 행렬 집계가 피벗 + aggregate_grid_to_region(mean)과 같은지"""
+
+    def _check(self, hours, col_prefix: str, is_3hourly: bool, both: bool) -> None:
+        rng = np.random.default_rng(0)
+        n_grid = 400
+        config = FusionConfig()
+        spatial_agg = SpatialAggregator(_grid_mapping(n_grid, rng, both=both), config)
+        time_agg = TimeAggregator(config)
+        arrays = _raw_day(n_grid, hours, rng)
+
+        matrix = time_agg.hourly_matrix(
+            arrays['grid_idx'], arrays['hour'], arrays['value'], col_prefix, is_3hourly=is_3hourly,
+        )
+        self.assertIsNotNone(matrix)
+        fused = spatial_agg.aggregate_hourly_matrix(matrix[0], matrix[1], '20240101')
+
+        df_raw = pd.DataFrame({**arrays, 'date': '20240101'})
+        df_pivot = time_agg.pivot_hourly_to_columns(df_raw, 'value', col_prefix, is_3hourly=is_3hourly)
+        value_cols = [c for c in df_pivot.columns if c.startswith(col_prefix)]
+        expected = spatial_agg.aggregate_grid_to_region(df_pivot, value_cols=value_cols, method='mean')
+
+        expected.columns.name = None  # 피벗의 컬럼 축 이름(col_name)만 다름
+        pd.testing.assert_frame_equal(fused, expected, check_dtype=False, rtol=1e-6)
+
+    def test_hourly(self):
+        self._check(range(24), 't', is_3hourly=False, both=False)
+
+    def test_3hourly(self):
+        self._check(range(0, 24, 3), 's', is_3hourly=True, both=False)
+
+    def test_unified_mapping(self):
+        self._check(range(24), 'p', is_3hourly=False, both=True)
+
+
+class StreamingWriterTest(unittest.TestCase):
+    """조각 단위 기록 결과가 pd.concat 후 한 번에 저장한 결과와 같은지"""
+
+    columns = ['date', 't0001', 't0102', 's0003', 'HJD_CD']
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.parts = []
+        for day in range(1, 6):
+            part = pd.DataFrame({
+                'date': f"202401{day:02d}",
+                't0001': rng.normal(size=4).round(1).astype(np.float32),
+                't0102': np.float32([1.0, np.nan, -2.5, 3.0]),
+                'HJD_CD': ['1111051500', '1111053000', '2611051000', '4113565000'],
+            })
+            if day % 2:
+                # 일부 날짜만 적설 컬럼이 있음 (없는 날짜는 빈 값)
+                part.insert(3, 's0003', rng.normal(size=4).round(1).astype(np.float32))
+            self.parts.append(part)
+        self.expected = pd.concat(self.parts, ignore_index=True).reindex(columns=self.columns)
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_csv_matches_concat_to_csv(self):
+        path = os.path.join(self.tmp_dir, 'out.csv')
+        with StreamingCsvWriter(path, self.columns) as writer:
+            for part in self.parts:
+                writer.append(part)
+        with open(path, 'rb') as f:
+            got = f.read()
+        self.assertEqual(got, self.expected.to_csv(index=False, encoding='utf-8-sig').encode('utf-8-sig'))
+        self.assertEqual(os.listdir(self.tmp_dir), ['out.csv'])
+
+    def test_write_csv_matches_to_csv(self):
+        path = os.path.join(self.tmp_dir, 'out.csv')
+        write_csv(self.expected, path)
+        buf = io.StringIO()
+        self.expected.to_csv(buf, index=False)
+        with open(path, 'rb') as f:
+            self.assertEqual(f.read(), b'\xef\xbb\xbf' + buf.getvalue().encode('utf-8'))
+
+    def test_parquet_matches_concat(self):
+        path = os.path.join(self.tmp_dir, 'out.parquet')
+        with StreamingParquetWriter(path, self.columns) as writer:
+            for part in self.parts:
+                writer.append(part)
+        pd.testing.assert_frame_equal(pd.read_parquet(path), self.expected)
+
+    def test_exception_discards_partial_file(self):
+        path = os.path.join(self.tmp_dir, 'out.csv')
+        with self.assertRaises(RuntimeError):
+            with StreamingCsvWriter(path, self.columns) as writer:
+                writer.append(self.parts[0])
+                raise RuntimeError
+        self.assertEqual(os.listdir(self.tmp_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
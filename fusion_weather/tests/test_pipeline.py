@@ -0,0 +1,126 @@
+"""FusionPipeline 일별 집계 회귀 테스트
+
+실행 (저장소 루트에서):
+    python -m unittest discover -s fusion_weather/tests -t fusion_weather
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from fusion.aggregate import SpatialAggregator
+from fusion.config import FusionConfig
+from fusion.pipeline import FusionPipeline, _raw_cache_path, _raw_day_frame
+
+from tests.test_aggregate import _grid_mapping, _raw_day
+
+
+class AggregateDayVarsTest(unittest.TestCase):
+    """변수 묶음 희소 행렬 집계가 변수별 피벗/집계 + merge_variables와 같은지"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        config = FusionConfig(project_root=self.tmp_dir, custom_data_root=self.tmp_dir)
+        self.pipeline = FusionPipeline(auth_key='test', config=config)
+
+    def tearDown(self):
+        self.pipeline.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_fused_matches_per_variable_merge(self):
+        rng = np.random.default_rng(2)
+        n_grid = 300
+        spatial_agg = SpatialAggregator(_grid_mapping(n_grid, rng), self.pipeline.config)
+        day_arrays = {
+            'ta': _raw_day(n_grid, range(24), rng),
+            'rn_60m': _raw_day(n_grid, range(24), rng),
+            'sd_3hr': _raw_day(n_grid, range(0, 24, 3), rng),
+        }
+
+        fused = self.pipeline._aggregate_day_vars(day_arrays, '20240101', spatial_agg)
+
+        per_var = {}
+        for var, arrays in day_arrays.items():
+            meta = self.pipeline._get_var_meta(var)
+            per_var[var] = self.pipeline._pivot_and_aggregate(
+                _raw_day_frame(arrays, '20240101'), meta.col_prefix, meta.is_3hourly, spatial_agg,
+            )
+        expected = self.pipeline.formatter.merge_variables(per_var)
+        expected.columns.name = None
+
+        pd.testing.assert_frame_equal(fused, expected, check_dtype=False, rtol=1e-6)
+
+    def test_no_variables(self):
+        spatial_agg = SpatialAggregator(_grid_mapping(10, np.random.default_rng(0)), self.pipeline.config)
+        self.assertIsNone(self.pipeline._aggregate_day_vars({}, '20240101', spatial_agg))
+
+
+class InterimReuseTest(unittest.TestCase):
+    """중간 결과는 저장 시 기록한 집계 조건이 같고 원본(매핑/raw 캐시)이 모두 있을 때만 재사용"""
+
+    date = '20240101'
+    variables = ['ta', 'rn_60m']
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.config = FusionConfig(project_root=self.tmp_dir, custom_data_root=self.tmp_dir)
+        self.pipeline = FusionPipeline(auth_key='test', config=self.config)
+
+        # 원본 파일은 중간 결과보다 오래된 것으로 둠
+        raw_dir = self.pipeline._raw_dir(self.date)
+        self.sources = [self.config.grid_hjd_mapping_file] + [
+            _raw_cache_path(raw_dir, var, self.date) for var in self.variables
+        ]
+        for path in self.sources:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'wb').close()
+            os.utime(path, (0, 0))
+
+        self.df = pd.DataFrame({
+            'date': [self.date] * 2,
+            't0001': np.float32([1.5, np.nan]),
+            'r0001': np.float32([0.0, 2.0]),
+            'HJD_CD': ['1111051500', '1111053000'],
+        })
+        self.interim_path = os.path.join(self.tmp_dir, 'fusion_20240101.parquet')
+        self.pipeline._save_interim(self.df, self.interim_path, self.variables, 'hjd')
+
+    def tearDown(self):
+        self.pipeline.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _read(self, variables=None, region_type='hjd'):
+        return self.pipeline._read_fresh_interim(
+            self.interim_path, self.date, variables or self.variables, region_type,
+        )
+
+    def test_reuse(self):
+        pd.testing.assert_frame_equal(self._read(), self.df)
+
+    def test_different_variables(self):
+        self.assertIsNone(self._read(variables=['ta']))
+
+    def test_different_value_dtype(self):
+        self.config.value_dtype = 'float64'
+        self.assertIsNone(self._read())
+
+    def test_missing_raw_cache(self):
+        os.remove(self.sources[-1])
+        self.assertIsNone(self._read())
+
+    def test_newer_raw_cache(self):
+        interim_mtime = os.stat(self.interim_path).st_mtime
+        os.utime(self.sources[-1], (interim_mtime + 1, interim_mtime + 1))
+        self.assertIsNone(self._read())
+
+    def test_without_metadata(self):
+        self.df.to_parquet(self.interim_path, index=False)
+        self.assertIsNone(self._read())
+
+
+if __name__ == "__main__":
+    unittest.main()